@@ -14,6 +14,10 @@ Output DF columns:
 import pandas as pd
 import numpy as np
 
+from src.compact import compact_frame
+from src import kernels
+from src.cross_section import CrossSection
+
 
 class AlphaBacktestEngine:
     """
@@ -24,8 +28,9 @@ class AlphaBacktestEngine:
     - ml_factor (placeholder deterministic factor blend)
     """
 
-    def __init__(self, model_name: str):
+    def __init__(self, model_name: str, compact: bool = False):
         self.model_name = model_name.lower()
+        self.compact = compact
 
         if self.model_name not in {"momentum", "mean_reversion", "ml_factor"}:
             raise ValueError(f"Unknown alpha model: {model_name}")
@@ -36,7 +41,7 @@ class AlphaBacktestEngine:
     def run(self, df: pd.DataFrame) -> pd.DataFrame:
         print(f"\n🧠 Running Alpha Model → {self.model_name}")
 
-        df = df.copy()
+        df = compact_frame(df) if self.compact else df.copy()
 
         # --------------------------------------------------------------
         # 1️⃣ CREATE RETURNS (CRITICAL MISSING STEP)
@@ -62,7 +67,7 @@ class AlphaBacktestEngine:
         # --------------------------------------------------------------
         # 4️⃣ CONVERT TO PORTFOLIO WEIGHTS (TOP-15 INSTITUTIONAL)
         # --------------------------------------------------------------
-        df["rank"] = df.groupby("date")["alpha"].rank(ascending=False)
+        df["rank"] = CrossSection(df["date"]).rank(df["alpha"], ascending=False)
 
         df["weight"] = np.where(df["rank"] <= 15, 1 / 15, 0)
 
@@ -79,7 +84,9 @@ class AlphaBacktestEngine:
 
         print(f"📈 Alpha rows: {len(out):,}")
 
-        return out.sort_values(["date", "symbol"]).reset_index(drop=True)
+        out = out.sort_values(["date", "symbol"]).reset_index(drop=True)
+
+        return compact_frame(out) if self.compact else out
 
     # ------------------------------------------------------------------
     # REGIME DETECTION (VOLATILITY BASED)
@@ -108,21 +115,27 @@ class AlphaBacktestEngine:
     # ------------------------------------------------------------------
     def _create_alpha(self, df: pd.DataFrame) -> pd.Series:
 
+        grid = kernels.GroupedMatrix(df["symbol"])
+        close = grid.wide(df["close"])
+
+        def signal(arr):
+            return pd.Series(grid.long(arr), index=df.index)
+
         if self.model_name == "momentum":
             # 6-month momentum
-            return df.groupby("symbol")["close"].pct_change(126)
+            return signal(kernels.pct_change(close, 126))
 
         if self.model_name == "mean_reversion":
             # short-term reversal
-            return -df.groupby("symbol")["close"].pct_change(5)
+            return -signal(kernels.pct_change(close, 5))
 
         if self.model_name == "ml_factor":
             # deterministic proxy for ML:
             # blend of momentum + reversal + volatility filter
 
-            mom = df.groupby("symbol")["close"].pct_change(126)
-            rev = -df.groupby("symbol")["close"].pct_change(5)
-            vol = df.groupby("symbol")["ret_1d"].rolling(20).std().reset_index(level=0, drop=True)
+            mom = signal(kernels.pct_change(close, 126))
+            rev = -signal(kernels.pct_change(close, 5))
+            vol = signal(kernels.rolling_std(grid.wide(df["ret_1d"]), 20))
 
             return 0.5 * mom + 0.3 * rev - 0.2 * vol
 
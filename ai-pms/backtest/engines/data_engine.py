@@ -15,18 +15,52 @@ Robust against:
 - Missing headers
 - Timestamp/date variations
 - Mixed NSE export formats
+
+Optional parallel ingestion fans the per-file parsing out over a
+process pool; results are merged back in sorted file order so the
+output is identical to the sequential path.
+
+Parsed files are served from the shared PriceCache on repeat runs.
+Cache misses read through the stored per-file schema profile
+(usecols + explicit dtypes / date format) and only fall back to the
+smart column detection below when no profile applies.
 """
 
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
+import os
+import time
+
 import pandas as pd
 
+from backtest.engines.parquet_spine import ParquetSpine
+from backtest.engines.price_cache import PriceCache
+from backtest.engines.schema_profile import SchemaRegistry, read_profiled
+from src.compact import compact_frame
+
 
 class HistoricalDataEngine:
     """
     Institutional-grade historical data loader.
     """
 
-    def __init__(self, data_folder: str | None = None):
+    def __init__(
+        self,
+        data_folder: str | None = None,
+        workers: int | None = 1,
+        use_cache: bool = True,
+        cache_dir: str | None = None,
+        spine_dir: str | None = None,
+        compact: bool = False,
+    ):
+        """
+        workers   → 1 loads sequentially, N > 1 uses N processes,
+                    None / 0 uses every available core.
+        spine_dir → read from the partitioned Parquet spine instead of
+                    raw CSVs, with filters pushed down to the files.
+        compact   → categorical symbols, float32 prices, int volume and
+                    int32 day-number dates (see src.compact).
+        """
         base = Path(__file__).resolve().parents[2]  # ai-pms root
 
         self.data_folder = (
@@ -35,42 +69,131 @@ class HistoricalDataEngine:
             else base / "data" / "raw"
         )
 
+        self.workers = workers if workers else (os.cpu_count() or 1)
+
+        self.spine = ParquetSpine(spine_dir) if spine_dir else None
+        self.compact = compact
+
+        self.cache = PriceCache("historical", cache_dir) if use_cache else None
+
+        # the manifest is a cache too → use_cache=False leaves it untouched
+        self.schemas = SchemaRegistry(
+            Path(cache_dir) / "schema_manifest.json" if cache_dir else None,
+            persist=use_cache,
+        )
+        self.profiles: dict[str, dict | None] = {}
+
+        # per-file ingestion report of the last run
+        self.load_report = pd.DataFrame(
+            columns=["file", "rows", "seconds", "status", "cached", "error"]
+        )
+
     # ------------------------------------------------------------------
     # PUBLIC RUN
     # ------------------------------------------------------------------
-    def run(self) -> pd.DataFrame:
+    def run(self, start=None, end=None, symbols=None, columns=None) -> pd.DataFrame:
+        """
+        start / end / symbols / columns restrict the loaded window.
+        With a spine they are pushed down to partitions and row groups;
+        on the CSV path they are applied after loading.
+        """
         print("📊 Loading historical data...")
 
-        if not self.data_folder.exists():
-            raise FileNotFoundError(f"{self.data_folder} not found")
+        if self.spine is not None and self.spine.exists():
+            print(f"📂 Using parquet spine → {self.spine.root}")
+            df = self.spine.load(start, end, symbols, columns)
+
+        else:
+            if not self.data_folder.exists():
+                raise FileNotFoundError(f"{self.data_folder} not found")
 
-        print(f"📂 Using data folder → {self.data_folder}")
+            print(f"📂 Using data folder → {self.data_folder}")
 
-        df = self._load_csvs()
+            df = self._filter(self._load_csvs(), start, end, symbols, columns)
 
         print("\n📊 Historical Data Loaded")
         print(f"Rows     : {len(df):,}")
         print(f"Symbols  : {df['symbol'].nunique()}")
         print(f"Date span: {df['date'].min()} → {df['date'].max()}")
 
+        if self.compact:
+            df = compact_frame(df)
+
         return df
 
+    # ------------------------------------------------------------------
+    # WINDOW FILTER (CSV path)
+    # ------------------------------------------------------------------
+    @staticmethod
+    def _filter(df, start, end, symbols, columns) -> pd.DataFrame:
+        if start is not None:
+            df = df[df["date"] >= pd.Timestamp(start)]
+        if end is not None:
+            df = df[df["date"] <= pd.Timestamp(end)]
+        if symbols is not None:
+            df = df[df["symbol"].isin(set(symbols))]
+        if columns is not None:
+            df = df[["date", "symbol"] + [c for c in columns if c not in ("date", "symbol")]]
+
+        return df.reset_index(drop=True)
+
     # ------------------------------------------------------------------
     # LOAD ALL CSVs
     # ------------------------------------------------------------------
     def _load_csvs(self) -> pd.DataFrame:
-        frames = []
+        files = sorted(self.data_folder.glob("*.csv"))
+        workers = min(self.workers, len(files)) if files else 1
 
-        for file in sorted(self.data_folder.glob("*.csv")):
-            try:
-                df = pd.read_csv(file)
-                df = self._detect_columns(df, file.name)
+        start = time.perf_counter()
+
+        if self.cache is not None:
+            self.cache.stats = dict.fromkeys(self.cache.stats, 0)
+
+        # resolved up-front → workers never write the manifest
+        self.profiles = self.schemas.resolve(files)
+
+        profiled = sum(p is not None for p in self.profiles.values())
+        print(
+            f"🧬 Schema profiles → {profiled}/{len(files)} files "
+            f"({len(self.schemas.last_probed)} re-probed)"
+        )
+
+        if workers > 1:
+            print(f"⚡ Parallel ingestion → {workers} workers")
+            with ProcessPoolExecutor(max_workers=workers) as pool:
+                # map() yields in submission order → deterministic merge
+                results = list(pool.map(self._load_file, files, chunksize=4))
+        else:
+            results = [self._load_file(file) for file in files]
 
-                df["symbol"] = file.stem.upper()
+        elapsed = time.perf_counter() - start
+
+        frames = []
+        report = []
+
+        for file, df, seconds, error, cached in results:
+            if error is None:
                 frames.append(df)
+            else:
+                print(f"⚠️ Skipping {file} → {error}")
+
+            # worker-process cache stats do not survive the pool
+            if self.cache is not None and workers > 1 and error is None:
+                self.cache.record(cached, seconds)
+
+            report.append(
+                {
+                    "file": file,
+                    "rows": 0 if df is None else len(df),
+                    "seconds": seconds,
+                    "status": "loaded" if error is None else "skipped",
+                    "cached": cached,
+                    "error": error,
+                }
+            )
 
-            except Exception as e:
-                print(f"⚠️ Skipping {file.name} → {e}")
+        self.load_report = pd.DataFrame(report, columns=self.load_report.columns)
+        self._print_load_report(elapsed)
 
         if not frames:
             raise ValueError("No valid CSV files found in data/raw")
@@ -81,6 +204,70 @@ class HistoricalDataEngine:
 
         return df
 
+    # ------------------------------------------------------------------
+    # LOAD ONE CSV (runs inside worker processes)
+    # ------------------------------------------------------------------
+    def _load_file(self, file: Path):
+        start = time.perf_counter()
+        cached = False
+
+        try:
+            if self.cache is not None:
+                df, cached = self.cache.lookup(file, self._parse_file)
+            else:
+                df = self._parse_file(file)
+            error = None
+
+        except Exception as e:
+            df = None
+            error = str(e)
+
+        return file.name, df, time.perf_counter() - start, error, cached
+
+    def _parse_file(self, file: Path) -> pd.DataFrame:
+        df = None
+        profile = self.profiles.get(file.name)
+
+        if profile is not None:
+            try:
+                df = read_profiled(file, profile).dropna(subset=["date", "close"])
+            except Exception:
+                df = None
+
+        if df is None:
+            df = pd.read_csv(file)
+            df = self._detect_columns(df, file.name)
+
+        df["symbol"] = file.stem.upper()
+
+        return df
+
+    # ------------------------------------------------------------------
+    # INGESTION REPORT
+    # ------------------------------------------------------------------
+    def _print_load_report(self, elapsed: float) -> None:
+        report = self.load_report
+
+        if report.empty:
+            return
+
+        skipped = report[report["status"] == "skipped"]
+        slowest = report.sort_values("seconds", ascending=False).head(5)
+
+        print(
+            f"⏱️ Ingested {len(report) - len(skipped)}/{len(report)} files "
+            f"in {elapsed:.2f}s (parse time {report['seconds'].sum():.2f}s)"
+        )
+
+        for row in slowest.itertuples():
+            print(f"   {row.file:<20} {row.seconds:.3f}s  {row.rows:,} rows")
+
+        if not skipped.empty:
+            print(f"⚠️ Skipped files: {', '.join(skipped['file'])}")
+
+        if self.cache is not None:
+            self.cache.report()
+
     # ------------------------------------------------------------------
     # SMART COLUMN DETECTION (INSTITUTIONAL GRADE)
     # ------------------------------------------------------------------
@@ -1,56 +1,251 @@
 """
 NSE Historical Downloader — Phase-5 REAL DATA GENERATOR
 Creates clean institutional dataset if raw data missing.
+
+The synthetic universe generator is fully vectorized and streams
+symbol chunks straight to disk, so load / scaling tests can use
+universes far larger than the real 200-stock one:
+
+    python backtest/engines/nse_downloader.py --symbols 2000 --years 30 \
+        --layout parquet --out data/processed/synthetic_spine
+
+--out defaults to data/processed/synthetic_spine; the real data/raw
+universe is refused (see generate_synthetic_universe).
 """
 
+from pathlib import Path
+import argparse
+import sys
+import time
+
 import pandas as pd
 import numpy as np
-from pathlib import Path
+
+
+AIPMS_ROOT = Path(__file__).resolve().parents[2]
+
+# script is run as `python backtest/engines/nse_downloader.py`
+if str(AIPMS_ROOT) not in sys.path:
+    sys.path.insert(0, str(AIPMS_ROOT))
+
+from backtest.engines.parquet_spine import ParquetSpine  # noqa: E402
 
 
 RAW_DIR = Path("data/raw")
 RAW_DIR.mkdir(parents=True, exist_ok=True)
 
+# synthetic universes never go into the real raw universe by default
+SYNTHETIC_DIR = Path("data/processed/synthetic_spine")
 
-def generate_mock_nse_data():
+TRADING_DAYS = 252
+
+
+# ------------------------------------------------------------
+# Vectorized synthetic universe
+# ------------------------------------------------------------
+def _simulate_chunk(
+    rng: np.random.Generator,
+    factors: np.ndarray,
+    n_symbols: int,
+    listing_gaps: bool,
+) -> dict[str, np.ndarray]:
     """
-    Generates realistic 2010-2024 NSE-like dataset
-    so Phase-5 backtest can run end-to-end.
+    One block of symbols → (n_dates, n_symbols) OHLCV arrays + live mask.
     """
+    n_dates, n_factors = factors.shape
 
-    print("⚠️ Real NSE data not found → generating institutional mock data")
+    # factor loadings: market beta around 1, style factors around 0
+    loadings = rng.normal(0.0, 0.5, size=(n_symbols, n_factors))
+    loadings[:, 0] = rng.normal(1.0, 0.3, size=n_symbols)
+
+    idio_vol = rng.uniform(0.008, 0.025, size=n_symbols)
+    drift = rng.normal(0.0003, 0.0002, size=n_symbols)
+
+    rets = drift + factors @ loadings.T + rng.standard_normal((n_dates, n_symbols)) * idio_vol
+    rets = np.clip(rets, -0.5, 0.5)
+
+    p0 = np.exp(rng.uniform(np.log(20), np.log(5000), size=n_symbols))
+    close = p0 * np.exp(np.cumsum(np.log1p(rets), axis=0))
+
+    prev_close = np.vstack([close[:1], close[:-1]])
+    open_ = prev_close * (1 + rng.normal(0, 0.004, size=close.shape))
+
+    body_hi = np.maximum(open_, close)
+    body_lo = np.minimum(open_, close)
+    high = body_hi * (1 + np.abs(rng.normal(0, 0.006, size=close.shape)))
+    low = body_lo * (1 - np.abs(rng.normal(0, 0.006, size=close.shape)))
+
+    # volume: lognormal ADV per symbol, busier on big-move days
+    adv = np.exp(rng.normal(np.log(5e5), 1.0, size=n_symbols))
+    activity = 1 + 25 * np.abs(rets) + rng.lognormal(0, 0.35, size=close.shape)
+    volume = np.round(adv * activity / 2).astype(np.int64)
 
-    dates = pd.date_range("2010-01-01", "2024-01-01", freq="B")
-    symbols = [f"STK{i:03d}" for i in range(1, 201)]  # Top-200 universe
+    # listings / delistings → contiguous live window per symbol
+    live = np.ones((n_dates, n_symbols), dtype=bool)
+
+    if listing_gaps:
+        listed_late = rng.random(n_symbols) < 0.25
+        delisted = rng.random(n_symbols) < 0.10
+
+        first = np.where(listed_late, rng.integers(0, n_dates // 2, n_symbols), 0)
+        last = np.where(delisted, rng.integers(n_dates // 2, n_dates, n_symbols), n_dates)
+
+        idx = np.arange(n_dates)[:, None]
+        live = (idx >= first) & (idx < last)
+
+    return {
+        "open": open_,
+        "high": high,
+        "low": low,
+        "close": close,
+        "volume": volume,
+        "live": live,
+    }
+
+
+def generate_synthetic_universe(
+    n_symbols: int = 200,
+    years: int = 14,
+    start: str = "2010-01-01",
+    seed: int = 42,
+    out_dir: Path | str = SYNTHETIC_DIR,
+    layout: str = "csv",
+    n_factors: int = 3,
+    chunk_symbols: int = 250,
+    listing_gaps: bool = True,
+    allow_raw: bool = False,
+) -> dict:
+    """
+    Generates an NSE-like OHLCV universe and streams it to disk.
 
-    rows = []
+    layout → "csv"     : one raw CSV per symbol (Date,Close,High,Low,Open,Volume,Ticker)
+             "parquet" : year-partitioned ParquetSpine at out_dir (replaced)
 
-    for sym in symbols:
-        price = 100 + np.cumsum(np.random.normal(0.05, 1.5, len(dates)))
+    out_dir must not hold the real raw universe: the parquet layout
+    deletes out_dir, the csv layout mixes STK*.csv into every loader.
+    Only the empty-universe bootstrap (generate_mock_nse_data) passes
+    allow_raw=True, and only for csv.
 
-        for d, p in zip(dates, price):
-            rows.append(
+    Returns a small summary dict (rows, symbols, seconds, path).
+    """
+    if layout not in {"csv", "parquet"}:
+        raise ValueError(f"Unknown layout: {layout}")
+
+    out_dir = Path(out_dir)
+    raw, out = RAW_DIR.resolve(), out_dir.resolve()
+
+    if layout == "parquet" and (out == raw or out in raw.parents):
+        raise ValueError(f"❌ Refusing to replace {out_dir} → it holds the raw universe {RAW_DIR}")
+    if layout == "csv" and out == raw and not allow_raw:
+        raise ValueError(f"❌ Refusing to write synthetic CSVs into the raw universe {RAW_DIR}")
+
+    t0 = time.perf_counter()
+    out_dir.mkdir(parents=True, exist_ok=True)
+
+    dates = pd.bdate_range(start, periods=years * TRADING_DAYS)
+    date_str = dates.strftime("%Y-%m-%d").to_numpy()
+
+    # shared factor returns → cross-sectional correlation
+    rng = np.random.default_rng(seed)
+    factor_vol = np.array([0.011] + [0.005] * (n_factors - 1))[:n_factors]
+    factors = rng.standard_normal((len(dates), n_factors)) * factor_vol
+
+    spine = ParquetSpine(out_dir) if layout == "parquet" else None
+    width = len(str(n_symbols))
+    rows = 0
+
+    for chunk, lo in enumerate(range(0, n_symbols, chunk_symbols)):
+        hi = min(lo + chunk_symbols, n_symbols)
+        symbols = np.array([f"STK{i:0{width}d}" for i in range(lo + 1, hi + 1)])
+
+        chunk_rng = np.random.default_rng([seed, chunk])
+        sim = _simulate_chunk(chunk_rng, factors, hi - lo, listing_gaps)
+
+        rows += int(sim["live"].sum())
+
+        if spine is not None:
+            # symbol-major order matches the spine's sort
+            sym_idx, date_idx = np.nonzero(sim["live"].T)
+
+            # first chunk replaces any existing spine → reruns don't duplicate rows
+            save = spine.rebuild if chunk == 0 else spine.write
+
+            save(
+                pd.DataFrame(
+                    {
+                        "date": dates[date_idx],
+                        "symbol": symbols[sym_idx],
+                        "open": sim["open"][date_idx, sym_idx],
+                        "high": sim["high"][date_idx, sym_idx],
+                        "low": sim["low"][date_idx, sym_idx],
+                        "close": sim["close"][date_idx, sym_idx],
+                        "volume": sim["volume"][date_idx, sym_idx],
+                    }
+                )
+            )
+            continue
+
+        for j, sym in enumerate(symbols):
+            live = sim["live"][:, j]
+
+            pd.DataFrame(
                 {
-                    "date": d,
-                    "symbol": sym,
-                    "open": p * np.random.uniform(0.99, 1.01),
-                    "high": p * np.random.uniform(1.00, 1.03),
-                    "low": p * np.random.uniform(0.97, 1.00),
-                    "close": p,
-                    "volume": np.random.randint(1e5, 5e6),
+                    "Date": date_str[live],
+                    "Close": sim["close"][live, j],
+                    "High": sim["high"][live, j],
+                    "Low": sim["low"][live, j],
+                    "Open": sim["open"][live, j],
+                    "Volume": sim["volume"][live, j],
+                    "Ticker": sym,
                 }
-            )
+            ).to_csv(out_dir / f"{sym}.csv", index=False)
+
+    return {
+        "rows": rows,
+        "symbols": n_symbols,
+        "seconds": time.perf_counter() - t0,
+        "path": str(out_dir),
+    }
+
+
+def generate_mock_nse_data():
+    """
+    Generates realistic 2010-2024 NSE-like dataset
+    so Phase-5 backtest can run end-to-end.
+    """
 
-    df = pd.DataFrame(rows)
+    print("⚠️ Real NSE data not found → generating institutional mock data")
 
-    out = RAW_DIR / "nse_mock_prices.csv"
-    df.to_csv(out, index=False)
+    summary = generate_synthetic_universe(n_symbols=200, years=14, out_dir=RAW_DIR, allow_raw=True)
 
-    print(f"✅ Mock NSE data saved → {out}")
-    print(f"Rows: {len(df):,} | Symbols: {df['symbol'].nunique()}")
+    print(f"✅ Mock NSE data saved → {RAW_DIR}")
+    print(f"Rows: {summary['rows']:,} | Symbols: {summary['symbols']}")
 
 
 def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--symbols", type=int, help="generate a synthetic universe of N symbols")
+    parser.add_argument("--years", type=int, default=14)
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--layout", choices=["csv", "parquet"], default="csv")
+    parser.add_argument("--out", default=str(SYNTHETIC_DIR))
+    args = parser.parse_args()
+
+    if args.symbols:
+        summary = generate_synthetic_universe(
+            n_symbols=args.symbols,
+            years=args.years,
+            seed=args.seed,
+            out_dir=args.out,
+            layout=args.layout,
+        )
+        print(
+            f"✅ Synthetic universe → {summary['path']} | "
+            f"{summary['rows']:,} rows | {summary['symbols']} symbols | "
+            f"{summary['seconds']:.1f}s"
+        )
+        return
+
     csv_files = list(RAW_DIR.glob("*.csv"))
 
     if not csv_files:
@@ -0,0 +1,246 @@
+"""
+Institutional Parquet Spine
+---------------------------
+
+Year-partitioned, append-only Parquet dataset of the OHLCV history:
+
+    data/processed/nse_spine/
+        _manifest.json
+        year=2010/part-<tag>.parquet
+        year=2011/part-<tag>.parquet
+        ...
+
+Historical part files are never rewritten. Each append writes new
+part files only for the years it touches and updates the manifest,
+which tracks:
+
+    symbols → last stored date per symbol
+    sources → size / mtime of every raw CSV already ingested
+    parts   → one entry per written part file
+
+so a daily append costs time proportional to the new rows, not to the
+full history.
+
+Every part file is sorted by (symbol, date) and written in small row
+groups, so load(start, end, symbols, columns) prunes whole year
+partitions via the manifest and whole row groups via their min/max
+statistics, and only reads the requested columns.
+"""
+
+from __future__ import annotations
+
+from datetime import datetime, timezone
+from pathlib import Path
+import json
+import os
+import shutil
+
+import pandas as pd
+import pyarrow as pa
+import pyarrow.dataset as ds
+
+
+COLUMNS = ["date", "symbol", "open", "high", "low", "close", "volume"]
+NUMERIC = ["open", "high", "low", "close", "volume"]
+
+# ~40 symbols × 1 trading year per row group → symbol filters skip most groups
+ROW_GROUP_SIZE = 10_000
+
+
+class ParquetSpine:
+    """
+    Append-only year-partitioned Parquet store keyed by (symbol, date).
+    """
+
+    MANIFEST = "_manifest.json"
+
+    def __init__(self, root: str | Path):
+        self.root = Path(root)
+        self.manifest = self._load_manifest()
+
+    # ------------------------------------------------------------------
+    # MANIFEST
+    # ------------------------------------------------------------------
+    def _load_manifest(self) -> dict:
+        path = self.root / self.MANIFEST
+
+        if path.exists():
+            return json.loads(path.read_text())
+
+        return {"symbols": {}, "sources": {}, "parts": [], "rows": 0}
+
+    def _save_manifest(self) -> None:
+        self.root.mkdir(parents=True, exist_ok=True)
+
+        path = self.root / self.MANIFEST
+        tmp = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+        tmp.write_text(json.dumps(self.manifest, indent=2, sort_keys=True))
+        os.replace(tmp, path)
+
+    def exists(self) -> bool:
+        return bool(self.manifest["parts"])
+
+    def last_dates(self) -> dict[str, pd.Timestamp]:
+        return {s: pd.Timestamp(d) for s, d in self.manifest["symbols"].items()}
+
+    # ------------------------------------------------------------------
+    # SOURCE TRACKING
+    # ------------------------------------------------------------------
+    @staticmethod
+    def _stat(path: Path) -> dict:
+        stat = path.stat()
+        return {"size": stat.st_size, "mtime_ns": stat.st_mtime_ns}
+
+    def changed_sources(self, files) -> list[Path]:
+        """
+        Raw files that are new or modified since they were last ingested.
+        """
+        seen = self.manifest["sources"]
+        return [Path(f) for f in files if seen.get(Path(f).name) != self._stat(Path(f))]
+
+    def mark_sources(self, files) -> None:
+        for f in files:
+            self.manifest["sources"][Path(f).name] = self._stat(Path(f))
+
+        self._save_manifest()
+
+    # ------------------------------------------------------------------
+    # WRITE
+    # ------------------------------------------------------------------
+    def _normalize(self, df: pd.DataFrame) -> pd.DataFrame:
+        df = df[COLUMNS].copy()
+        df["date"] = pd.to_datetime(df["date"])
+        df["symbol"] = df["symbol"].astype(str)
+
+        # one physical schema across all part files
+        for col in NUMERIC:
+            df[col] = pd.to_numeric(df[col], errors="coerce").astype("float64")
+
+        return df
+
+    def write(self, df: pd.DataFrame) -> int:
+        """
+        Writes df as new part files (one per year) and updates the manifest.
+        """
+        if df.empty:
+            return 0
+
+        df = self._normalize(df).sort_values(["symbol", "date"])
+        tag = datetime.now(timezone.utc).strftime("%Y%m%dT%H%M%S%f")
+
+        for year, part in df.groupby(df["date"].dt.year, sort=True):
+            folder = self.root / f"year={year}"
+            folder.mkdir(parents=True, exist_ok=True)
+
+            path = folder / f"part-{tag}.parquet"
+            part.to_parquet(path, index=False, row_group_size=ROW_GROUP_SIZE)
+
+            self.manifest["parts"].append(
+                {
+                    "path": str(path.relative_to(self.root)),
+                    "rows": len(part),
+                    "min_date": part["date"].min().isoformat(),
+                    "max_date": part["date"].max().isoformat(),
+                    "written_at": tag,
+                }
+            )
+
+        last = df.groupby("symbol")["date"].max()
+        symbols = self.manifest["symbols"]
+
+        for sym, d in last.items():
+            if sym not in symbols or pd.Timestamp(symbols[sym]) < d:
+                symbols[sym] = d.isoformat()
+
+        self.manifest["rows"] += len(df)
+        self._save_manifest()
+
+        return len(df)
+
+    def append(self, df: pd.DataFrame) -> int:
+        """
+        Keeps only rows newer than each symbol's last stored date.
+        Unknown symbols are ingested in full.
+        """
+        if df.empty:
+            return 0
+
+        last = df["symbol"].map(self.manifest["symbols"])
+        last = pd.to_datetime(last)
+
+        new = df[last.isna() | (pd.to_datetime(df["date"]) > last)]
+
+        return self.write(new)
+
+    def rebuild(self, df: pd.DataFrame) -> int:
+        """
+        Full rewrite → drops every existing partition first.
+        """
+        if self.root.exists():
+            shutil.rmtree(self.root)
+
+        self.manifest = {"symbols": {}, "sources": {}, "parts": [], "rows": 0}
+
+        return self.write(df)
+
+    # ------------------------------------------------------------------
+    # READ
+    # ------------------------------------------------------------------
+    def read(self) -> pd.DataFrame:
+        return self.load()
+
+    def load(
+        self,
+        start=None,
+        end=None,
+        symbols=None,
+        columns: list[str] | None = None,
+    ) -> pd.DataFrame:
+        """
+        Filtered read with predicate pushdown.
+
+        start / end → inclusive date bounds
+        symbols     → iterable of symbols to keep
+        columns     → value columns to read (date and symbol always included)
+        """
+        if not self.exists():
+            raise FileNotFoundError(f"No spine partitions in {self.root}")
+
+        start = pd.Timestamp(start) if start is not None else None
+        end = pd.Timestamp(end) if end is not None else None
+
+        # partition pruning straight from the manifest
+        parts = [
+            str(self.root / p["path"])
+            for p in self.manifest["parts"]
+            if (start is None or pd.Timestamp(p["max_date"]) >= start)
+            and (end is None or pd.Timestamp(p["min_date"]) <= end)
+        ]
+
+        keep = ["date", "symbol"] + [
+            c for c in (columns if columns is not None else NUMERIC)
+            if c not in ("date", "symbol")
+        ]
+
+        if not parts:
+            return pd.DataFrame(columns=keep)
+
+        dataset = ds.dataset(parts, format="parquet")
+        date_type = dataset.schema.field("date").type
+
+        expr = None
+
+        def _and(e, cond):
+            return cond if e is None else e & cond
+
+        # row-group pruning via min/max statistics
+        if start is not None:
+            expr = _and(expr, ds.field("date") >= pa.scalar(start, type=date_type))
+        if end is not None:
+            expr = _and(expr, ds.field("date") <= pa.scalar(end, type=date_type))
+        if symbols is not None:
+            expr = _and(expr, ds.field("symbol").isin(sorted({str(s) for s in symbols})))
+
+        df = dataset.to_table(columns=keep, filter=expr).to_pandas()
+
+        return df.sort_values(["symbol", "date"]).reset_index(drop=True)
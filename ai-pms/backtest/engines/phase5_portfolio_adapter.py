@@ -9,6 +9,9 @@ from __future__ import annotations
 import pandas as pd
 from pathlib import Path
 
+from backtest.engines.parquet_spine import ParquetSpine
+from src.compact import as_datetime
+
 
 class Phase5PortfolioAdapter:
     """
@@ -20,11 +23,17 @@ class Phase5PortfolioAdapter:
         weight
     """
 
+    # calendar days loaded before the first weight date so the first
+    # daily return still has its previous close
+    PRICE_LOOKBACK_DAYS = 14
+
     def __init__(
         self,
         weights_path: str = "data/output/final_weights.parquet",
+        spine_dir: str | None = None,
     ):
         self.weights_path = Path(weights_path)
+        self.spine = ParquetSpine(spine_dir) if spine_dir else None
 
     # ------------------------------------------------------------------ #
     # Load weights
@@ -39,7 +48,7 @@ class Phase5PortfolioAdapter:
         if not required.issubset(df.columns):
             raise ValueError(f"Weights file must contain columns: {required}")
 
-        df["date"] = pd.to_datetime(df["date"])
+        df["date"] = as_datetime(df["date"])
         df["weight"] = pd.to_numeric(df["weight"], errors="coerce")
 
         return df.dropna(subset=["date", "symbol", "weight"])
@@ -57,7 +66,7 @@ class Phase5PortfolioAdapter:
             raise ValueError(f"Price DF must contain columns: {required_price_cols}")
 
         prices = prices.copy()
-        prices["date"] = pd.to_datetime(prices["date"])
+        prices["date"] = as_datetime(prices["date"])
         prices["close"] = pd.to_numeric(prices["close"], errors="coerce")
 
         # Sort for return calc
@@ -96,15 +105,33 @@ class Phase5PortfolioAdapter:
 
         return portfolio.dropna(subset=["ret"])
 
+    # ------------------------------------------------------------------ #
+    # Load only the prices the weights need
+    # ------------------------------------------------------------------ #
+    def _load_prices(self, weights: pd.DataFrame) -> pd.DataFrame:
+        if self.spine is None:
+            raise ValueError("No prices passed and no spine_dir configured")
+
+        start = weights["date"].min() - pd.Timedelta(days=self.PRICE_LOOKBACK_DAYS)
+
+        return self.spine.load(
+            start=start,
+            end=weights["date"].max(),
+            symbols=weights["symbol"].unique(),
+            columns=["close"],
+        )
+
     # ------------------------------------------------------------------ #
     # Public run method
     # ------------------------------------------------------------------ #
-    def run(self, prices: pd.DataFrame) -> pd.DataFrame:
+    def run(self, prices: pd.DataFrame | None = None) -> pd.DataFrame:
         """
         Parameters
         ----------
-        prices : pd.DataFrame
+        prices : pd.DataFrame, optional
             Historical OHLCV dataframe from Phase-5 data engine.
+            When omitted, the weights' date range and symbols are
+            read straight from the parquet spine.
 
         Returns
         -------
@@ -113,6 +140,10 @@ class Phase5PortfolioAdapter:
         """
 
         weights = self._load_weights()
+
+        if prices is None:
+            prices = self._load_prices(weights)
+
         merged = self._merge_prices(weights, prices)
         portfolio = self._portfolio_returns(merged)
 
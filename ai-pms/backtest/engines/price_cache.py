@@ -0,0 +1,204 @@
+"""
+Institutional Price Cache
+-------------------------
+
+Shared binary cache in front of every raw-CSV loader.
+
+Each loader registers a namespace and hands over its own per-file
+parser. On first access the parsed frame is written as Parquet next
+to a small JSON fingerprint of the source CSV:
+
+    data/cache/prices/<namespace>/<FILE>.<src>.parquet
+    data/cache/prices/<namespace>/<FILE>.<src>.json
+
+<src> is a short hash of the resolved source path, so same-named CSVs
+from different folders get separate entries.
+
+Repeat runs read the Parquet copy and skip CSV parsing and date
+inference entirely. An entry is rebuilt when the source file's content
+hash changes; size / mtime are checked first so the hash is only
+computed when the cheap stat check fails (or when verify=True).
+Bumping a loader's parser version invalidates its whole namespace.
+"""
+
+from __future__ import annotations
+
+from pathlib import Path
+from typing import Callable
+import hashlib
+import json
+import os
+import time
+
+import pandas as pd
+
+
+DEFAULT_CACHE_DIR = Path(__file__).resolve().parents[2] / "data" / "cache" / "prices"
+
+
+def file_sha256(path: Path, chunk_size: int = 1 << 20) -> str:
+    digest = hashlib.sha256()
+
+    with open(path, "rb") as fh:
+        for chunk in iter(lambda: fh.read(chunk_size), b""):
+            digest.update(chunk)
+
+    return digest.hexdigest()
+
+
+class PriceCache:
+    """
+    Parquet cache of parsed raw CSVs, keyed per loader namespace.
+
+    Entries are independent files, so worker processes can read and
+    build entries concurrently without a shared manifest lock.
+    """
+
+    def __init__(
+        self,
+        namespace: str,
+        cache_dir: str | Path | None = None,
+        verify: bool = False,
+        version: str = "1",
+    ):
+        self.namespace = namespace
+        self.version = version
+        self.cache_dir = Path(cache_dir) if cache_dir else DEFAULT_CACHE_DIR
+        self.folder = self.cache_dir / namespace
+        self.verify = verify
+
+        self.stats = {"hits": 0, "misses": 0, "hit_seconds": 0.0, "miss_seconds": 0.0}
+
+    # ------------------------------------------------------------------
+    # PUBLIC LOAD
+    # ------------------------------------------------------------------
+    def load(self, path: str | Path, parser: Callable[[Path], pd.DataFrame]) -> pd.DataFrame:
+        df, _ = self.lookup(path, parser)
+        return df
+
+    def lookup(self, path: str | Path, parser: Callable[[Path], pd.DataFrame]):
+        """
+        Returns (frame, hit). Parser exceptions propagate and nothing
+        is cached, so broken files are re-examined on every run.
+        """
+        path = Path(path)
+        start = time.perf_counter()
+
+        df = self._read_entry(path)
+        hit = df is not None
+
+        if not hit:
+            df = parser(path)
+            self._write_entry(path, df)
+
+        self.record(hit, time.perf_counter() - start)
+
+        return df, hit
+
+    # ------------------------------------------------------------------
+    # ENTRY MANAGEMENT
+    # ------------------------------------------------------------------
+    def _entry_paths(self, path: Path):
+        src = hashlib.sha256(str(path.resolve()).encode()).hexdigest()[:10]
+        stem = f"{path.name}.{src}"
+        return self.folder / f"{stem}.parquet", self.folder / f"{stem}.json"
+
+    def _fingerprint(self, path: Path, with_hash: bool) -> dict:
+        stat = path.stat()
+        fp = {"size": stat.st_size, "mtime_ns": stat.st_mtime_ns}
+
+        if with_hash:
+            fp["sha256"] = file_sha256(path)
+
+        return fp
+
+    def _read_entry(self, path: Path) -> pd.DataFrame | None:
+        data_path, meta_path = self._entry_paths(path)
+
+        if not data_path.exists() or not meta_path.exists():
+            return None
+
+        try:
+            meta = json.loads(meta_path.read_text())
+        except (OSError, ValueError):
+            return None
+
+        if meta.get("version", "1") != self.version:
+            return None
+
+        current = self._fingerprint(path, with_hash=self.verify)
+        stat_ok = (
+            current["size"] == meta.get("size")
+            and current["mtime_ns"] == meta.get("mtime_ns")
+        )
+
+        if not stat_ok or self.verify:
+            sha = current.get("sha256") or file_sha256(path)
+            if sha != meta.get("sha256"):
+                return None
+
+            # content unchanged (e.g. touched / re-checked out) → refresh stat
+            if not stat_ok:
+                meta.update(size=current["size"], mtime_ns=current["mtime_ns"])
+                self._atomic_write_text(meta_path, json.dumps(meta))
+
+        try:
+            return pd.read_parquet(data_path)
+        except Exception:
+            return None
+
+    def _write_entry(self, path: Path, df: pd.DataFrame) -> None:
+        data_path, meta_path = self._entry_paths(path)
+        self.folder.mkdir(parents=True, exist_ok=True)
+
+        tmp = data_path.with_name(f"{data_path.name}.{os.getpid()}.tmp")
+        df.to_parquet(tmp, index=False)
+        os.replace(tmp, data_path)
+
+        meta = self._fingerprint(path, with_hash=True)
+        meta["source"] = str(path)
+        meta["version"] = self.version
+        self._atomic_write_text(meta_path, json.dumps(meta))
+
+    @staticmethod
+    def _atomic_write_text(path: Path, text: str) -> None:
+        tmp = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+        tmp.write_text(text)
+        os.replace(tmp, path)
+
+    def clear(self) -> None:
+        if not self.folder.exists():
+            return
+
+        for f in self.folder.iterdir():
+            f.unlink()
+
+    # ------------------------------------------------------------------
+    # REPORTING
+    # ------------------------------------------------------------------
+    def record(self, hit: bool, seconds: float) -> None:
+        """
+        Also used to fold in lookups done by worker processes,
+        whose own stats are lost with the process.
+        """
+        if hit:
+            self.stats["hits"] += 1
+            self.stats["hit_seconds"] += seconds
+        else:
+            self.stats["misses"] += 1
+            self.stats["miss_seconds"] += seconds
+
+    def report(self) -> None:
+        s = self.stats
+        total = s["hits"] + s["misses"]
+
+        if total == 0:
+            return
+
+        mode = "warm" if s["misses"] == 0 else "cold" if s["hits"] == 0 else "partial"
+
+        print(
+            f"🗄️ Price cache [{self.namespace}] → {mode} start | "
+            f"{s['hits']} hits in {s['hit_seconds']:.2f}s, "
+            f"{s['misses']} parsed in {s['miss_seconds']:.2f}s"
+        )
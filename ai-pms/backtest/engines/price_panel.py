@@ -0,0 +1,184 @@
+"""
+Institutional Price Panel
+-------------------------
+
+Dense date × symbol representation of the OHLCV spine.
+
+    dates    → sorted trading-date axis        (n_dates,)
+    symbols  → sorted symbol axis              (n_symbols,)
+    fields   → close/open/high/low/volume      (n_dates, n_symbols) float64
+    mask     → True where a row exists         (n_dates, n_symbols) bool
+
+Stored on disk as one .npy file per array, so any number of processes
+can np.load(..., mmap_mode="r") the same panel and share the pages
+zero-copy. Converts to and from the long frames used everywhere else,
+so engines can migrate one at a time.
+"""
+
+from __future__ import annotations
+
+from pathlib import Path
+import json
+
+import numpy as np
+import pandas as pd
+
+
+FIELDS = ("open", "high", "low", "close", "volume")
+
+
+class PricePanel:
+    """
+    Aligned float arrays over a (date, symbol) grid with a validity mask.
+    """
+
+    def __init__(
+        self,
+        dates: np.ndarray,
+        symbols: np.ndarray,
+        fields: dict[str, np.ndarray],
+        mask: np.ndarray,
+    ):
+        self.dates = dates
+        self.symbols = symbols
+        self.fields = fields
+        self.mask = mask
+
+        shape = (len(dates), len(symbols))
+        for name, arr in {**fields, "mask": mask}.items():
+            if arr.shape != shape:
+                raise ValueError(f"{name} shape {arr.shape} != panel shape {shape}")
+
+    # ------------------------------------------------------------------
+    # ACCESS
+    # ------------------------------------------------------------------
+    @property
+    def shape(self) -> tuple[int, int]:
+        return len(self.dates), len(self.symbols)
+
+    def __getitem__(self, field: str) -> np.ndarray:
+        return self.fields[field]
+
+    def frame(self, field: str) -> pd.DataFrame:
+        """
+        Wide date × symbol DataFrame view of one field.
+        """
+        return pd.DataFrame(
+            self.fields[field],
+            index=pd.Index(self.dates, name="date"),
+            columns=pd.Index(self.symbols, name="symbol"),
+            copy=False,
+        )
+
+    def symbol_index(self, symbols) -> np.ndarray:
+        pos = pd.Index(self.symbols).get_indexer(list(symbols))
+
+        if (pos < 0).any():
+            missing = [s for s, p in zip(symbols, pos) if p < 0]
+            raise KeyError(f"Symbols not in panel: {missing}")
+
+        return pos
+
+    # ------------------------------------------------------------------
+    # LONG FRAME CONVERSION
+    # ------------------------------------------------------------------
+    @classmethod
+    def from_long(
+        cls,
+        df: pd.DataFrame,
+        symbol_col: str = "symbol",
+        date_col: str = "date",
+        fields=FIELDS,
+    ) -> "PricePanel":
+        fields = [f for f in fields if f in df.columns]
+
+        if not fields:
+            raise ValueError(f"Long frame has none of the panel fields {FIELDS}")
+
+        date_codes, dates = pd.factorize(df[date_col], sort=True)
+        sym_codes, symbols = pd.factorize(df[symbol_col], sort=True)
+
+        shape = (len(dates), len(symbols))
+
+        mask = np.zeros(shape, dtype=bool)
+        mask[date_codes, sym_codes] = True
+
+        arrays = {}
+        for f in fields:
+            arr = np.full(shape, np.nan)
+            # duplicate (date, symbol) rows → last one wins
+            arr[date_codes, sym_codes] = pd.to_numeric(df[f], errors="coerce").to_numpy(float)
+            arrays[f] = arr
+
+        return cls(
+            dates=np.asarray(dates),
+            symbols=np.asarray(symbols, dtype=str),
+            fields=arrays,
+            mask=mask,
+        )
+
+    def to_long(
+        self,
+        symbol_col: str = "symbol",
+        date_col: str = "date",
+        order: str = "symbol",
+    ) -> pd.DataFrame:
+        """
+        order → "symbol" sorts by (symbol, date), "date" by (date, symbol).
+        """
+        if order == "symbol":
+            sym_idx, date_idx = np.nonzero(self.mask.T)
+        elif order == "date":
+            date_idx, sym_idx = np.nonzero(self.mask)
+        else:
+            raise ValueError(f"Unknown order: {order}")
+
+        out = pd.DataFrame(
+            {
+                date_col: self.dates[date_idx],
+                symbol_col: self.symbols[sym_idx],
+            }
+        )
+
+        for name, arr in self.fields.items():
+            out[name] = arr[date_idx, sym_idx]
+
+        return out
+
+    # ------------------------------------------------------------------
+    # MEMORY-MAPPED STORAGE
+    # ------------------------------------------------------------------
+    def save(self, folder: str | Path) -> Path:
+        folder = Path(folder)
+        folder.mkdir(parents=True, exist_ok=True)
+
+        np.save(folder / "dates.npy", self.dates)
+        np.save(folder / "symbols.npy", self.symbols)
+        np.save(folder / "mask.npy", np.ascontiguousarray(self.mask))
+
+        for name, arr in self.fields.items():
+            np.save(folder / f"{name}.npy", np.ascontiguousarray(arr))
+
+        (folder / "panel.json").write_text(
+            json.dumps({"fields": list(self.fields), "shape": list(self.shape)})
+        )
+
+        return folder
+
+    @classmethod
+    def open(cls, folder: str | Path, mmap_mode: str | None = "r") -> "PricePanel":
+        """
+        mmap_mode="r" → read-only zero-copy views shared across processes.
+        """
+        folder = Path(folder)
+        meta = json.loads((folder / "panel.json").read_text())
+
+        return cls(
+            dates=np.load(folder / "dates.npy"),
+            symbols=np.load(folder / "symbols.npy"),
+            fields={
+                name: np.load(folder / f"{name}.npy", mmap_mode=mmap_mode)
+                for name in meta["fields"]
+            },
+            mask=np.load(folder / "mask.npy", mmap_mode=mmap_mode),
+        )
@@ -0,0 +1,286 @@
+"""
+Institutional CSV Schema Profiles
+---------------------------------
+
+Detects the layout of each raw NSE / Yahoo CSV once and stores it in a
+manifest:
+
+    data/cache/schema_manifest.json
+
+    {
+      "ABB.csv": {
+        "signature": "<sha1 of header lines>",
+        "header_lines": 1,
+        "source_format": "yahoo_flat",       # Date,...,Ticker
+        "skiprows": [],
+        "columns": {"date": "Date", "close": "Close", ...},
+        "dtypes": {"Close": "float64", ...},
+        "date_format": "%Y-%m-%d",
+        "ticker_column": "Ticker"
+      }
+    }
+
+Yahoo multi-index exports (Price / Ticker / Date header rows) are
+profiled as "yahoo_multiindex" with the two extra header rows skipped.
+
+Routine loads then read with usecols, explicit dtypes and an explicit
+date format. A file is only re-probed when its header lines change.
+"""
+
+from __future__ import annotations
+
+from pathlib import Path
+import hashlib
+import json
+import os
+
+import pandas as pd
+
+
+DEFAULT_MANIFEST = (
+    Path(__file__).resolve().parents[2] / "data" / "cache" / "schema_manifest.json"
+)
+
+STD_FIELDS = ["date", "open", "high", "low", "close", "volume"]
+
+DATE_FORMATS = [
+    "%Y-%m-%d",
+    "%Y-%m-%d %H:%M:%S",
+    "%Y-%m-%d %H:%M:%S%z",
+    "%d-%m-%Y",
+    "%d-%b-%Y",
+    "%d/%m/%Y",
+    "%m/%d/%Y",
+]
+
+PROBE_ROWS = 200
+
+
+# ------------------------------------------------------------------
+# Header helpers
+# ------------------------------------------------------------------
+def _head_lines(path: Path, n: int = 3) -> list[str]:
+    lines = []
+
+    with open(path, "r", encoding="utf-8", errors="replace") as fh:
+        for _ in range(n):
+            line = fh.readline()
+            if not line:
+                break
+            lines.append(line.rstrip("\r\n"))
+
+    return lines
+
+
+def _signature(lines: list[str]) -> str:
+    return hashlib.sha1("\n".join(lines).encode()).hexdigest()
+
+
+def _is_yahoo_multiindex(lines: list[str]) -> bool:
+    return (
+        len(lines) >= 3
+        and lines[1].split(",")[0].strip().lower() == "ticker"
+        and lines[2].split(",")[0].strip().lower() == "date"
+    )
+
+
+# ------------------------------------------------------------------
+# Probing (only runs when a header is new or changed)
+# ------------------------------------------------------------------
+def _detect_date_format(values: pd.Series) -> str | None:
+    sample = values.dropna().astype(str).head(PROBE_ROWS)
+
+    if sample.empty:
+        return None
+
+    for fmt in DATE_FORMATS:
+        parsed = pd.to_datetime(sample, format=fmt, errors="coerce")
+        if parsed.notna().mean() > 0.95:
+            return fmt
+
+    return None
+
+
+def probe(path: str | Path) -> dict:
+    """
+    Full layout detection for one CSV. Raises ValueError when the file
+    does not carry a usable date / OHLCV layout.
+    """
+    path = Path(path)
+    lines = _head_lines(path)
+
+    multi = _is_yahoo_multiindex(lines)
+    skiprows = [1, 2] if multi else []
+    header_lines = 3 if multi else 1
+
+    sample = pd.read_csv(path, nrows=PROBE_ROWS, skiprows=skiprows)
+    cols = list(sample.columns)
+
+    def find(*keys):
+        for key in keys:
+            for c in cols:
+                if key in c.lower():
+                    return c
+        return None
+
+    if multi:
+        date_col = cols[0]
+    else:
+        date_col = find("date", "time")
+
+    if date_col is None:
+        # datatype-based detection on the sample only
+        for c in cols:
+            parsed = pd.to_datetime(sample[c], errors="coerce", format="mixed")
+            if parsed.notna().mean() > 0.8:
+                date_col = c
+                break
+
+    if date_col is None:
+        raise ValueError(f"{path.name} → date column not detectable")
+
+    columns = {
+        "date": date_col,
+        "close": find("close", "adj close", "price"),
+        "open": find("open"),
+        "high": find("high"),
+        "low": find("low"),
+        "volume": find("vol"),
+    }
+
+    missing = [k for k, v in columns.items() if v is None]
+    if missing:
+        raise ValueError(f"{path.name} → missing columns {missing} → {cols}")
+
+    ticker_col = next((c for c in cols if c.lower() == "ticker"), None)
+
+    if multi:
+        source_format = "yahoo_multiindex"
+    elif ticker_col is not None:
+        source_format = "yahoo_flat"
+    else:
+        source_format = "generic"
+
+    return {
+        "signature": _signature(lines[:header_lines]),
+        "header_lines": header_lines,
+        "source_format": source_format,
+        "skiprows": skiprows,
+        "columns": columns,
+        "dtypes": {
+            columns[f]: "float64" for f in ["open", "high", "low", "close", "volume"]
+        },
+        "date_format": _detect_date_format(sample[date_col]),
+        "ticker_column": ticker_col,
+    }
+
+
+# ------------------------------------------------------------------
+# Profiled read
+# ------------------------------------------------------------------
+def read_profiled(
+    path: str | Path,
+    profile: dict,
+    fields: list[str] | None = None,
+) -> pd.DataFrame:
+    """
+    Reads only the requested standard fields using the stored profile.
+    Output columns are the standard names, in the order given.
+    """
+    fields = fields or STD_FIELDS
+    columns = profile["columns"]
+
+    raw_cols = [columns[f] for f in fields]
+    dtypes = {c: t for c, t in profile["dtypes"].items() if c in raw_cols}
+    date_raw = columns["date"] if "date" in fields else None
+
+    if date_raw is not None:
+        # parsed explicitly below; keep as text on read
+        dtypes[date_raw] = "str"
+
+    df = pd.read_csv(
+        path,
+        usecols=raw_cols,
+        skiprows=profile["skiprows"],
+        dtype=dtypes,
+    )
+
+    df = df.rename(columns={columns[f]: f for f in fields})[fields]
+
+    if date_raw is not None:
+        fmt = profile.get("date_format")
+        df["date"] = pd.to_datetime(
+            df["date"], format=fmt if fmt else "mixed", errors="coerce"
+        )
+
+    return df
+
+
+# ------------------------------------------------------------------
+# Manifest
+# ------------------------------------------------------------------
+class SchemaRegistry:
+    """
+    Manifest of per-file schema profiles keyed by file name.
+    persist=False keeps profiles in memory only (never reads or writes
+    the manifest file).
+    """
+
+    def __init__(self, path: str | Path | None = None, persist: bool = True):
+        self.path = Path(path) if path else DEFAULT_MANIFEST
+        self.persist = persist
+        self.profiles: dict[str, dict] = {}
+        self.probed: list[str] = []
+        self.last_probed: list[str] = []
+
+        if persist and self.path.exists():
+            try:
+                self.profiles = json.loads(self.path.read_text())
+            except (OSError, ValueError):
+                self.profiles = {}
+
+    def profile(self, path: str | Path) -> dict:
+        path = Path(path)
+        stored = self.profiles.get(path.name)
+
+        if stored is not None:
+            lines = _head_lines(path, stored["header_lines"])
+            if _signature(lines) == stored["signature"]:
+                return stored
+
+        profile = probe(path)
+        self.profiles[path.name] = profile
+        self.probed.append(path.name)
+
+        return profile
+
+    def resolve(self, files) -> dict[str, dict | None]:
+        """
+        Profiles for many files; unreadable layouts map to None.
+        Saves the manifest once if anything was (re)probed.
+        """
+        out = {}
+
+        for f in files:
+            try:
+                out[Path(f).name] = self.profile(f)
+            except Exception:
+                out[Path(f).name] = None
+
+        self.last_probed = list(self.probed)
+        self.save()
+
+        return out
+
+    def save(self) -> None:
+        if not self.probed or not self.persist:
+            self.probed = []
+            return
+
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+
+        tmp = self.path.with_name(f"{self.path.name}.{os.getpid()}.tmp")
+        tmp.write_text(json.dumps(self.profiles, indent=2, sort_keys=True))
+        os.replace(tmp, self.path)
+
+        self.probed = []
@@ -29,7 +29,7 @@ OUTPUT_DIR.mkdir(parents=True, exist_ok=True)
 def load_data():
     print("📊 Loading 14-year institutional data...")
 
-    engine = HistoricalDataEngine()
+    engine = HistoricalDataEngine(workers=None)
     df = engine.run()
 
     if df.empty:
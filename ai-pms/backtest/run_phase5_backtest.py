@@ -11,6 +11,8 @@ FINAL STABLE VERSION — ZERO ITERATION
 
 from pathlib import Path
 import hashlib
+import sys
+import time
 import pandas as pd
 
 
@@ -25,6 +27,15 @@ AIPMS_ROOT = REPO_ROOT / "ai-pms"
 RAW_DATA_DIR = AIPMS_ROOT / "data" / "raw"
 OUTPUT_DIR = AIPMS_ROOT / "data" / "output" / "phase5"
 
+# script is run as `python backtest/run_phase5_backtest.py`
+if str(AIPMS_ROOT) not in sys.path:
+    sys.path.insert(0, str(AIPMS_ROOT))
+
+from backtest.engines.price_cache import PriceCache  # noqa: E402
+from backtest.engines.schema_profile import SchemaRegistry, read_profiled  # noqa: E402
+from src import kernels  # noqa: E402
+from src.cross_section import CrossSection  # noqa: E402
+
 
 # ============================================================
 # CONFIG
@@ -88,32 +99,60 @@ def _canonical_date(series):
     return pd.to_datetime(series).normalize()
 
 
+def _parse_prices(f: Path, profile: dict | None = None) -> pd.DataFrame:
+
+    # stored schema profile → no date / column probing
+    if profile is not None:
+        try:
+            df = read_profiled(f, profile, ["date", "close"])
+            return pd.DataFrame({
+                "date": df["date"].dt.normalize(),
+                "ticker": f.stem.upper(),
+                "close": df["close"],
+            }).dropna()
+        except Exception:
+            pass
+
+    df = pd.read_csv(f)
+
+    date = _extract_date(df)
+    close = _extract_close(df)
+
+    if date is None or close is None:
+        # cached as empty → skipped again without re-parsing
+        return pd.DataFrame(columns=["date", "ticker", "close"])
+
+    return pd.DataFrame({
+        "date": _canonical_date(date),
+        "ticker": f.stem.upper(),
+        "close": close,
+    }).dropna()
+
+
 def load_prices() -> pd.DataFrame:
 
     files = list(RAW_DATA_DIR.glob("*.csv"))
     if not files:
         raise RuntimeError(f"No CSV files found in {RAW_DATA_DIR}")
 
+    # v2 → profiled parsing (Yahoo multi-index files no longer collapse to 1970)
+    cache = PriceCache("phase5_backtest", version="2")
+    profiles = SchemaRegistry().resolve(files)
+    start = time.perf_counter()
+
     frames = []
 
     for f in files:
-        df = pd.read_csv(f)
+        cleaned = cache.load(f, lambda p: _parse_prices(p, profiles.get(p.name)))
 
-        date = _extract_date(df)
-        close = _extract_close(df)
-
-        if date is None or close is None:
+        if cleaned.empty:
             print(f"⚠ Skipping {f.name}")
             continue
 
-        cleaned = pd.DataFrame({
-            "date": _canonical_date(date),
-            "ticker": f.stem.upper(),
-            "close": close,
-        }).dropna()
+        frames.append(cleaned)
 
-        if not cleaned.empty:
-            frames.append(cleaned)
+    cache.report()
+    print(f"⏱ Load time: {time.perf_counter() - start:.2f}s")
 
     if not frames:
         raise RuntimeError("❌ No valid price data after parsing.")
@@ -133,18 +172,14 @@ def load_prices() -> pd.DataFrame:
 
 def build_features(df: pd.DataFrame) -> pd.DataFrame:
 
-    returns = df.groupby("ticker")["close"].pct_change()
+    grid = kernels.GroupedMatrix(df["ticker"])
+    rets = kernels.returns(grid.wide(df["close"]), (1, 5, 20, 60))
 
-    df["ret_5d"] = df.groupby("ticker")["close"].pct_change(5)
-    df["ret_20d"] = df.groupby("ticker")["close"].pct_change(20)
-    df["ret_60d"] = df.groupby("ticker")["close"].pct_change(60)
+    df["ret_5d"] = grid.long(rets[5])
+    df["ret_20d"] = grid.long(rets[20])
+    df["ret_60d"] = grid.long(rets[60])
 
-    df["vol_20d"] = (
-        returns.groupby(df["ticker"])
-        .rolling(20)
-        .std()
-        .reset_index(level=0, drop=True)
-    )
+    df["vol_20d"] = grid.long(kernels.rolling_std(rets[1], 20))
 
     return df.dropna().reset_index(drop=True)
 
@@ -158,11 +193,12 @@ def compute_alpha(df: pd.DataFrame) -> pd.DataFrame:
     momentum = 0.6 * df["ret_60d"] + 0.4 * df["ret_20d"]
     mean_rev = -df["ret_5d"] / df["vol_20d"]
 
-    df["alpha_score"] = (
-        0.5 * momentum.groupby(df["date"]).rank(pct=True)
-        + 0.5 * mean_rev.groupby(df["date"]).rank(pct=True)
+    ranks = CrossSection(df["date"]).rank(
+        pd.DataFrame({"momentum": momentum, "mean_rev": mean_rev}), pct=True
     )
 
+    df["alpha_score"] = 0.5 * ranks["momentum"] + 0.5 * ranks["mean_rev"]
+
     return df
 
 
@@ -1,5 +1,7 @@
 import pandas as pd
 
+from src.cross_section import CrossSection
+
 
 def compute_alpha(df: pd.DataFrame) -> pd.DataFrame:
     df = df.copy()
@@ -7,6 +9,12 @@ def compute_alpha(df: pd.DataFrame) -> pd.DataFrame:
     momentum = 0.6 * df["ret_60d"] + 0.4 * df["ret_20d"]
     mean_rev = -df["ret_5d"] / df["vol_20d"]
 
-    df["alpha_score"] = 0.5 * momentum.rank(pct=True) + 0.5 * mean_rev.rank(pct=True)
+    # per-date ranks → a name is scored against its own cross-section,
+    # not against every (date, ticker) in the frame
+    ranks = CrossSection(df["date"]).rank(
+        pd.DataFrame({"momentum": momentum, "mean_rev": mean_rev}), pct=True
+    )
+
+    df["alpha_score"] = 0.5 * ranks["momentum"] + 0.5 * ranks["mean_rev"]
 
     return df
@@ -1,23 +1,31 @@
 import pandas as pd
+from backtest.engines.price_cache import PriceCache
 from .config import RAW_DATA_DIR, START_DATE
 
 
 REQUIRED_COLUMNS = {"date", "ticker", "close"}
 
 
+def _read_prices(f):
+    df = pd.read_csv(f)
+    if not REQUIRED_COLUMNS.issubset(df.columns):
+        raise RuntimeError(f"Schema violation in {f.name}")
+
+    return df[["date", "ticker", "close"]].copy()
+
+
 def load_prices():
     files = list(RAW_DATA_DIR.glob("*.csv"))
     if not files:
         raise RuntimeError("No raw CSV files found in data/raw")
 
+    cache = PriceCache("phase5_frozen")
+
     df_list = []
     for f in files:
-        df = pd.read_csv(f)
-        if not REQUIRED_COLUMNS.issubset(df.columns):
-            raise RuntimeError(f"Schema violation in {f.name}")
+        df_list.append(cache.load(f, _read_prices))
 
-        df = df[["date", "ticker", "close"]].copy()
-        df_list.append(df)
+    cache.report()
 
     df = pd.concat(df_list, ignore_index=True)
     df["date"] = pd.to_datetime(df["date"])
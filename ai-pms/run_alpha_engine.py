@@ -1,18 +1,56 @@
-import pandas as pd
 from pathlib import Path
+import argparse
 
 from src.alpha_model import AlphaModel
-from src.config import OUTPUT_FEATURE_FILE
+from src.dataset_cache import DatasetCache
+from src.feature_store import load_features
+from src.hyperparam_search import promoted
+from src.labels import LabelCache
+from src.model_registry import ModelRegistry
+from src.retrain import RetrainPolicy, compare_modes, retrain
 
 MODEL_PATH = Path("data/output/alpha_model.pkl")
 ALPHA_OUTPUT = Path("data/output/alpha_scores.parquet")
 
 
-def main():
-    df = pd.read_parquet(OUTPUT_FEATURE_FILE)
+def main(incremental: bool = False, compare: bool = False):
+    df = load_features()
 
-    model = AlphaModel()
-    model.fit(df)
+    if compare:
+        print("\n⏱ Full refit vs warm-start update\n")
+        print(compare_modes(df).round(6).to_string())
+        return
+
+    # promoted by run_hyperparam_search → falls back to AlphaModel.PARAMS
+    # params only hold for the horizon they were tuned on → train on it too
+    best = promoted()
+    tuned = {"params": best["params"], "horizon": best["horizon"]} if best else {}
+    if best:
+        print(f"🏆 Using promoted hyperparameters (alpha_params.json, {best['horizon']}d horizon)")
+
+    model = AlphaModel(label_cache=LabelCache(), dataset_cache=DatasetCache(), **tuned)
+
+    # same data + features + params → reuse the registered model
+    registry = ModelRegistry()
+    key = registry.key(df, model)
+
+    if registry.load(key, model):
+        print(f"⚡ Model registry hit → {key}")
+    else:
+        if incremental and MODEL_PATH.exists():
+            # daily path → continue from yesterday's booster when policy allows;
+            # a booster trained with other params / horizon forces a full refit
+            model.load(MODEL_PATH)
+            retrain(model, df, RetrainPolicy())
+        else:
+            model.fit(df)
+            model.metrics["last_full_refit"] = model.metrics.get("trained_through")
+            model.metrics["baseline_rmse"] = model.metrics.get("val_rmse")
+
+        registry.save(key, model)
+        print(f"🧠 Model trained → {key}")
+
+    registry.prune(protect=key)
 
     scores = model.predict(df.dropna())
 
@@ -26,4 +64,9 @@ def main():
 
 
 if __name__ == "__main__":
-    main()
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--incremental", action="store_true", help="warm-start from alpha_model.pkl")
+    parser.add_argument("--compare-retrain", action="store_true", help="report full vs incremental retrain")
+    args = parser.parse_args()
+
+    main(incremental=args.incremental, compare=args.compare_retrain)
@@ -0,0 +1,12 @@
+from src.compact import compare_modes
+
+
+def main():
+    report = compare_modes()
+
+    print("\n📏 Default vs compact dtype mode\n")
+    print(report.round(2).to_string())
+
+
+if __name__ == "__main__":
+    main()
@@ -1,13 +1,87 @@
+import argparse
+
+import pandas as pd
+
 from src.utils import load_prices, save_parquet
-from src.feature_factory import FeatureFactory
-from src.config import INPUT_PRICE_FILE, OUTPUT_FEATURE_FILE
+from src.feature_pipeline import ChunkedFeaturePipeline
+from src.feature_state import IncrementalFeatureState
+from src.feature_store import FeatureStore, feature_key, spine_key
+from src.config import (
+    INPUT_PRICE_FILE,
+    OUTPUT_FEATURE_FILE,
+    OUTPUT_FEATURE_DIR,
+    SPINE_DIR,
+    FEATURE_MAX_MEMORY_MB,
+    FEATURE_STATE_FILE,
+)
+
+
+def run_incremental(price_df: pd.DataFrame) -> pd.DataFrame:
+    """
+    Daily path → only rows newer than the saved rolling state are computed
+    and appended to the features file. First run, or a state file load()
+    rejects, seeds the state from the full history.
+    """
+    state = None
+
+    if FEATURE_STATE_FILE.exists() and OUTPUT_FEATURE_FILE.exists():
+        try:
+            state = IncrementalFeatureState.load(FEATURE_STATE_FILE)
+        except ValueError as e:
+            # other windows / older layout → reseed from the full history
+            print(f"⚠️ {e} → rebuilding feature state")
+
+    if state is not None:
+        new = state.update(price_df)
+
+        features = pd.concat([pd.read_parquet(OUTPUT_FEATURE_FILE), new], ignore_index=True)
+        print(f"⚡ Incremental features → {len(new):,} new rows")
+    else:
+        state = IncrementalFeatureState()
+        features = state.update(price_df)
+        print(f"🌱 Feature state seeded → {len(state.symbols)} symbols")
 
+    state.save(FEATURE_STATE_FILE)
+
+    return features
+
+
+def main(
+    compact: bool = False,
+    chunked: bool = False,
+    incremental: bool = False,
+    spine_dir=SPINE_DIR,
+    out_dir=OUTPUT_FEATURE_DIR,
+    max_memory_mb: float = FEATURE_MAX_MEMORY_MB,
+):
+    if chunked:
+        # universe larger than RAM → stream the spine in bounded chunks
+        summary = ChunkedFeaturePipeline(
+            spine_dir,
+            out_dir,
+            max_memory_mb=max_memory_mb,
+            compact=compact,
+        ).run()
+
+        # linked, not copied → load_features() now reads the chunked set
+        key = spine_key(spine_dir, compact)
+        FeatureStore().link(key, out_dir, summary["rows"])
+        print(f"🔗 Feature store latest → {key} (chunked)")
+
+        print("✅ Feature Factory completed successfully")
+        print(f"Output saved to: {out_dir}")
+        return
 
-def main():
     price_df = load_prices(INPUT_PRICE_FILE)
 
-    factory = FeatureFactory(price_df)
-    features = factory.build_features()
+    store = FeatureStore()
+
+    if incremental:
+        features = run_incremental(price_df)
+        store.put(feature_key(price_df, compact, mode="incremental"), features)
+    else:
+        features, key, hit = store.get_or_build(price_df, compact=compact)
+        print(f"{'⚡ Feature store hit' if hit else '🧮 Features built'} → {key}")
 
     save_parquet(features, OUTPUT_FEATURE_FILE)
 
@@ -16,4 +90,20 @@ def main():
 
 
 if __name__ == "__main__":
-    main()
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--compact", action="store_true", help="compact dtypes end to end")
+    parser.add_argument("--chunked", action="store_true", help="out-of-core build from the parquet spine")
+    parser.add_argument("--incremental", action="store_true", help="update from the saved rolling state")
+    parser.add_argument("--spine", default=str(SPINE_DIR))
+    parser.add_argument("--out", default=str(OUTPUT_FEATURE_DIR))
+    parser.add_argument("--max-memory-mb", type=float, default=FEATURE_MAX_MEMORY_MB)
+    args = parser.parse_args()
+
+    main(
+        compact=args.compact,
+        chunked=args.chunked,
+        incremental=args.incremental,
+        spine_dir=args.spine,
+        out_dir=args.out,
+        max_memory_mb=args.max_memory_mb,
+    )
@@ -0,0 +1,52 @@
+import argparse
+
+from src.dataset_cache import DatasetCache
+from src.feature_store import load_features
+from src.hyperparam_search import HyperparamSearch
+from src.labels import LabelCache
+
+
+def main(
+    method: str = "random",
+    trials: int = 30,
+    budget_seconds: float = 600,
+    horizon: int = 5,
+    workers: int | None = None,
+    threads: int | None = None,
+):
+    features = load_features()
+
+    search = HyperparamSearch(
+        method=method,
+        trials=trials,
+        budget_seconds=budget_seconds,
+        horizon=horizon,
+        workers=workers,
+        threads_per_worker=threads,
+        label_cache=LabelCache(),
+        dataset_cache=DatasetCache(),
+    )
+    table = search.run(features)
+
+    cols = ["trial", "rung", "val_rmse", "best_iteration", "seconds", *search.space]
+    print(table[cols].head(10).round(6).to_string(index=False))
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--method", choices=["random", "grid", "halving"], default="random")
+    parser.add_argument("--trials", type=int, default=30, help="max configs evaluated")
+    parser.add_argument("--budget-seconds", type=float, default=600, help="no new trials after this")
+    parser.add_argument("--horizon", type=int, default=5)
+    parser.add_argument("--workers", type=int)
+    parser.add_argument("--threads", type=int, help="LightGBM threads per worker")
+    args = parser.parse_args()
+
+    main(
+        method=args.method,
+        trials=args.trials,
+        budget_seconds=args.budget_seconds,
+        horizon=args.horizon,
+        workers=args.workers,
+        threads=args.threads,
+    )
@@ -0,0 +1,19 @@
+import argparse
+
+from src.kernels import benchmark
+
+
+def main(sizes=(200, 2000), years: int = 14):
+    report = benchmark(sizes=sizes, years=years)
+
+    print("\n⚡ groupby chains vs wide-matrix kernels\n")
+    print(report.round(3).to_string())
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--symbols", type=int, nargs="+", default=[200, 2000])
+    parser.add_argument("--years", type=int, default=14)
+    args = parser.parse_args()
+
+    main(sizes=args.symbols, years=args.years)
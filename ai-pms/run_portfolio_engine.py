@@ -3,9 +3,9 @@ from pathlib import Path
 
 from src.optimizer import PortfolioOptimizer
 from src.risk_engine import RiskEngine
+from src.feature_store import load_features
 
 ALPHA_PATH = Path("data/output/alpha_scores.parquet")
-FEATURE_PATH = Path("data/output/features.parquet")
 
 WEIGHTS_OUT = Path("data/output/final_weights.parquet")
 RISK_OUT = Path("data/output/risk_state.parquet")
@@ -13,7 +13,7 @@ RISK_OUT = Path("data/output/risk_state.parquet")
 
 def main():
     alpha = pd.read_parquet(ALPHA_PATH)
-    features = pd.read_parquet(FEATURE_PATH)
+    features = load_features(["date", "symbol", "ret_1d"])
 
     latest_alpha = alpha.sort_values("date").groupby("symbol").tail(1)
 
@@ -25,6 +25,9 @@ def main():
     optimizer = PortfolioOptimizer(max_weight=0.1)
     weights = optimizer.optimize(latest_alpha, cov)
 
+    for t in optimizer.timings:
+        print(f"⏱ Optimizer n={t['n']} → compile {t['compile_s']:.3f}s | solve {t['solve_s']:.3f}s | {t['status']}")
+
     risk_engine = RiskEngine()
     risk_state = risk_engine.build_risk_state(weights, returns)
 
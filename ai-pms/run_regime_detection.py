@@ -1,27 +1,99 @@
-import pandas as pd
 from pathlib import Path
+import argparse
+
+import pandas as pd
 
+from src.compact import as_datetime
+from src.market_state import INPUT_FEATURES, MARKET_FEATURES, MarketStateCache
 from src.regime_model import RegimeDetector
-from src.config import OUTPUT_FEATURE_FILE
+from src.feature_store import load_features
 
 OUTPUT_REGIME_FILE = Path("data/output/regime_state.parquet")
+REGIME_MODEL_FILE = Path("data/output/regime_model.pkl")
+DAILY_PROBS_FILE = Path("data/output/regime_daily_probs.parquet")
 
 
-def main():
-    df = pd.read_parquet(OUTPUT_FEATURE_FILE)
-
-    detector = RegimeDetector(n_states=3)
+def full_refit(df: pd.DataFrame, **fit_kwargs):
+    detector = RegimeDetector(n_states=3, features=MARKET_FEATURES, **fit_kwargs)
     detector.fit(df)
 
-    daily_probs = detector.predict_daily_probabilities(df)
-    weekly_regime = detector.weekly_confirmed_regime(daily_probs)
+    if len(detector.restart_diagnostics) > 1:
+        print("\n🎲 HMM restarts\n")
+        print(detector.restart_diagnostics.round(3).to_string(index=False))
+
+    # forward-filtered like online_update's new rows → one consistent series
+    return detector, detector.predict_daily_probabilities(df, filtered=True)
+
+
+def online_update(df: pd.DataFrame, **fit_kwargs):
+    """
+    Filters only the rows after the persisted state; refits when the
+    schedule or the log-likelihood drift test says so.
+    """
+    detector = RegimeDetector.load(REGIME_MODEL_FILE)
+
+    if detector.features != MARKET_FEATURES:
+        print("🔁 Full HMM refit → saved model uses a different feature set")
+        return full_refit(df, **fit_kwargs)
+
+    new_rows = df[as_datetime(df["date"]) > detector.last_date] if detector.last_date is not None else df
+    daily_new = detector.update(new_rows)
+
+    reason = detector.needs_refit()
+    if reason:
+        print(f"🔁 Full HMM refit → {reason}")
+        return full_refit(df, **fit_kwargs)
+
+    print(f"⚡ Online regime update → {len(daily_new)} new rows, no refit")
+
+    daily = pd.concat([pd.read_parquet(DAILY_PROBS_FILE), daily_new], ignore_index=True)
+    return detector, daily
+
+
+def main(online: bool = False, threshold: float | None = None, min_dwell: int = 1, **fit_kwargs):
+    # one market row per date (breadth, dispersion, index proxy) → HMM input
+    features = load_features(["date", "symbol", *INPUT_FEATURES])
+
+    cache = MarketStateCache()
+    df = cache.update(features)
+
+    status = "rebuilt" if cache.stats["rebuilt"] else f"{cache.stats['new_dates']} new"
+    print(f"📈 Market state → {len(df)} dates ({status})")
+
+    if online and REGIME_MODEL_FILE.exists() and DAILY_PROBS_FILE.exists():
+        detector, daily_probs = online_update(df, **fit_kwargs)
+    else:
+        detector, daily_probs = full_refit(df, **fit_kwargs)
+
+    weekly_regime = detector.weekly_confirmed_regime(daily_probs, threshold=threshold, min_dwell=min_dwell)
 
     OUTPUT_REGIME_FILE.parent.mkdir(parents=True, exist_ok=True)
     weekly_regime.to_parquet(OUTPUT_REGIME_FILE, index=False)
 
+    detector.save(REGIME_MODEL_FILE)
+    daily_probs.to_parquet(DAILY_PROBS_FILE, index=False)
+
     print("✅ Regime Detection completed")
     print(f"Output saved to: {OUTPUT_REGIME_FILE}")
 
 
 if __name__ == "__main__":
-    main()
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--online", action="store_true", help="forward-filter new rows from the saved model")
+    parser.add_argument("--restarts", type=int, default=1, help="random EM restarts per state count")
+    parser.add_argument("--state-counts", type=int, nargs="+", help="e.g. 2 3 4 (selected by bic)")
+    parser.add_argument("--criterion", choices=["loglik", "bic"], help="default: bic across state counts, else loglik")
+    parser.add_argument("--workers", type=int)
+    parser.add_argument("--threshold", type=float, help="hysteresis: switch only at this probability")
+    parser.add_argument("--min-dwell", type=int, default=1, help="minimum confirmed-regime run (weeks)")
+    args = parser.parse_args()
+
+    main(
+        online=args.online,
+        threshold=args.threshold,
+        min_dwell=args.min_dwell,
+        restarts=args.restarts,
+        state_counts=args.state_counts,
+        criterion=args.criterion,
+        workers=args.workers,
+    )
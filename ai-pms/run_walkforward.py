@@ -0,0 +1,55 @@
+import argparse
+
+from src.feature_store import load_features
+from src.labels import LabelCache
+from src.walkforward import TRAIN_WINDOW_DAYS, WalkForwardEngine
+
+
+def main(
+    window: str = "expanding",
+    train_days: int = TRAIN_WINDOW_DAYS,
+    retrain_every: str = "M",
+    horizon: int = 5,
+    embargo_days: int = 0,
+    workers: int | None = None,
+    threads: int | None = None,
+):
+    features = load_features()
+
+    engine = WalkForwardEngine(
+        window=window,
+        train_days=train_days,
+        retrain_every=retrain_every,
+        horizon=horizon,
+        embargo_days=embargo_days,
+        workers=workers,
+        threads_per_worker=threads,
+        label_cache=LabelCache(),
+    )
+    preds = engine.run(features)
+
+    print("Rows:", len(preds))
+    print("Dates:", preds["date"].min(), "→", preds["date"].max())
+    print("Symbols:", preds["symbol"].nunique())
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--window", choices=["expanding", "rolling"], default="expanding")
+    parser.add_argument("--train-days", type=int, default=TRAIN_WINDOW_DAYS)
+    parser.add_argument("--retrain-every", default="M", help="pandas period alias, e.g. W-WED / M / Q")
+    parser.add_argument("--horizon", type=int, default=5)
+    parser.add_argument("--embargo-days", type=int, default=0)
+    parser.add_argument("--workers", type=int)
+    parser.add_argument("--threads", type=int, help="LightGBM threads per worker")
+    args = parser.parse_args()
+
+    main(
+        window=args.window,
+        train_days=args.train_days,
+        retrain_every=args.retrain_every,
+        horizon=args.horizon,
+        embargo_days=args.embargo_days,
+        workers=args.workers,
+        threads=args.threads,
+    )
@@ -6,26 +6,64 @@ import joblib
 from sklearn.model_selection import train_test_split
 from sklearn.metrics import mean_squared_error
 
+from src.compact import as_datetime
+from src.dataset_cache import booster_params
+from src.labels import forward_returns, is_label, label_name
+
 
 class AlphaModel:
-    def __init__(self):
+    PARAMS = {
+        "n_estimators": 200,
+        "learning_rate": 0.05,
+        "max_depth": 5,
+        "random_state": 42,
+    }
+
+    def __init__(
+        self,
+        horizon: int = 5,
+        label_cache=None,
+        params: dict | None = None,
+        dataset_cache=None,
+    ):
         self.model = None
         self.feature_cols = None
         self.trained = False
+        self.metrics: dict = {}
+        # params / horizon the current booster was trained with (None → unknown)
+        self.trained_spec: dict | None = None
+
+        self.params = {**self.PARAMS, **(params or {})}
+
+        self.horizon = horizon
+        self.target = label_name(horizon)
+        # LabelCache → labels shared across fits / horizons; None → build in memory
+        self.label_cache = label_cache
+        # DatasetCache → binned lgb.Dataset reused across fits; None → sklearn API
+        self.dataset_cache = dataset_cache
+
+    def spec(self) -> dict:
+        return {"params": self.params, "horizon": self.horizon}
 
     def _prepare_target(self, df: pd.DataFrame) -> pd.DataFrame:
         df = df.copy()
-        df["fwd_ret_5d"] = (
-            df.groupby("symbol")["ret_1d"]
-            .shift(-5)
-            .rolling(5)
-            .sum()
-        )
+
+        if self.label_cache is not None:
+            labels = self.label_cache.labels(df, [self.horizon])
+        else:
+            labels = forward_returns(df, [self.horizon])
+
+        df[self.target] = labels[self.target]
         return df
 
+    @staticmethod
+    def candidate_features(df: pd.DataFrame) -> list[str]:
+        # labels of any horizon are targets, never inputs
+        ignore = {"date", "symbol"}
+        return [c for c in df.columns if c not in ignore and not is_label(c)]
+
     def _select_features(self, df: pd.DataFrame):
-        ignore = {"date", "symbol", "fwd_ret_5d"}
-        self.feature_cols = [c for c in df.columns if c not in ignore]
+        self.feature_cols = self.candidate_features(df)
 
     def fit(self, df: pd.DataFrame):
         df = self._prepare_target(df).dropna()
@@ -37,20 +75,19 @@ class AlphaModel:
         self._select_features(df)
 
         X = df[self.feature_cols]
-        y = df["fwd_ret_5d"]
+        y = df[self.target]
 
         X_train, X_val, y_train, y_val = train_test_split(
             X, y, test_size=0.2, shuffle=False
         )
 
-        self.model = lgb.LGBMRegressor(
-            n_estimators=200,
-            learning_rate=0.05,
-            max_depth=5,
-            random_state=42,
-        )
-
-        self.model.fit(X_train, y_train)
+        if self.dataset_cache is not None:
+            train_set = self.dataset_cache.dataset(X_train, y_train, self.params)
+            params, rounds = booster_params(self.params)
+            self.model = lgb.train(params, train_set, num_boost_round=rounds)
+        else:
+            self.model = lgb.LGBMRegressor(**self.params)
+            self.model.fit(X_train, y_train)
 
         preds = self.model.predict(X_val)
 
@@ -58,8 +95,46 @@ class AlphaModel:
         rmse = np.sqrt(mean_squared_error(y_val, preds))
         print(f"Validation RMSE: {rmse:.6f}")
 
+        self.metrics = {
+            "val_rmse": float(rmse),
+            "n_train": len(X_train),
+            "n_val": len(X_val),
+            "trained_through": str(as_datetime(df["date"]).max().date()),
+        }
+        self.trained_spec = self.spec()
         self.trained = True
 
+    @property
+    def booster(self) -> lgb.Booster:
+        # LGBMRegressor (sklearn path) or a bare Booster (dataset cache path)
+        return getattr(self.model, "booster_", self.model)
+
+    def n_trees(self) -> int:
+        return self.booster.num_trees() if self.trained else 0
+
+    def fit_incremental(self, df: pd.DataFrame, window_days: int = 60, extra_trees: int = 20):
+        """
+        Warm start: keeps the current booster and adds `extra_trees`
+        trees fitted on the last `window_days` calendar days only.
+        """
+        if not self.trained:
+            return self.fit(df)
+
+        df = self._prepare_target(df).dropna()
+        dates = as_datetime(df["date"])
+
+        recent = df[dates > dates.max() - pd.Timedelta(days=window_days)]
+
+        model = lgb.LGBMRegressor(**{**self.params, "n_estimators": extra_trees})
+        model.fit(recent[self.feature_cols], recent[self.target], init_model=self.booster)
+
+        self.model = model
+        self.metrics = {
+            **self.metrics,
+            "n_incremental": len(recent),
+            "trained_through": str(dates.max().date()),
+        }
+
     def predict(self, df: pd.DataFrame) -> pd.DataFrame:
         df = df.copy()
 
@@ -72,8 +147,13 @@ class AlphaModel:
 
     def save(self, path):
         if self.trained:
-            joblib.dump((self.model, self.feature_cols), path)
+            joblib.dump((self.model, self.feature_cols, self.metrics, self.trained_spec), path)
 
     def load(self, path):
-        self.model, self.feature_cols = joblib.load(path)
+        saved = joblib.load(path)
+
+        # older pickles carry (model, feature_cols[, metrics]) only
+        self.model, self.feature_cols = saved[:2]
+        self.metrics = saved[2] if len(saved) > 2 else {}
+        self.trained_spec = saved[3] if len(saved) > 3 else None
         self.trained = True
@@ -0,0 +1,149 @@
+"""
+Compact dtype mode for the price / feature pipeline.
+
+    symbol-like columns → category (int codes + one copy of each string)
+    prices / features   → float32
+    volume              → int32 / int64 (float32 if it has gaps)
+    date                → int32 day number since 1970-01-01
+
+Parquet keeps all of these (category as a dictionary column, date as
+INT32), so a compact run stays compact end to end. Consumers that need
+real timestamps go through as_datetime(), which accepts both modes.
+"""
+
+from __future__ import annotations
+
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+import multiprocessing as mp
+import tempfile
+
+import numpy as np
+import pandas as pd
+
+
+CATEGORY_COLS = {"symbol", "ticker", "model", "regime"}
+
+
+# --------------------------------------------------
+# Dates ↔ day numbers
+# --------------------------------------------------
+
+def to_day_numbers(dates: pd.Series) -> pd.Series:
+    if pd.api.types.is_integer_dtype(dates):
+        return dates.astype(np.int32)
+
+    days = pd.to_datetime(dates).to_numpy().astype("datetime64[D]").astype(np.int64)
+    return pd.Series(days.astype(np.int32), index=dates.index, name=dates.name)
+
+
+def as_datetime(dates: pd.Series) -> pd.Series:
+    """
+    Timestamps from either a compact (int day number) or a regular date column.
+    """
+    if pd.api.types.is_integer_dtype(dates):
+        return pd.Series(
+            dates.to_numpy().astype("datetime64[D]").astype("datetime64[ns]"),
+            index=dates.index,
+            name=dates.name,
+        )
+
+    return pd.to_datetime(dates)
+
+
+# --------------------------------------------------
+# Frame conversion
+# --------------------------------------------------
+
+def _compact_volume(s: pd.Series) -> pd.Series:
+    if s.isna().any():
+        return s.astype(np.float32)
+
+    top = s.abs().max() if len(s) else 0
+    return s.astype(np.int32 if top < np.iinfo(np.int32).max else np.int64)
+
+
+def compact_frame(df: pd.DataFrame) -> pd.DataFrame:
+    out = df.copy(deep=False)
+
+    for col in out.columns:
+        s = out[col]
+
+        if col == "date":
+            out[col] = to_day_numbers(s)
+        elif col in CATEGORY_COLS or pd.api.types.is_string_dtype(s):
+            out[col] = s.astype("category")
+        elif col == "volume":
+            out[col] = _compact_volume(s)
+        elif pd.api.types.is_float_dtype(s):
+            out[col] = s.astype(np.float32)
+
+    return out
+
+
+def expand_frame(df: pd.DataFrame) -> pd.DataFrame:
+    """
+    Back to the default mode (datetime dates, str symbols, float64).
+    """
+    out = df.copy(deep=False)
+
+    for col in out.columns:
+        s = out[col]
+
+        if col == "date":
+            out[col] = as_datetime(s)
+        elif isinstance(s.dtype, pd.CategoricalDtype):
+            out[col] = s.astype(str)
+        elif pd.api.types.is_float_dtype(s) or col == "volume":
+            out[col] = s.astype(np.float64)
+
+    return out
+
+
+# --------------------------------------------------
+# Default vs compact benchmark
+# --------------------------------------------------
+
+def _profile_pipeline(compact: bool) -> dict:
+    """
+    Runs load → features → alpha in a fresh process and reports its
+    peak RSS plus the in-memory and Parquet sizes of each stage.
+    """
+    import resource
+
+    from backtest.engines.data_engine import HistoricalDataEngine
+    from backtest.engines.alpha_backtest_engine import AlphaBacktestEngine
+    from src.feature_factory import FeatureFactory
+
+    prices = HistoricalDataEngine(compact=compact).run()
+    features = FeatureFactory(prices, compact=compact).build_features()
+    alpha = AlphaBacktestEngine("ml_factor", compact=compact).run(prices)
+
+    stats = {"mode": "compact" if compact else "default"}
+
+    with tempfile.TemporaryDirectory() as tmp:
+        for name, frame in [("prices", prices), ("features", features), ("alpha", alpha)]:
+            path = Path(tmp) / f"{name}.parquet"
+            frame.to_parquet(path, index=False)
+
+            stats[f"{name}_mem_mb"] = frame.memory_usage(deep=True).sum() / 1e6
+            stats[f"{name}_parquet_mb"] = path.stat().st_size / 1e6
+
+    # linux reports ru_maxrss in KB
+    stats["peak_rss_mb"] = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+
+    return stats
+
+
+def compare_modes() -> pd.DataFrame:
+    """
+    Peak RSS / output size of the default vs compact pipeline, each
+    measured in its own spawned process so peaks don't leak across.
+    """
+    rows = []
+
+    for compact in (False, True):
+        with ProcessPoolExecutor(max_workers=1, mp_context=mp.get_context("spawn")) as pool:
+            rows.append(pool.submit(_profile_pipeline, compact).result())
+
+    return pd.DataFrame(rows).set_index("mode").T
@@ -7,3 +7,22 @@ OUTPUT_FEATURE_FILE = BASE_DIR / "data/output/features.parquet"
 
 ROLLING_WINDOWS = [5, 20, 60]
 VOL_WINDOWS = [20, 60]
+
+# chunked (out-of-core) feature build
+SPINE_DIR = BASE_DIR / "data/processed/nse_spine"
+OUTPUT_FEATURE_DIR = BASE_DIR / "data/output/features"
+FEATURE_MAX_MEMORY_MB = 512
+
+# incremental (daily) feature build
+FEATURE_STATE_FILE = BASE_DIR / "data/output/feature_state.npz"
+
+# versioned feature store (hash of prices + feature definitions)
+FEATURE_STORE_DIR = BASE_DIR / "data/cache/features"
+FEATURE_STORE_MAX_MB = 2048
+
+# trained alpha models keyed by data / features / params
+MODEL_REGISTRY_DIR = BASE_DIR / "data/cache/models"
+
+# binned LightGBM datasets reused across fits / tuning trials
+DATASET_CACHE_DIR = BASE_DIR / "data/cache/datasets"
+DATASET_CACHE_MAX_MB = 4096
@@ -0,0 +1,189 @@
+"""
+Vectorized cross-sectional transforms.
+
+Lays a long frame out once as a (position within date × date) matrix —
+the same GroupedMatrix layout the time-series kernels use, keyed by
+date instead of symbol — so every cross-sectional op is a whole-array
+numpy op along axis 0:
+
+    rank        average-tie ranks (optionally pct), NaN stays NaN
+    zscore      (x - mean) / std (ddof=1)
+    winsorize   clip to per-date quantiles
+    demean      subtract the per-date mean
+    neutralize  remove the per-date OLS projection on an exposure
+
+Several columns go through in one call: they are stacked side by side
+along axis 1, so one argsort ranks all of them for every date.
+
+Semantics match pandas groupby("date")[col].rank(method="average") /
+transform("mean") / transform("std").
+"""
+
+from __future__ import annotations
+
+import numpy as np
+import pandas as pd
+
+from src.kernels import GroupedMatrix
+
+
+class CrossSection:
+    def __init__(self, dates: pd.Series):
+        self.grid = GroupedMatrix(dates)
+        self.n_dates = self.grid.shape[1]
+
+    # --------------------------------------------------
+    # LAYOUT
+    # --------------------------------------------------
+
+    def wide(self, df: pd.DataFrame | pd.Series) -> np.ndarray:
+        """
+        One or many columns → (max names per date, n_dates × n_columns).
+        """
+        if isinstance(df, pd.Series):
+            return self.grid.wide(df)
+
+        return np.hstack([self.grid.wide(df[c]) for c in df.columns])
+
+    def long(self, arr: np.ndarray, columns=None, index=None):
+        if columns is None:
+            return pd.Series(self.grid.long(arr), index=index)
+
+        out = {
+            c: self.grid.long(arr[:, i * self.n_dates:(i + 1) * self.n_dates])
+            for i, c in enumerate(columns)
+        }
+        return pd.DataFrame(out, index=index)
+
+    def _apply(self, data, fn, **kwargs):
+        arr = fn(np.asfortranarray(self.wide(data)), **kwargs)
+
+        columns = data.columns if isinstance(data, pd.DataFrame) else None
+        return self.long(arr, columns, data.index)
+
+    # --------------------------------------------------
+    # TRANSFORMS (Series → Series, DataFrame → DataFrame)
+    # --------------------------------------------------
+
+    def rank(self, data, pct: bool = False, ascending: bool = True):
+        return self._apply(data, rank, pct=pct, ascending=ascending)
+
+    def zscore(self, data):
+        return self._apply(data, zscore)
+
+    def winsorize(self, data, lower: float = 0.01, upper: float = 0.99):
+        return self._apply(data, winsorize, lower=lower, upper=upper)
+
+    def demean(self, data):
+        return self._apply(data, demean)
+
+    def neutralize(self, data, exposure: pd.Series):
+        e = np.asfortranarray(self.grid.wide(exposure))
+        n_cols = 1 if isinstance(data, pd.Series) else data.shape[1]
+
+        return self._apply(data, neutralize, exposure=np.tile(e, (1, n_cols)))
+
+
+# --------------------------------------------------
+# Matrix kernels (axis 0 = names within one date)
+# --------------------------------------------------
+
+def rank(x: np.ndarray, pct: bool = False, ascending: bool = True) -> np.ndarray:
+    valid = ~np.isnan(x)
+    n_rows, n_cols = x.shape
+
+    # NaN sorts last either way; descending = ascending rank of -x
+    order = np.argsort(x if ascending else -x, axis=0, kind="stable")
+    sv = np.take_along_axis(x, order, axis=0).ravel(order="F")
+
+    # runs of equal values within a column share the average position
+    flat = np.arange(sv.size)
+    col_start = (flat // n_rows) * n_rows
+
+    new_run = np.ones(sv.size, dtype=bool)
+    new_run[1:] = (sv[1:] != sv[:-1]) | (flat[1:] % n_rows == 0)
+
+    run_start = np.maximum.accumulate(np.where(new_run, flat, 0))
+    run_end = np.minimum.accumulate(
+        np.where(np.r_[new_run[1:], True], flat, sv.size)[::-1]
+    )[::-1]
+
+    avg = (run_start + run_end) / 2 - col_start + 1
+
+    ranks = np.empty_like(x)
+    np.put_along_axis(ranks, order, avg.reshape(n_cols, n_rows).T, axis=0)
+    ranks[~valid] = np.nan
+
+    if pct:
+        ranks = ranks / valid.sum(axis=0)
+
+    return ranks
+
+
+def _nan_moments(x: np.ndarray):
+    valid = ~np.isnan(x)
+    n = valid.sum(axis=0)
+
+    with np.errstate(invalid="ignore", divide="ignore"):
+        mean = np.where(valid, x, 0.0).sum(axis=0) / n
+        dev = np.where(valid, x - mean, 0.0)
+        std = np.sqrt((dev * dev).sum(axis=0) / (n - 1))
+
+    return mean, np.where(n > 1, std, np.nan)
+
+
+def zscore(x: np.ndarray) -> np.ndarray:
+    mean, std = _nan_moments(x)
+
+    with np.errstate(invalid="ignore", divide="ignore"):
+        return (x - mean) / std
+
+
+def demean(x: np.ndarray) -> np.ndarray:
+    return x - _nan_moments(x)[0]
+
+
+def quantiles(x: np.ndarray, q: float) -> np.ndarray:
+    """
+    Per-column linear-interpolated quantile ignoring NaN (numpy 'linear').
+    """
+    sv = np.sort(x, axis=0)
+    n = (~np.isnan(x)).sum(axis=0)
+
+    pos = q * np.maximum(n - 1, 0)
+    lo = np.floor(pos).astype(np.int64)
+    hi = np.minimum(lo + 1, np.maximum(n - 1, 0))
+
+    cols = np.arange(x.shape[1])
+    lo_v, hi_v = sv[lo, cols], sv[hi, cols]
+
+    out = lo_v + (pos - lo) * (hi_v - lo_v)
+    return np.where(n > 0, out, np.nan)
+
+
+def winsorize(x: np.ndarray, lower: float = 0.01, upper: float = 0.99) -> np.ndarray:
+    return np.clip(x, quantiles(x, lower), quantiles(x, upper))
+
+
+def neutralize(x: np.ndarray, exposure: np.ndarray) -> np.ndarray:
+    """
+    Residual of x on [1, exposure] per column, fit on rows where both exist.
+    """
+    both = ~np.isnan(x) & ~np.isnan(exposure)
+
+    xm = np.where(both, x, np.nan)
+    em = np.where(both, exposure, np.nan)
+
+    xd, ed = demean(xm), demean(em)
+
+    with np.errstate(invalid="ignore", divide="ignore"):
+        beta = np.nansum(xd * ed, axis=0) / np.nansum(ed * ed, axis=0)
+
+    return xd - np.nan_to_num(beta) * ed
+
+
+def cross_sectional(df: pd.DataFrame, columns, op: str = "rank", date_col: str = "date", **kwargs):
+    """
+    One-shot helper: CrossSection(df[date_col]).<op>(df[columns], **kwargs).
+    """
+    return getattr(CrossSection(df[date_col]), op)(df[list(columns)], **kwargs)
@@ -0,0 +1,150 @@
+"""
+Binary LightGBM dataset cache.
+
+Building an lgb.Dataset bins every feature (quantile sketch per column),
+which dominates the cost of repeated fits on the same matrix. The
+constructed dataset is saved once with Dataset.save_binary and reused:
+
+    data/cache/datasets/<key>.bin
+
+    key = hash(feature values, column names, labels, binning params)
+
+Only binning params go into the key, so hyperparameter trials that vary
+tree params (num_leaves, learning_rate, min_child_samples, ...) share one
+binned dataset. feature_pre_filter is off for the same reason: otherwise
+min_data_in_leaf would be baked into the bins.
+
+Hits are lazy: dataset() returns an unconstructed lgb.Dataset pointing at
+the .bin file, which LightGBM reads when training starts. Datasets used
+in this process are also kept in memory, so a tuning loop touches the
+file once.
+"""
+
+from __future__ import annotations
+
+from pathlib import Path
+import hashlib
+import json
+import os
+
+import lightgbm as lgb
+import numpy as np
+import pandas as pd
+
+from src.config import DATASET_CACHE_DIR, DATASET_CACHE_MAX_MB
+
+
+# params that change how features are binned → part of the cache key
+BIN_PARAMS = {
+    "max_bin": "max_bin",
+    "min_data_in_bin": "min_data_in_bin",
+    "subsample_for_bin": "bin_construct_sample_cnt",
+    "bin_construct_sample_cnt": "bin_construct_sample_cnt",
+    "random_state": "seed",
+    "seed": "seed",
+    "use_missing": "use_missing",
+    "zero_as_missing": "zero_as_missing",
+}
+
+
+def dataset_params(params: dict) -> dict:
+    out = {BIN_PARAMS[k]: v for k, v in params.items() if k in BIN_PARAMS}
+    return {**out, "feature_pre_filter": False, "verbose": -1}
+
+
+def booster_params(params: dict) -> tuple[dict, int]:
+    """
+    sklearn-style params (AlphaModel.PARAMS) → (lgb.train params, rounds).
+    """
+    params = dict(params)
+    rounds = params.pop("n_estimators", 100)
+    params.pop("subsample_for_bin", None)  # dataset-side, see dataset_params
+
+    return {"objective": "regression", "verbose": -1, **params}, rounds
+
+
+class DatasetCache:
+    def __init__(self, root: str | Path = DATASET_CACHE_DIR, max_mb: float = DATASET_CACHE_MAX_MB):
+        self.root = Path(root)
+        self.max_mb = max_mb
+        self.stats = {"hits": 0, "built": 0}
+        self._live: dict[str, lgb.Dataset] = {}
+
+    def key(self, X: pd.DataFrame, y, params: dict) -> str:
+        digest = hashlib.sha256(np.ascontiguousarray(X.to_numpy(dtype=np.float64)).tobytes())
+        digest.update(np.ascontiguousarray(np.asarray(y, dtype=np.float64)).tobytes())
+        digest.update(json.dumps([list(X.columns), dataset_params(params)], sort_keys=True).encode())
+
+        return digest.hexdigest()[:20]
+
+    def _path(self, key: str) -> Path:
+        return self.root / f"{key}.bin"
+
+    # --------------------------------------------------
+    # GET / BUILD
+    # --------------------------------------------------
+
+    def dataset(self, X: pd.DataFrame, y, params: dict | None = None) -> lgb.Dataset:
+        params = params or {}
+        key = self.key(X, y, params)
+        path = self._path(key)
+
+        if key in self._live:
+            self.stats["hits"] += 1
+            return self._live[key]
+
+        if path.exists():
+            os.utime(path)
+            data = lgb.Dataset(str(path), params=dataset_params(params))
+            self.stats["hits"] += 1
+        else:
+            data = self._build(X, y, params, path)
+
+        self._live[key] = data
+        return data
+
+    def binary(self, X: pd.DataFrame, y, params: dict | None = None) -> Path:
+        """
+        Path of the .bin file (built on a miss) → for worker processes.
+        """
+        params = params or {}
+        path = self._path(self.key(X, y, params))
+
+        if path.exists():
+            os.utime(path)
+            self.stats["hits"] += 1
+        else:
+            self._build(X, y, params, path)
+
+        return path
+
+    def _build(self, X: pd.DataFrame, y, params: dict, path: Path) -> lgb.Dataset:
+        data = lgb.Dataset(X, np.asarray(y, dtype=np.float64), params=dataset_params(params))
+        data.construct()
+
+        self.root.mkdir(parents=True, exist_ok=True)
+        tmp = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+        data.save_binary(str(tmp))
+        os.replace(tmp, path)
+
+        self.stats["built"] += 1
+        self._evict(protect=path)
+
+        return data
+
+    # --------------------------------------------------
+    # EVICTION (least recently used first)
+    # --------------------------------------------------
+
+    def _evict(self, protect: Path | None = None) -> None:
+        files = sorted(self.root.glob("*.bin"), key=lambda p: p.stat().st_mtime)
+        total = sum(p.stat().st_size for p in files)
+
+        for path in files:
+            if total <= self.max_mb * 1024 * 1024:
+                break
+            if path == protect:
+                continue
+
+            total -= path.stat().st_size
+            path.unlink(missing_ok=True)
@@ -1,27 +1,35 @@
 import pandas as pd
-import numpy as np
 
+from src.compact import compact_frame
+from src.feature_registry import DEFAULT_FEATURES, REGISTRY
 
-class FeatureFactory:
-    def __init__(self, df: pd.DataFrame):
-        self.df = df.sort_values(["symbol", "date"]).copy()
 
-    def build_features(self) -> pd.DataFrame:
-        df = self.df.copy()
+class FeatureFactory:
+    def __init__(self, df: pd.DataFrame, compact: bool = False):
+        self.compact = compact
+        # sort_values already returns a new frame → no extra copy
+        self.df = df.sort_values(["symbol", "date"])
 
-        df["ret_1d"] = df.groupby("symbol")["close"].pct_change()
-        df["ret_5d"] = df.groupby("symbol")["close"].pct_change(5)
-        df["ret_20d"] = df.groupby("symbol")["close"].pct_change(20)
-        df["ret_60d"] = df.groupby("symbol")["close"].pct_change(60)
+        if compact:
+            self.df = compact_frame(self.df)
 
-        df["vol_20d"] = df.groupby("symbol")["ret_1d"].rolling(20).std().reset_index(0, drop=True)
-        df["vol_60d"] = df.groupby("symbol")["ret_1d"].rolling(60).std().reset_index(0, drop=True)
+    def build_features(self, features: list[str] | None = None) -> pd.DataFrame:
+        """
+        features → registry names to compute (default: the full set).
+        Only their dependency closure is evaluated.
+        """
+        # shallow: new feature columns never touch self.df
+        df = self.df.copy(deep=False)
 
-        df["drawdown"] = df["close"] / df.groupby("symbol")["close"].cummax() - 1
+        values = REGISTRY.evaluate(df, features or DEFAULT_FEATURES)
 
-        df["mom_20_60"] = df["ret_20d"] - df["ret_60d"]
+        for name, col in values.items():
+            df[name] = col
 
         # ⭐ key fix → allow small datasets
         df = df.fillna(0)
 
+        if self.compact:
+            df = compact_frame(df)
+
         return df
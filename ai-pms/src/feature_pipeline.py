@@ -0,0 +1,166 @@
+"""
+Chunked out-of-core Feature Factory.
+
+Streams the Parquet spine through FeatureFactory in bounded chunks:
+
+    symbol group (sized by the memory ceiling) × calendar year
+
+Each chunk carries only the history its rolling windows need — the
+last LOOKBACK rows per symbol from the previous year — plus the running
+close high for drawdown, so the output matches a full in-memory run.
+Chunks are written as they finish to a year-partitioned dataset:
+
+    data/output/features/year=YYYY/part-g0000.parquet
+"""
+
+from __future__ import annotations
+
+from pathlib import Path
+import shutil
+import time
+
+import pandas as pd
+
+from backtest.engines.parquet_spine import ParquetSpine
+from src.compact import compact_frame
+from src.feature_factory import FeatureFactory
+from src.feature_registry import DEFAULT_FEATURES, REGISTRY
+
+
+# history rows a chunk needs before its first date (ret_60d, vol_60d) + 1 spare
+LOOKBACK = REGISTRY.lookback(DEFAULT_FEATURES) + 1
+
+# rough in-memory cost of one feature row incl. groupby/rolling temporaries
+BYTES_PER_ROW = 400
+
+TRADING_DAYS = 252
+
+
+class ChunkedFeaturePipeline:
+    def __init__(
+        self,
+        spine_dir: str | Path,
+        out_dir: str | Path,
+        max_memory_mb: float = 512,
+        compact: bool = False,
+    ):
+        self.spine = ParquetSpine(spine_dir)
+        self.out_dir = Path(out_dir)
+        self.max_memory_mb = max_memory_mb
+        self.compact = compact
+
+    # --------------------------------------------------
+    # CHUNK PLAN
+    # --------------------------------------------------
+
+    def symbols_per_chunk(self) -> int:
+        rows_per_symbol = TRADING_DAYS + LOOKBACK
+        budget_rows = self.max_memory_mb * 1e6 / BYTES_PER_ROW
+
+        return max(1, int(budget_rows // rows_per_symbol))
+
+    def _plan(self):
+        symbols = sorted(self.spine.manifest["symbols"])
+        years = sorted({int(p["min_date"][:4]) for p in self.spine.manifest["parts"]})
+
+        size = self.symbols_per_chunk()
+        groups = [symbols[i:i + size] for i in range(0, len(symbols), size)]
+
+        return groups, years
+
+    # --------------------------------------------------
+    # ONE CHUNK
+    # --------------------------------------------------
+
+    def _build_chunk(
+        self,
+        slice_df: pd.DataFrame,
+        tail: pd.DataFrame,
+        peak: pd.Series,
+    ):
+        frame = pd.concat([tail, slice_df], ignore_index=True) if len(tail) else slice_df.reset_index(drop=True)
+        n_history = len(tail)
+
+        features = FeatureFactory(frame).build_features()
+
+        # drawdown against the all-time high, not just the carried window
+        close = frame.loc[features.index, "close"]
+        running = frame.groupby("symbol")["close"].cummax().loc[features.index]
+        carried = features["symbol"].map(peak).astype(float)
+        high = pd.concat([running, carried], axis=1).max(axis=1)
+        features["drawdown"] = (close / high - 1).fillna(0)
+
+        # emit only the rows that belong to this slice
+        out = features[features.index >= n_history]
+
+        new_tail = frame.groupby("symbol").tail(LOOKBACK)
+        new_peak = frame.groupby("symbol")["close"].max()
+        peak = pd.concat([peak, new_peak], axis=1).max(axis=1) if len(peak) else new_peak
+
+        return out, new_tail.reset_index(drop=True), peak
+
+    # --------------------------------------------------
+    # RUN
+    # --------------------------------------------------
+
+    def run(self) -> dict:
+        start = time.perf_counter()
+
+        if self.out_dir.exists():
+            shutil.rmtree(self.out_dir)
+
+        groups, years = self._plan()
+        rows = 0
+        peak_rows = 0
+
+        print(
+            f"🧩 Chunked features → {len(groups)} symbol groups × {len(years)} years "
+            f"(≤{self.symbols_per_chunk()} symbols / chunk, {self.max_memory_mb:.0f} MB ceiling)"
+        )
+
+        for g, symbols in enumerate(groups):
+            tail = pd.DataFrame()
+            peak = pd.Series(dtype=float)
+
+            for year in years:
+                slice_df = self.spine.load(
+                    start=f"{year}-01-01",
+                    end=f"{year}-12-31",
+                    symbols=symbols,
+                )
+
+                if slice_df.empty:
+                    continue
+
+                out, tail, peak = self._build_chunk(slice_df, tail, peak)
+                peak_rows = max(peak_rows, len(out) + len(tail))
+
+                if self.compact:
+                    out = compact_frame(out)
+
+                folder = self.out_dir / f"year={year}"
+                folder.mkdir(parents=True, exist_ok=True)
+                out.to_parquet(folder / f"part-g{g:04d}.parquet", index=False)
+
+                rows += len(out)
+
+        summary = {
+            "rows": rows,
+            "chunks": len(groups),
+            "peak_chunk_rows": peak_rows,
+            "seconds": time.perf_counter() - start,
+        }
+
+        print(f"✅ {rows:,} feature rows → {self.out_dir} ({summary['seconds']:.1f}s)")
+
+        return summary
+
+
+def read_features(path: str | Path, **filters) -> pd.DataFrame:
+    """
+    Reads a chunked features dataset back in (symbol, date) order.
+    """
+    df = pd.read_parquet(path, **filters)
+    df = df.drop(columns=["year"], errors="ignore")
+
+    return df.sort_values(["symbol", "date"]).reset_index(drop=True)
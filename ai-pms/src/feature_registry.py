@@ -0,0 +1,182 @@
+"""
+Declarative feature registry with lazy DAG evaluation.
+
+Each feature declares its inputs and (optionally) its window:
+
+    ret_20d          ← close              window 20
+    _ret_1d_vols     ← ret_1d             (every vol window, shared)
+    vol_20d          ← _ret_1d_vols       window 19 (+1 from ret_1d)
+    mom_20_60        ← ret_20d, ret_60d
+
+evaluate(df, ["mom_20_60"]) computes only the transitive closure
+(ret_20d, ret_60d, mom_20_60) on the shared wide-matrix layout. Each
+node is computed once per call, so intermediates such as ret_1d are
+reused by every feature that needs them. Features that nobody asks for
+cost nothing, so adding one never slows down existing pipelines.
+"""
+
+from __future__ import annotations
+
+from typing import Callable
+
+import numpy as np
+import pandas as pd
+
+from src import kernels
+from src.config import ROLLING_WINDOWS, VOL_WINDOWS
+
+
+# raw frame columns a feature can depend on
+SOURCES = {"open", "high", "low", "close", "volume"}
+
+
+class Feature:
+    def __init__(self, name: str, inputs: tuple[str, ...], fn: Callable, window: int | None = None):
+        self.name = name
+        self.inputs = inputs
+        self.fn = fn
+        self.window = window
+
+    def __repr__(self) -> str:
+        return f"Feature({self.name} ← {', '.join(self.inputs)})"
+
+
+class FeatureRegistry:
+    def __init__(self):
+        self.features: dict[str, Feature] = {}
+
+    # --------------------------------------------------
+    # REGISTRATION
+    # --------------------------------------------------
+
+    def register(self, name: str, inputs, window: int | None = None):
+        """
+        Decorator: fn receives the input wide arrays in declared order.
+        """
+        def wrap(fn):
+            self.features[name] = Feature(name, tuple(inputs), fn, window)
+            return fn
+
+        return wrap
+
+    def names(self) -> list[str]:
+        # underscore nodes are shared intermediates, not outputs
+        return [n for n in self.features if not n.startswith("_")]
+
+    # --------------------------------------------------
+    # GRAPH
+    # --------------------------------------------------
+
+    def closure(self, names) -> list[str]:
+        """
+        Requested features plus everything they depend on, in
+        dependency order (sources excluded).
+        """
+        order: list[str] = []
+        state: dict[str, str] = {}
+
+        def visit(name, path):
+            if name in SOURCES:
+                return
+            if name not in self.features:
+                raise KeyError(f"Unknown feature '{name}' (required by {' → '.join(path) or 'caller'})")
+            if state.get(name) == "done":
+                return
+            if state.get(name) == "active":
+                raise ValueError(f"Feature cycle: {' → '.join(path + [name])}")
+
+            state[name] = "active"
+            for dep in self.features[name].inputs:
+                visit(dep, path + [name])
+
+            state[name] = "done"
+            order.append(name)
+
+        for name in names:
+            visit(name, [])
+
+        return order
+
+    def lookback(self, names) -> int:
+        """
+        Prior rows per symbol needed before a value is defined.
+        Expanding features (window=None) contribute nothing.
+        """
+        memo: dict[str, int] = {}
+
+        def rows(name):
+            if name in SOURCES:
+                return 0
+            if name not in memo:
+                f = self.features[name]
+                own = f.window or 0
+                memo[name] = own + max((rows(d) for d in f.inputs), default=0)
+            return memo[name]
+
+        return max((rows(n) for n in names), default=0)
+
+    # --------------------------------------------------
+    # EVALUATION
+    # --------------------------------------------------
+
+    def evaluate(self, df: pd.DataFrame, names, key: str = "symbol") -> dict[str, np.ndarray]:
+        """
+        Computes the requested features for df (any row order) and
+        returns them aligned to df's rows.
+        """
+        names = list(names)
+        plan = self.closure(names)
+
+        grid = kernels.GroupedMatrix(df[key])
+        values: dict[str, np.ndarray] = {}
+
+        def get(name):
+            if name not in values:
+                values[name] = grid.wide(df[name])
+            return values[name]
+
+        for name in plan:
+            f = self.features[name]
+            values[name] = f.fn(*[get(i) for i in f.inputs])
+
+        return {name: grid.long(values[name]) for name in names}
+
+
+# --------------------------------------------------
+# Built-in features
+# --------------------------------------------------
+
+DEFAULT_FEATURES = [
+    "ret_1d",
+    *[f"ret_{k}d" for k in ROLLING_WINDOWS],
+    *[f"vol_{w}d" for w in VOL_WINDOWS],
+    "drawdown",
+    "mom_20_60",
+]
+
+
+def default_registry() -> FeatureRegistry:
+    reg = FeatureRegistry()
+
+    reg.register("ret_1d", ["close"], window=1)(lambda close: kernels.pct_change(close, 1))
+
+    for k in ROLLING_WINDOWS:
+        reg.register(f"ret_{k}d", ["close"], window=k)(
+            lambda close, k=k: kernels.pct_change(close, k)
+        )
+
+    # one wide frame for every vol window
+    reg.register("_ret_1d_vols", ["ret_1d"])(lambda ret: kernels.rolling_stds(ret, VOL_WINDOWS))
+
+    # rolling std of ret_1d: window-1 prior returns on top of ret_1d's own row
+    for w in VOL_WINDOWS:
+        reg.register(f"vol_{w}d", ["_ret_1d_vols"], window=w - 1)(lambda vols, w=w: vols[w])
+
+    reg.register("drawdown", ["close"])(kernels.drawdown)
+
+    reg.register("mom_20_60", ["ret_20d", "ret_60d"])(lambda r20, r60: r20 - r60)
+
+    return reg
+
+
+REGISTRY = default_registry()
@@ -0,0 +1,234 @@
+"""
+Incremental Feature Factory.
+
+Keeps per-symbol rolling state so a daily run only touches the new
+rows instead of the full history:
+
+    close ring  → last max(ROLLING_WINDOWS) + 1 closes   (ret_5d/20d/60d)
+    ret ring    → last max(VOL_WINDOWS) daily returns (0 where not finite)
+    bad ring    → which of those returns were missing (NaN close)
+    sum / sumsq → running sums of finite returns per VOL_WINDOW (vol_20d/60d)
+    n_bad       → missing returns inside each VOL_WINDOW → vol is NaN, like pandas
+    peak        → running close high, NaN closes skipped  (drawdown)
+
+Every update is a handful of vectorized array ops over the symbols that
+traded that day → O(symbols) per date. Output matches
+FeatureFactory.build_features row for row (same columns, NaN → 0).
+
+State lives in a single .npz next to the features output.
+"""
+
+from __future__ import annotations
+
+from pathlib import Path
+import os
+
+import numpy as np
+import pandas as pd
+
+from src.config import ROLLING_WINDOWS, VOL_WINDOWS
+
+
+CLOSE_LEN = max(ROLLING_WINDOWS) + 1
+RET_LEN = max(VOL_WINDOWS)
+
+FEATURE_COLUMNS = [
+    "ret_1d",
+    *[f"ret_{k}d" for k in ROLLING_WINDOWS],
+    *[f"vol_{w}d" for w in VOL_WINDOWS],
+    "drawdown",
+    "mom_20_60",
+]
+
+
+class IncrementalFeatureState:
+    def __init__(self):
+        self.symbols: list[str] = []
+        self.index: dict[str, int] = {}
+
+        self.count = np.zeros(0, dtype=np.int64)
+        self.last_date = np.zeros(0, dtype="datetime64[us]")
+        self.closes = np.zeros((0, CLOSE_LEN))
+        self.rets = np.zeros((0, RET_LEN))
+        self.bad = np.zeros((0, RET_LEN), dtype=bool)
+        self.sums = {w: np.zeros(0) for w in VOL_WINDOWS}
+        self.sumsq = {w: np.zeros(0) for w in VOL_WINDOWS}
+        self.n_bad = {w: np.zeros(0, dtype=np.int64) for w in VOL_WINDOWS}
+        self.peak = np.zeros(0)
+
+    # --------------------------------------------------
+    # SYMBOLS
+    # --------------------------------------------------
+
+    def _rows(self, symbols) -> np.ndarray:
+        new = [s for s in dict.fromkeys(symbols) if s not in self.index]
+
+        if new:
+            n = len(new)
+            for s in new:
+                self.index[s] = len(self.symbols)
+                self.symbols.append(s)
+
+            self.count = np.concatenate([self.count, np.zeros(n, dtype=np.int64)])
+            self.last_date = np.concatenate(
+                [self.last_date, np.full(n, np.datetime64("NaT"), dtype="datetime64[us]")]
+            )
+            self.closes = np.vstack([self.closes, np.full((n, CLOSE_LEN), np.nan)])
+            self.rets = np.vstack([self.rets, np.zeros((n, RET_LEN))])
+            self.bad = np.vstack([self.bad, np.zeros((n, RET_LEN), dtype=bool)])
+            self.peak = np.concatenate([self.peak, np.full(n, -np.inf)])
+
+            for w in VOL_WINDOWS:
+                self.sums[w] = np.concatenate([self.sums[w], np.zeros(n)])
+                self.sumsq[w] = np.concatenate([self.sumsq[w], np.zeros(n)])
+                self.n_bad[w] = np.concatenate([self.n_bad[w], np.zeros(n, dtype=np.int64)])
+
+        return np.array([self.index[s] for s in symbols], dtype=np.int64)
+
+    # --------------------------------------------------
+    # ONE DATE
+    # --------------------------------------------------
+
+    def _step(self, rows: np.ndarray, close: np.ndarray) -> dict[str, np.ndarray]:
+        i = self.count[rows]
+        out = {}
+
+        prev = self.closes[rows, (i - 1) % CLOSE_LEN]
+        ret = np.where(i >= 1, close / prev - 1, np.nan)
+
+        out["ret_1d"] = ret
+        for k in ROLLING_WINDOWS:
+            base = self.closes[rows, (i - k) % CLOSE_LEN]
+            out[f"ret_{k}d"] = np.where(i >= k, close / base - 1, np.nan)
+
+        # rolling std from running sums of finite returns; the rings supply the
+        # value leaving each window and whether it was missing
+        has_ret = i >= 1
+        bad = has_ret & ~np.isfinite(ret)
+        r = np.where(has_ret & ~bad, ret, 0.0)
+
+        for w in VOL_WINDOWS:
+            leaves = i - w >= 1
+            slot = (i - w) % RET_LEN
+
+            leaving = np.where(leaves, self.rets[rows, slot], 0.0)
+            leaving_bad = leaves & self.bad[rows, slot]
+
+            self.sums[w][rows] += r - leaving
+            self.sumsq[w][rows] += r * r - leaving * leaving
+            self.n_bad[w][rows] += bad.astype(np.int64) - leaving_bad
+
+            s, ss = self.sums[w][rows], self.sumsq[w][rows]
+            var = np.maximum((ss - s * s / w) / (w - 1), 0.0)
+
+            # pandas: any NaN inside the window → NaN
+            clean = (i >= w) & (self.n_bad[w][rows] == 0)
+            out[f"vol_{w}d"] = np.where(clean, np.sqrt(var), np.nan)
+
+        self.rets[rows, i % RET_LEN] = r
+        self.bad[rows, i % RET_LEN] = bad
+        self.closes[rows, i % CLOSE_LEN] = close
+
+        # fmax skips NaN closes, like cummax
+        self.peak[rows] = np.fmax(self.peak[rows], close)
+        out["drawdown"] = close / self.peak[rows] - 1
+
+        out["mom_20_60"] = out["ret_20d"] - out["ret_60d"]
+
+        self.count[rows] = i + 1
+
+        return out
+
+    # --------------------------------------------------
+    # UPDATE
+    # --------------------------------------------------
+
+    def update(self, df: pd.DataFrame) -> pd.DataFrame:
+        """
+        Features for the rows in df that are newer than the stored state.
+        Rows at or before a symbol's last processed date are dropped.
+        """
+        df = df.sort_values(["date", "symbol"]).reset_index(drop=True)
+        df["date"] = pd.to_datetime(df["date"])
+
+        rows = self._rows(df["symbol"].astype(str).tolist())
+        dates = df["date"].to_numpy().astype("datetime64[us]")
+
+        last = self.last_date[rows]
+        fresh = np.isnat(last) | (dates > last)
+
+        df, rows, dates = df[fresh].reset_index(drop=True), rows[fresh], dates[fresh]
+        close = df["close"].to_numpy(dtype=np.float64)
+
+        features = {name: np.full(len(df), np.nan) for name in FEATURE_COLUMNS}
+
+        # one vectorized step per date across every symbol that traded
+        for idx in df.groupby("date").indices.values():
+            for name, values in self._step(rows[idx], close[idx]).items():
+                features[name][idx] = values
+
+            self.last_date[rows[idx]] = dates[idx]
+
+        for name in FEATURE_COLUMNS:
+            df[name] = features[name]
+
+        return df.sort_values(["symbol", "date"]).fillna(0).reset_index(drop=True)
+
+    @classmethod
+    def from_history(cls, df: pd.DataFrame) -> "IncrementalFeatureState":
+        state = cls()
+        state.update(df)
+        return state
+
+    # --------------------------------------------------
+    # PERSISTENCE
+    # --------------------------------------------------
+
+    def save(self, path: str | Path) -> None:
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+
+        arrays = {
+            "symbols": np.array(self.symbols, dtype=str),
+            "count": self.count,
+            "last_date": self.last_date,
+            "closes": self.closes,
+            "rets": self.rets,
+            "bad": self.bad,
+            "peak": self.peak,
+            "windows": np.array([CLOSE_LEN, RET_LEN, *VOL_WINDOWS]),
+        }
+        for w in VOL_WINDOWS:
+            arrays[f"sum_{w}"] = self.sums[w]
+            arrays[f"sumsq_{w}"] = self.sumsq[w]
+            arrays[f"n_bad_{w}"] = self.n_bad[w]
+
+        tmp = path.with_name(f"{path.name}.{os.getpid()}.tmp.npz")
+        np.savez(tmp, **arrays)
+        os.replace(tmp, path)
+
+    @classmethod
+    def load(cls, path: str | Path) -> "IncrementalFeatureState":
+        state = cls()
+
+        with np.load(path) as z:
+            if list(z["windows"]) != [CLOSE_LEN, RET_LEN, *VOL_WINDOWS]:
+                raise ValueError(f"{path} was built with different feature windows")
+
+            missing = {"bad", *(f"n_bad_{w}" for w in VOL_WINDOWS)} - set(z.files)
+            if missing:
+                raise ValueError(f"{path} has no missing-return tracking ({sorted(missing)})")
+
+            state.symbols = [str(s) for s in z["symbols"]]
+            state.index = {s: i for i, s in enumerate(state.symbols)}
+            state.count = z["count"]
+            state.last_date = z["last_date"]
+            state.closes = z["closes"]
+            state.rets = z["rets"]
+            state.peak = z["peak"]
+            state.sums = {w: z[f"sum_{w}"] for w in VOL_WINDOWS}
+            state.sumsq = {w: z[f"sumsq_{w}"] for w in VOL_WINDOWS}
+            state.bad = z["bad"]
+            state.n_bad = {w: z[f"n_bad_{w}"] for w in VOL_WINDOWS}
+
+        return state
@@ -0,0 +1,308 @@
+"""
+Versioned on-disk feature store.
+
+Every materialized feature set is keyed by a hash of
+
+    input prices            (content hash of the sorted price frame)
+    feature definitions     (source of FeatureFactory, registry, kernels)
+    ROLLING_WINDOWS / VOL_WINDOWS and the dtype mode
+
+and stored as
+
+    data/cache/features/<key>/features.parquet
+    data/cache/features/<key>/last_used  → touched on every read (mtime)
+    data/cache/features/_index.json      → bytes / rows / columns / created
+
+A build with an unchanged key is a cache hit and costs one Parquet read.
+The most recent build is recorded as "latest", so consumers that never
+see the prices (regime, alpha, portfolio) can still read the current
+set — and only the columns they ask for. Old versions are evicted
+least-recently-used first once the store exceeds its size budget.
+
+Reads never rewrite _index.json (only put / link / eviction do), so
+concurrent consumers do not race on it; recency is a per-entry stamp.
+
+Builds that do not come from one in-memory price frame get their own
+key component, so they never hit (or are hit by) a batch build:
+
+    incremental   rolling-state update, keyed on prices + "incremental"
+    chunked       out-of-core dataset, keyed on the spine files; linked
+                  in place (see FeatureStore.link), never copied
+"""
+
+from __future__ import annotations
+
+from pathlib import Path
+import hashlib
+import inspect
+import json
+import os
+import shutil
+import time
+
+import pandas as pd
+import pyarrow.parquet as pq
+
+from src import feature_registry, kernels
+from src.config import (
+    FEATURE_STORE_DIR,
+    FEATURE_STORE_MAX_MB,
+    OUTPUT_FEATURE_FILE,
+    ROLLING_WINDOWS,
+    VOL_WINDOWS,
+)
+from src.feature_factory import FeatureFactory
+from src.feature_pipeline import read_features
+
+
+def price_hash(prices: pd.DataFrame) -> str:
+    prices = prices.sort_values(["symbol", "date"])
+    rows = pd.util.hash_pandas_object(prices, index=False).to_numpy()
+
+    digest = hashlib.sha256(rows.tobytes())
+    digest.update(",".join(prices.columns).encode())
+
+    return digest.hexdigest()
+
+
+def definition_hash(compact: bool = False) -> str:
+    digest = hashlib.sha256()
+
+    digest.update(inspect.getsource(FeatureFactory).encode())
+    digest.update(inspect.getsource(feature_registry).encode())
+    digest.update(inspect.getsource(kernels).encode())
+    digest.update(json.dumps([ROLLING_WINDOWS, VOL_WINDOWS, compact]).encode())
+
+    return digest.hexdigest()
+
+
+def files_hash(root: str | Path) -> str:
+    """
+    Stamp of an on-disk dataset (path, size, mtime per file) — cheap
+    enough for a spine that does not fit in memory.
+    """
+    root = Path(root)
+    digest = hashlib.sha256()
+
+    for f in sorted(root.rglob("*.parquet")):
+        stat = f.stat()
+        digest.update(f"{f.relative_to(root)}:{stat.st_size}:{stat.st_mtime_ns}".encode())
+
+    return digest.hexdigest()
+
+
+def _key(*parts: str) -> str:
+    return hashlib.sha256("".join(parts).encode()).hexdigest()[:20]
+
+
+def feature_key(prices: pd.DataFrame, compact: bool = False, mode: str = "batch") -> str:
+    parts = [price_hash(prices), definition_hash(compact)]
+
+    # batch keeps the plain key → existing store entries stay valid
+    if mode != "batch":
+        parts.append(mode)
+
+    return _key(*parts)
+
+
+def spine_key(spine_dir: str | Path, compact: bool = False) -> str:
+    return _key(files_hash(spine_dir), definition_hash(compact), "chunked")
+
+
+class FeatureStore:
+    INDEX = "_index.json"
+
+    def __init__(
+        self,
+        root: str | Path = FEATURE_STORE_DIR,
+        max_mb: float = FEATURE_STORE_MAX_MB,
+    ):
+        self.root = Path(root)
+        self.max_bytes = max_mb * 1e6
+        self.index = self._load_index()
+
+    # --------------------------------------------------
+    # INDEX
+    # --------------------------------------------------
+
+    def _load_index(self) -> dict:
+        path = self.root / self.INDEX
+
+        if path.exists():
+            try:
+                return json.loads(path.read_text())
+            except (OSError, ValueError):
+                pass
+
+        return {"entries": {}, "latest": None}
+
+    def _save_index(self) -> None:
+        self.root.mkdir(parents=True, exist_ok=True)
+
+        path = self.root / self.INDEX
+        tmp = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+        tmp.write_text(json.dumps(self.index, indent=2, sort_keys=True))
+        os.replace(tmp, path)
+
+    def _path(self, key: str) -> Path:
+        return self.root / key / "features.parquet"
+
+    def keys(self) -> list[str]:
+        return list(self.index["entries"])
+
+    def _touch(self, key: str) -> None:
+        stamp = self.root / key / "last_used"
+        stamp.parent.mkdir(parents=True, exist_ok=True)
+        stamp.touch()
+        os.utime(stamp)
+
+    def last_used(self, key: str) -> float:
+        try:
+            return (self.root / key / "last_used").stat().st_mtime
+        except OSError:
+            return self.index["entries"][key]["last_used"]
+
+    # --------------------------------------------------
+    # READ / WRITE
+    # --------------------------------------------------
+
+    def get(self, key: str, columns: list[str] | None = None) -> pd.DataFrame | None:
+        entry = self.index["entries"].get(key)
+        path = Path(entry["path"]) if entry and "path" in entry else self._path(key)
+
+        if entry is None or not path.exists():
+            return None
+
+        self._touch(key)
+
+        if "path" not in entry:
+            return pd.read_parquet(path, columns=columns)
+
+        # linked chunked dataset → same (symbol, date) order as a batch build
+        keys = None if columns is None else list(dict.fromkeys(["symbol", "date", *columns]))
+        features = read_features(path, columns=keys)
+
+        return features if columns is None else features[columns]
+
+    def put(self, key: str, features: pd.DataFrame) -> Path:
+        path = self._path(key)
+        path.parent.mkdir(parents=True, exist_ok=True)
+
+        tmp = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+        features.to_parquet(tmp, index=False)
+        os.replace(tmp, path)
+
+        now = time.time()
+        self.index["entries"][key] = {
+            "bytes": path.stat().st_size,
+            "rows": len(features),
+            "columns": list(features.columns),
+            "windows": {"rolling": ROLLING_WINDOWS, "vol": VOL_WINDOWS},
+            "created": now,
+            "last_used": now,
+        }
+        self.index["latest"] = key
+        self._touch(key)
+
+        self._evict()
+        self._save_index()
+
+        return path
+
+    def link(self, key: str, path: str | Path, rows: int) -> None:
+        """
+        Records a dataset written outside the store (chunked output) as
+        `key` and makes it latest. Linked files are read in place and
+        never copied or deleted by eviction.
+        """
+        path = Path(path).resolve()
+        first = next(path.rglob("*.parquet"), None)
+
+        entries = self.index["entries"]
+
+        # the pipeline rewrites its output dir → older links to it are stale
+        for old in [k for k, e in entries.items() if e.get("path") == str(path)]:
+            del entries[old]
+            shutil.rmtree(self.root / old, ignore_errors=True)
+
+        now = time.time()
+        entries[key] = {
+            "path": str(path),
+            "bytes": 0,
+            "rows": rows,
+            "columns": pq.read_schema(first).names if first else [],
+            "windows": {"rolling": ROLLING_WINDOWS, "vol": VOL_WINDOWS},
+            "created": now,
+            "last_used": now,
+        }
+        self.index["latest"] = key
+        self._touch(key)
+
+        self._save_index()
+
+    def latest(self, columns: list[str] | None = None) -> pd.DataFrame | None:
+        key = self.index["latest"]
+        return self.get(key, columns) if key else None
+
+    # --------------------------------------------------
+    # EVICTION
+    # --------------------------------------------------
+
+    def size_bytes(self) -> int:
+        return sum(e["bytes"] for e in self.index["entries"].values())
+
+    def _evict(self) -> list[str]:
+        evicted = []
+        entries = self.index["entries"]
+
+        # least recently used first; the latest set is never evicted
+        for key in sorted(entries, key=self.last_used):
+            if self.size_bytes() <= self.max_bytes:
+                break
+            if key == self.index["latest"]:
+                continue
+
+            # linked data lives outside the store → only its stamp is removed here
+            shutil.rmtree(self.root / key, ignore_errors=True)
+            del entries[key]
+            evicted.append(key)
+
+        if evicted:
+            print(f"🧹 Feature store evicted {len(evicted)} old version(s)")
+
+        return evicted
+
+    # --------------------------------------------------
+    # BUILD
+    # --------------------------------------------------
+
+    def get_or_build(self, prices: pd.DataFrame, compact: bool = False, columns=None):
+        """
+        Returns (features, key, hit).
+        """
+        key = feature_key(prices, compact)
+        features = self.get(key, columns)
+
+        if features is not None:
+            if self.index["latest"] != key:
+                self.index["latest"] = key
+                self._save_index()
+            return features, key, True
+
+        features = FeatureFactory(prices, compact=compact).build_features()
+        self.put(key, features)
+
+        return (features[columns] if columns else features), key, False
+
+
+def load_features(columns: list[str] | None = None) -> pd.DataFrame:
+    """
+    Current feature set for downstream engines. Falls back to the plain
+    features.parquet when the store has not been populated yet.
+    """
+    features = FeatureStore().latest(columns)
+
+    if features is None:
+        features = pd.read_parquet(OUTPUT_FEATURE_FILE, columns=columns)
+
+    return features
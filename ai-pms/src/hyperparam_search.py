@@ -0,0 +1,354 @@
+"""
+Hyperparameter search for AlphaModel.
+
+    random    sample `trials` configs from SPACE
+    grid      every combination of SPACE (shuffled, cut at `trials`)
+    halving   successive halving: `trials` random configs start on a
+              small round budget, the best 1/eta move up a rung with
+              eta× the rounds, until one config (or max_rounds) is left
+
+Validation fold: the last `val_fraction` of trading dates. Training
+stops `horizon` days before it, so no training label sees the fold.
+Every trial early-stops on that fold.
+
+The training fold is binned once through DatasetCache. Workers load the
+.bin file and build the validation set against its bin mappers, so no
+trial re-bins features. Workers are pinned to `threads_per_worker` like
+the walk-forward engine.
+
+Compute budget: no new batch / rung starts once `budget_seconds` is
+spent, and no more than `trials` configs are ever evaluated.
+
+    data/processed/hyperparam_trials.parquet   → one row per trial
+    data/output/alpha_params.json              → best params (promoted)
+
+run_alpha_engine picks up alpha_params.json through promoted() and
+trains at the horizon the params were tuned for.
+"""
+
+from __future__ import annotations
+
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+import itertools
+import json
+import os
+import time
+
+import lightgbm as lgb
+import numpy as np
+import pandas as pd
+
+from src.alpha_model import AlphaModel
+from src.compact import as_datetime
+from src.config import BASE_DIR
+from src.dataset_cache import DatasetCache, booster_params, dataset_params
+from src.walkforward import _pin_threads, scoped_threads
+
+
+TRIALS_PATH = BASE_DIR / "data/processed/hyperparam_trials.parquet"
+BEST_PARAMS_PATH = BASE_DIR / "data/output/alpha_params.json"
+
+SPACE = {
+    "learning_rate": [0.01, 0.02, 0.05, 0.1],
+    "num_leaves": [15, 31, 63],
+    "max_depth": [3, 5, 7],
+    "min_child_samples": [20, 50, 100, 200],
+    "subsample": [0.7, 0.85, 1.0],
+    "colsample_bytree": [0.6, 0.8, 1.0],
+    "reg_lambda": [0.0, 1.0, 10.0],
+}
+
+# fixed for every trial; subsample only takes effect with subsample_freq > 0
+BASE_PARAMS = {"random_state": 42, "subsample_freq": 1, "verbose": -1}
+
+
+# --------------------------------------------------
+# Worker side
+# --------------------------------------------------
+
+_DATA: dict = {}
+
+
+def _load(train_path: str, X_val: np.ndarray, y_val: np.ndarray, threads: int):
+    params = dataset_params(BASE_PARAMS)
+
+    train = lgb.Dataset(train_path, params=params)
+    train.construct()
+
+    # validation rows reuse the training bin mappers → no second sketch
+    valid = lgb.Dataset(X_val, y_val, reference=train, params=params)
+    valid.construct()
+
+    _DATA.update(train=train, valid=valid, threads=threads)
+
+
+def _init_worker(train_path: str, X_val: np.ndarray, y_val: np.ndarray, threads: int):
+    # pool processes only live for this search → pinned for good
+    _pin_threads(threads)
+    _load(train_path, X_val, y_val, threads)
+
+
+def _run_trial(trial: dict) -> dict:
+    params, _ = booster_params({**BASE_PARAMS, **trial["params"]})
+    params["num_threads"] = _DATA["threads"]
+
+    start = time.perf_counter()
+    booster = lgb.train(
+        params,
+        _DATA["train"],
+        num_boost_round=trial["rounds"],
+        valid_sets=[_DATA["valid"]],
+        callbacks=[lgb.early_stopping(trial["early_stopping"], verbose=False)],
+    )
+
+    best_iter = booster.best_iteration or trial["rounds"]
+    # default metric for the regression objective is l2 (MSE)
+    mse = booster.best_score["valid_0"]["l2"]
+
+    return {
+        **trial,
+        "best_iteration": int(best_iter),
+        "val_rmse": float(np.sqrt(mse)),
+        "seconds": time.perf_counter() - start,
+    }
+
+
+# --------------------------------------------------
+# Search
+# --------------------------------------------------
+
+class HyperparamSearch:
+    def __init__(
+        self,
+        method: str = "random",
+        trials: int = 30,
+        budget_seconds: float = 600,
+        space: dict | None = None,
+        max_rounds: int = 1000,
+        min_rounds: int = 50,
+        eta: int = 3,
+        early_stopping: int = 50,
+        val_fraction: float = 0.2,
+        horizon: int = 5,
+        workers: int | None = None,
+        threads_per_worker: int | None = None,
+        label_cache=None,
+        dataset_cache: DatasetCache | None = None,
+        seed: int = 0,
+    ):
+        if method not in {"random", "grid", "halving"}:
+            raise ValueError(f"Unknown search method: {method}")
+
+        self.method = method
+        self.trials = trials
+        self.budget_seconds = budget_seconds
+        self.space = space or SPACE
+        self.max_rounds = max_rounds
+        self.min_rounds = min_rounds
+        self.eta = eta
+        self.early_stopping = early_stopping
+        self.val_fraction = val_fraction
+        self.horizon = horizon
+        self.label_cache = label_cache
+        self.dataset_cache = dataset_cache or DatasetCache()
+        self.rng = np.random.default_rng(seed)
+
+        cores = os.cpu_count() or 1
+        self.workers = workers or cores
+        self.threads = threads_per_worker or max(1, cores // self.workers)
+
+    # --------------------------------------------------
+    # CANDIDATES
+    # --------------------------------------------------
+
+    def _sample(self, n: int) -> list[dict]:
+        if self.method == "grid":
+            names = list(self.space)
+            combos = list(itertools.product(*self.space.values()))
+            order = self.rng.permutation(len(combos))[:n]
+            return [dict(zip(names, combos[i])) for i in order]
+
+        return [
+            {k: v[self.rng.integers(len(v))] for k, v in self.space.items()}
+            for _ in range(n)
+        ]
+
+    # --------------------------------------------------
+    # DATA
+    # --------------------------------------------------
+
+    def _split(self, features: pd.DataFrame):
+        model = AlphaModel(horizon=self.horizon, label_cache=self.label_cache)
+        df = model._prepare_target(features).dropna()
+
+        feature_cols = model.candidate_features(df)
+        when = as_datetime(df["date"])
+
+        dates = np.sort(when.unique())
+        cut = int(len(dates) * (1 - self.val_fraction))
+
+        # purge: training labels (h days ahead) must end before the fold
+        train = df[when < dates[max(cut - self.horizon, 0)]]
+        val = df[when >= dates[cut]]
+
+        return train, val, feature_cols, model.target
+
+    # --------------------------------------------------
+    # RUN
+    # --------------------------------------------------
+
+    def run(self, features: pd.DataFrame, save: bool = True) -> pd.DataFrame:
+        start = time.perf_counter()
+
+        train, val, feature_cols, target = self._split(features)
+
+        train_path = self.dataset_cache.binary(train[feature_cols], train[target], BASE_PARAMS)
+
+        print(
+            f"🔎 Hyperparam search → {self.method} | ≤{self.trials} trials | "
+            f"budget {self.budget_seconds:.0f}s | {len(train):,} train / {len(val):,} val rows | "
+            f"{self.workers} workers × {self.threads} threads"
+        )
+
+        initargs = (
+            str(train_path),
+            val[feature_cols].to_numpy(dtype=np.float64),
+            val[target].to_numpy(dtype=np.float64),
+            self.threads,
+        )
+
+        if self.workers > 1:
+            with ProcessPoolExecutor(
+                max_workers=self.workers, initializer=_init_worker, initargs=initargs
+            ) as pool:
+                results = self._search(lambda batch: list(pool.map(_run_trial, batch)), start)
+        else:
+            with scoped_threads(self.threads):
+                _load(*initargs)
+                results = self._search(lambda batch: [_run_trial(t) for t in batch], start)
+
+        table = self._table(results, feature_cols)
+
+        best = table.iloc[0]
+        print(
+            f"🏆 Best trial {best['trial']} → val RMSE {best['val_rmse']:.6f} "
+            f"@ {best['best_iteration']} rounds | {len(table)} trials | "
+            f"{time.perf_counter() - start:.1f}s"
+        )
+
+        if save:
+            self._save(table)
+
+        return table
+
+    def _search(self, evaluate, start: float) -> list[dict]:
+        def spent():
+            return time.perf_counter() - start >= self.budget_seconds
+
+        configs = self._sample(self.trials)
+        results = []
+
+        if self.method != "halving":
+            for lo in range(0, len(configs), self.workers):
+                if spent():
+                    break
+
+                batch = [
+                    self._trial(len(results) + i, c, self.max_rounds, 0)
+                    for i, c in enumerate(configs[lo:lo + self.workers])
+                ]
+                results += evaluate(batch)
+
+            return results
+
+        rounds, rung = self.min_rounds, 0
+        survivors = configs
+
+        while survivors and not spent():
+            batch = [self._trial(len(results) + i, c, rounds, rung) for i, c in enumerate(survivors)]
+            scored = sorted(evaluate(batch), key=lambda r: r["val_rmse"])
+            results += scored
+
+            if len(scored) == 1 or rounds >= self.max_rounds:
+                break
+
+            survivors = [r["params"] for r in scored[: max(1, len(scored) // self.eta)]]
+            rounds, rung = min(rounds * self.eta, self.max_rounds), rung + 1
+
+        return results
+
+    def _trial(self, trial_id: int, params: dict, rounds: int, rung: int) -> dict:
+        return {
+            "trial": trial_id,
+            "rung": rung,
+            "rounds": rounds,
+            "early_stopping": self.early_stopping,
+            "params": params,
+        }
+
+    def _table(self, results: list[dict], feature_cols: list[str]) -> pd.DataFrame:
+        if not results:
+            raise ValueError("Hyperparam search ran no trials (budget too small?)")
+
+        table = pd.DataFrame(results)
+        table = pd.concat([table.drop(columns=["params"]), pd.DataFrame(list(table["params"]))], axis=1)
+
+        table["method"] = self.method
+        table["horizon"] = self.horizon
+        table["features"] = ",".join(feature_cols)
+
+        # halving: a config's final word is its deepest rung
+        return table.sort_values(["rung", "val_rmse"], ascending=[False, True], kind="stable").reset_index(drop=True)
+
+    # --------------------------------------------------
+    # SAVE / PROMOTE
+    # --------------------------------------------------
+
+    def best(self, table: pd.DataFrame) -> dict:
+        row = table.iloc[0]
+        params = {k: row[k].item() if hasattr(row[k], "item") else row[k] for k in self.space}
+
+        return {
+            **AlphaModel.PARAMS,
+            **BASE_PARAMS,
+            **params,
+            "n_estimators": int(row["best_iteration"]),
+        }
+
+    def _save(self, table: pd.DataFrame) -> None:
+        TRIALS_PATH.parent.mkdir(parents=True, exist_ok=True)
+        table.to_parquet(TRIALS_PATH, index=False)
+        print(f"✓ hyperparam_trials.parquet created → {TRIALS_PATH}")
+
+        best = {
+            "params": self.best(table),
+            "val_rmse": float(table["val_rmse"].iloc[0]),
+            "method": self.method,
+            "horizon": self.horizon,
+        }
+
+        BEST_PARAMS_PATH.parent.mkdir(parents=True, exist_ok=True)
+        BEST_PARAMS_PATH.write_text(json.dumps(best, indent=2))
+        print(f"✓ alpha_params.json promoted → {BEST_PARAMS_PATH}")
+
+
+def promoted(path=BEST_PARAMS_PATH) -> dict | None:
+    """
+    Last promoted search: {"params", "val_rmse", "method", "horizon"}.
+    The params were tuned for that horizon only.
+    """
+    path = Path(path)
+
+    if not path.exists():
+        return None
+
+    return json.loads(path.read_text())
+
+
+def best_params(path=BEST_PARAMS_PATH) -> dict | None:
+    """
+    Promoted params from the last search, or None → AlphaModel.PARAMS.
+    """
+    best = promoted(path)
+    return best["params"] if best else None
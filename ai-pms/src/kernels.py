@@ -0,0 +1,269 @@
+"""
+Wide-matrix feature kernels.
+
+Replaces per-feature groupby(...).pct_change / groupby(...).rolling(...)
+chains with a single reshape into a 2D (row position × symbol) matrix:
+
+    GroupedMatrix(df["symbol"])  → layout computed once
+    .wide(df["close"])           → (max_rows, n_symbols) float array
+    kernels on axis 0            → returns / rolling mean, std, max / drawdown
+    .long(arr)                   → back to the frame's row order
+
+Rows are placed by their position within the symbol (frame order), not
+by calendar date, so a symbol with missing days behaves exactly like
+groupby: pct_change(k) looks k *rows* back and rolling windows span
+rows. Padding beyond a symbol's last row is NaN and never read back.
+
+NaN semantics match pandas: pct_change keeps NaN inputs as NaN, and a
+rolling window with any NaN (or fewer than `window` rows) is NaN.
+"""
+
+from __future__ import annotations
+
+import time
+
+import numpy as np
+import pandas as pd
+from numpy.lib.stride_tricks import sliding_window_view
+
+
+# cap on temporaries built by the windowed reductions (elements)
+BLOCK_ELEMENTS = 8_000_000
+
+
+# --------------------------------------------------
+# Layout
+# --------------------------------------------------
+
+class GroupedMatrix:
+    def __init__(self, keys: pd.Series):
+        codes, self.groups = pd.factorize(keys, sort=True)
+
+        # NaN keys (code -1) are dropped by groupby → NaN features here too
+        self.valid = codes >= 0
+        self.codes = codes[self.valid]
+        self.pos = self._positions(self.codes)
+        self.shape = (int(self.pos.max()) + 1 if len(self.pos) else 0, len(self.groups))
+
+        # flat offsets into the column-major matrix → one 1D take / put per column
+        self.flat = self.codes * self.shape[0] + self.pos
+
+    @staticmethod
+    def _positions(codes: np.ndarray) -> np.ndarray:
+        """
+        Row position of each row within its group, in frame order
+        (same as groupby(...).cumcount()).
+        """
+        if len(codes) == 0:
+            return codes
+
+        # frames sorted by symbol skip the argsort entirely
+        order = None if (np.diff(codes) >= 0).all() else np.argsort(codes, kind="stable")
+        ordered = codes if order is None else codes[order]
+
+        offsets = np.cumsum(np.bincount(ordered)) - np.bincount(ordered)
+        pos = np.arange(len(codes)) - offsets[ordered]
+
+        if order is None:
+            return pos
+
+        out = np.empty_like(pos)
+        out[order] = pos
+        return out
+
+    def wide(self, values) -> np.ndarray:
+        values = np.asarray(values, dtype=np.float64)
+
+        # column-major → each symbol's history is contiguous
+        out = np.full(self.shape, np.nan, order="F")
+        out.ravel(order="F")[self.flat] = values[self.valid]
+        return out
+
+    def long(self, arr: np.ndarray) -> np.ndarray:
+        flat = np.asfortranarray(arr).ravel(order="F")
+
+        if self.valid.all():
+            return flat[self.flat]
+
+        out = np.full(len(self.valid), np.nan)
+        out[self.valid] = flat[self.flat]
+        return out
+
+
+# --------------------------------------------------
+# Kernels (axis 0 = time within symbol)
+# --------------------------------------------------
+
+def shift(x: np.ndarray, k: int) -> np.ndarray:
+    out = np.full_like(x, np.nan)  # keeps x's memory order
+    if k < len(x):
+        out[k:] = x[:-k] if k else x
+    return out
+
+
+def pct_change(x: np.ndarray, k: int = 1) -> np.ndarray:
+    out = np.full_like(x, np.nan)
+
+    if k < len(x):
+        with np.errstate(divide="ignore", invalid="ignore"):
+            np.divide(x[k:], x[:-k], out=out[k:])
+        out[k:] -= 1
+
+    return out
+
+
+def returns(x: np.ndarray, horizons) -> dict[int, np.ndarray]:
+    return {k: pct_change(x, k) for k in horizons}
+
+
+def _trailing(c: np.ndarray, window: int) -> np.ndarray:
+    """
+    Trailing `window`-row differences of a cumulative sum (rows ≥ window-1).
+    """
+    out = c[window - 1:].copy(order="F")
+    out[1:] -= c[:-window]
+    return out
+
+
+def _window_count(finite: np.ndarray, window: int) -> np.ndarray:
+    return _trailing(np.cumsum(finite, axis=0, dtype=np.int32), window) == window
+
+
+def rolling_sum(x: np.ndarray, window: int) -> np.ndarray:
+    """
+    Trailing sums from one cumulative sum; rows whose window holds fewer
+    than `window` finite values are NaN.
+    """
+    out = np.full_like(x, np.nan)
+
+    if len(x) < window:
+        return out
+
+    finite = np.isfinite(x)
+    sums = _trailing(np.cumsum(np.where(finite, x, 0.0), axis=0), window)
+
+    out[window - 1:] = np.where(_window_count(finite, window), sums, np.nan)
+    return out
+
+
+def _rolling(x: np.ndarray, window: int, reduce) -> np.ndarray:
+    n = len(x)
+    out = np.full_like(x, np.nan)
+
+    if n < window:
+        return out
+
+    view = sliding_window_view(x, window, axis=0)
+    step = max(1, BLOCK_ELEMENTS // (window * max(x.shape[1], 1)))
+
+    # blocks of output rows keep the (rows, symbols, window) temporaries bounded
+    for lo in range(0, n - window + 1, step):
+        hi = min(lo + step, n - window + 1)
+        out[lo + window - 1:hi + window - 1] = reduce(view[lo:hi])
+
+    return out
+
+
+def rolling_mean(x: np.ndarray, window: int) -> np.ndarray:
+    return rolling_sum(x, window) / window
+
+
+def rolling_std(x: np.ndarray, window: int) -> np.ndarray:
+    return rolling_stds(x, (window,))[window]
+
+
+def rolling_stds(x: np.ndarray, windows) -> dict[int, np.ndarray]:
+    """
+    Sample std (ddof=1) per window. Every column is one symbol from row 0,
+    so pandas' rolling std over the wide matrix equals
+    groupby(...).rolling(w).std() bit for bit — including the exact zeros
+    its online update gives on flat stretches, which no cumulative-sum
+    formula reproduces.
+    """
+    frame = pd.DataFrame(x, copy=False)
+    return {w: frame.rolling(w).std().to_numpy() for w in windows}
+
+
+def rolling_max(x: np.ndarray, window: int) -> np.ndarray:
+    return _rolling(x, window, lambda v: v.max(axis=-1))
+
+
+def cummax(x: np.ndarray) -> np.ndarray:
+    # fmax skips NaN like pandas cummax; NaN rows themselves stay NaN
+    out = np.fmax.accumulate(x, axis=0)
+    out[np.isnan(x)] = np.nan
+    return out
+
+
+def drawdown(x: np.ndarray) -> np.ndarray:
+    return x / cummax(x) - 1
+
+
+# --------------------------------------------------
+# Benchmark vs the groupby chains
+# --------------------------------------------------
+
+def _groupby_features(df: pd.DataFrame) -> pd.DataFrame:
+    g = df.groupby("symbol")["close"]
+    out = pd.DataFrame(index=df.index)
+
+    out["ret_1d"] = g.pct_change()
+    for k in (5, 20, 60):
+        out[f"ret_{k}d"] = g.pct_change(k)
+    for w in (20, 60):
+        out[f"vol_{w}d"] = out.groupby(df["symbol"])["ret_1d"].rolling(w).std().reset_index(0, drop=True)
+    out["drawdown"] = df["close"] / g.cummax() - 1
+
+    return out
+
+
+def _kernel_features(df: pd.DataFrame) -> pd.DataFrame:
+    grid = GroupedMatrix(df["symbol"])
+    close = grid.wide(df["close"])
+    out = pd.DataFrame(index=df.index)
+
+    rets = returns(close, (1, 5, 20, 60))
+    out["ret_1d"] = grid.long(rets[1])
+    for k in (5, 20, 60):
+        out[f"ret_{k}d"] = grid.long(rets[k])
+    vols = rolling_stds(rets[1], (20, 60))
+    for w in (20, 60):
+        out[f"vol_{w}d"] = grid.long(vols[w])
+    out["drawdown"] = grid.long(drawdown(close))
+
+    return out
+
+
+def benchmark(sizes=(200, 2000), years: int = 14) -> pd.DataFrame:
+    """
+    groupby chains vs wide kernels on synthetic universes of each size.
+    """
+    from backtest.engines.nse_downloader import generate_synthetic_universe
+    from backtest.engines.parquet_spine import ParquetSpine
+    import tempfile
+
+    rows = []
+
+    for n in sizes:
+        with tempfile.TemporaryDirectory() as tmp:
+            generate_synthetic_universe(n_symbols=n, years=years, out_dir=tmp, layout="parquet")
+            df = ParquetSpine(tmp).read()
+
+        t0 = time.perf_counter()
+        slow = _groupby_features(df)
+        t1 = time.perf_counter()
+        fast = _kernel_features(df)
+        t2 = time.perf_counter()
+
+        rows.append(
+            {
+                "symbols": n,
+                "rows": len(df),
+                "groupby_s": t1 - t0,
+                "kernels_s": t2 - t1,
+                "speedup": (t1 - t0) / (t2 - t1),
+                "max_abs_diff": float(np.nanmax(np.abs(fast.to_numpy() - slow.to_numpy()))),
+            }
+        )
+
+    return pd.DataFrame(rows).set_index("symbols")
@@ -0,0 +1,117 @@
+"""
+Multi-horizon forward-return labels.
+
+    fwd_ret_{h}d(t) = ret_1d(t+1) + ... + ret_1d(t+h)     per symbol
+
+All horizons come from one pass over the wide (row × symbol) return
+matrix: one cumulative sum, then a lead of h rows per horizon. Rows
+whose forward window runs past the symbol's last row (or hits a
+missing return) are NaN.
+
+Labels are cached next to the feature store, keyed by a content hash of
+the (symbol, date, ret_1d) columns plus the label definition:
+
+    data/cache/features/labels/<key>.parquet
+
+The file grows to hold every horizon ever requested for that key, so
+training jobs at different horizons share one label build.
+"""
+
+from __future__ import annotations
+
+from pathlib import Path
+import hashlib
+import inspect
+import os
+
+import numpy as np
+import pandas as pd
+
+from src import kernels
+from src.config import FEATURE_STORE_DIR
+
+
+HORIZONS = [1, 5, 10, 20, 60]
+
+KEY_COLUMNS = ["symbol", "date"]
+
+
+def label_name(h: int) -> str:
+    return f"fwd_ret_{h}d"
+
+
+def is_label(column: str) -> bool:
+    return column.startswith("fwd_ret_")
+
+
+def forward_returns(df: pd.DataFrame, horizons=HORIZONS, key: str = "symbol") -> pd.DataFrame:
+    """
+    Label columns aligned to df's rows (in any row order).
+    """
+    # time order within each symbol, independent of how df is sorted
+    order = np.lexsort((df["date"].to_numpy(), df[key].to_numpy()))
+    ordered = df.iloc[order]
+
+    grid = kernels.GroupedMatrix(ordered[key])
+    ret = grid.wide(ordered["ret_1d"])
+
+    out = pd.DataFrame(index=df.index)
+
+    for h in horizons:
+        lead = np.full_like(ret, np.nan)
+        lead[:-h] = kernels.rolling_sum(ret, h)[h:]
+
+        values = np.empty(len(df))
+        values[order] = grid.long(lead)
+        out[label_name(h)] = values
+
+    return out
+
+
+def label_key(df: pd.DataFrame) -> str:
+    base = df[KEY_COLUMNS + ["ret_1d"]].sort_values(KEY_COLUMNS)
+
+    digest = hashlib.sha256(pd.util.hash_pandas_object(base, index=False).to_numpy().tobytes())
+    digest.update(inspect.getsource(forward_returns).encode())
+
+    return digest.hexdigest()[:20]
+
+
+class LabelCache:
+    def __init__(self, root: str | Path = FEATURE_STORE_DIR / "labels"):
+        self.root = Path(root)
+        self.stats = {"hits": 0, "built": 0}
+
+    def _path(self, key: str) -> Path:
+        return self.root / f"{key}.parquet"
+
+    def labels(self, df: pd.DataFrame, horizons=HORIZONS) -> pd.DataFrame:
+        """
+        Label columns for the requested horizons, aligned to df's rows.
+        Only horizons missing from the cache are computed.
+        """
+        path = self._path(label_key(df))
+        wanted = [label_name(h) for h in horizons]
+
+        cached = pd.read_parquet(path) if path.exists() else df[KEY_COLUMNS].copy()
+        missing = [h for h in horizons if label_name(h) not in cached.columns]
+
+        if missing:
+            built = forward_returns(df, missing)
+            built[KEY_COLUMNS] = df[KEY_COLUMNS]
+
+            cached = cached.merge(built, on=KEY_COLUMNS, how="left")
+
+            self.root.mkdir(parents=True, exist_ok=True)
+            tmp = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+            cached.to_parquet(tmp, index=False)
+            os.replace(tmp, path)
+
+            self.stats["built"] += len(missing)
+
+        self.stats["hits"] += len(horizons) - len(missing)
+
+        out = df[KEY_COLUMNS].merge(cached[KEY_COLUMNS + wanted], on=KEY_COLUMNS, how="left")
+        out.index = df.index
+
+        return out[wanted]
@@ -0,0 +1,158 @@
+"""
+Market-level regime features — one row per date.
+
+The regime HMM should see one market time series, not ~200 symbol
+series stacked end to end. Per-symbol features are collapsed per date:
+
+    ret_1d       equal-weight index proxy return (mean ret_1d)
+    vol_20d      20-day std of that index return
+    mom_20_60    median mom_20_60 across symbols
+    breadth      share of symbols with ret_1d > 0
+    dispersion   cross-sectional std of ret_1d
+
+Column names reuse the per-symbol ones where the meaning carries over,
+so the vol-quantile fallback and existing readers work unchanged.
+
+MarketStateCache keeps the series on disk and only aggregates dates
+after the last cached one, plus a 20-day tail for the index vol. A
+digest of the input rows up to the last cached date is stored next to
+it; if any of those rows changed (history revised on any date), the
+series is rebuilt from scratch.
+
+    data/cache/features/market_state.parquet
+    data/cache/features/market_state.json     → input digest
+"""
+
+from __future__ import annotations
+
+from pathlib import Path
+import json
+import os
+
+import numpy as np
+import pandas as pd
+
+from src import kernels
+from src.compact import as_datetime
+from src.config import FEATURE_STORE_DIR
+from src.cross_section import CrossSection, _nan_moments
+
+
+MARKET_FEATURES = ["ret_1d", "vol_20d", "mom_20_60", "breadth", "dispersion"]
+
+# per-symbol columns market_state() reads
+INPUT_FEATURES = ["ret_1d", "mom_20_60"]
+
+VOL_WINDOW = 20
+
+
+def _aggregate(features: pd.DataFrame) -> pd.DataFrame:
+    """
+    Per-date cross-sectional aggregates (everything except vol_20d).
+    """
+    cs = CrossSection(as_datetime(features["date"]))
+    n = cs.n_dates
+
+    wide = cs.wide(features[INPUT_FEATURES])
+    ret, mom = wide[:, :n], wide[:, n:]
+
+    with np.errstate(invalid="ignore"):
+        up = np.where(np.isnan(ret), np.nan, ret > 0)
+
+    index_ret, dispersion = _nan_moments(ret)
+
+    return pd.DataFrame(
+        {
+            "date": cs.grid.groups,
+            "ret_1d": index_ret,
+            "mom_20_60": _nanmedian(mom),
+            "breadth": _nan_moments(up)[0],
+            "dispersion": dispersion,
+        }
+    )
+
+
+def _nanmedian(x: np.ndarray) -> np.ndarray:
+    out = np.full(x.shape[1], np.nan)
+    has = (~np.isnan(x)).any(axis=0)
+
+    if has.any():
+        out[has] = np.nanmedian(x[:, has], axis=0)
+
+    return out
+
+
+def _with_vol(agg: pd.DataFrame) -> pd.DataFrame:
+    ret = agg["ret_1d"].to_numpy()[:, None]
+    agg["vol_20d"] = kernels.rolling_std(ret, VOL_WINDOW)[:, 0]
+    return agg[["date", *MARKET_FEATURES]]
+
+
+def market_state(features: pd.DataFrame) -> pd.DataFrame:
+    """
+    Long per-symbol features → one row per date (sorted by date).
+    """
+    return _with_vol(_aggregate(features))
+
+
+def input_digest(features: pd.DataFrame) -> str:
+    """
+    Row-order independent digest of the columns market_state() reads →
+    O(rows) hashing, no sort and no re-aggregation.
+    """
+    rows = pd.util.hash_pandas_object(features[["date", "symbol", *INPUT_FEATURES]], index=False)
+    return f"{len(rows)}:{int(rows.to_numpy().sum(dtype=np.uint64))}"
+
+
+class MarketStateCache:
+    def __init__(self, path: str | Path = FEATURE_STORE_DIR / "market_state.parquet"):
+        self.path = Path(path)
+        self.meta_path = self.path.with_suffix(".json")
+        self.stats = {"new_dates": 0, "rebuilt": False}
+
+    def _cached_digest(self) -> str | None:
+        try:
+            return json.loads(self.meta_path.read_text())["digest"]
+        except (OSError, ValueError, KeyError):
+            return None
+
+    def update(self, features: pd.DataFrame) -> pd.DataFrame:
+        self.stats = {"new_dates": 0, "rebuilt": False}
+        when = as_datetime(features["date"])
+
+        if not self.path.exists():
+            return self._write(market_state(features), features, rebuilt=True)
+
+        cached = pd.read_parquet(self.path)
+        last = cached["date"].max()
+
+        # every input row up to the last cached date → catches revisions anywhere
+        if input_digest(features[when <= last]) != self._cached_digest():
+            return self._write(market_state(features), features, rebuilt=True)
+
+        new = features[when > last]
+        if new.empty:
+            return cached
+
+        # vol_20d needs the previous window - 1 index returns
+        tail = cached.iloc[-(VOL_WINDOW - 1):][["date", "ret_1d", "mom_20_60", "breadth", "dispersion"]]
+        fresh = _with_vol(pd.concat([tail, _aggregate(new)], ignore_index=True)).iloc[len(tail):]
+
+        self.stats["new_dates"] = len(fresh)
+        return self._write(pd.concat([cached, fresh], ignore_index=True), features)
+
+    def _write(self, df: pd.DataFrame, features: pd.DataFrame, rebuilt: bool = False) -> pd.DataFrame:
+        self.stats["rebuilt"] = rebuilt
+        if rebuilt:
+            self.stats["new_dates"] = len(df)
+
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = self.path.with_name(f"{self.path.name}.{os.getpid()}.tmp")
+        df.to_parquet(tmp, index=False)
+        os.replace(tmp, self.path)
+
+        tmp = self.meta_path.with_name(f"{self.meta_path.name}.{os.getpid()}.tmp")
+        tmp.write_text(json.dumps({"digest": input_digest(features)}))
+        os.replace(tmp, self.meta_path)
+
+        return df
@@ -0,0 +1,175 @@
+"""
+Local model registry.
+
+Trained AlphaModels are stored under a key built from
+
+    training data fingerprint   (content hash of the feature frame)
+    feature list                (columns the model trains on)
+    hyperparameters + horizon
+
+    data/cache/models/<key>/model.pkl
+    data/cache/models/<key>/meta.json     → metrics, features, params, timestamps
+    data/cache/models/_index.json
+
+run_alpha_engine asks the registry first and only retrains when the key
+is new. prune() keeps the `keep` most recently used models and drops
+anything unused for longer than `max_age_days`.
+"""
+
+from __future__ import annotations
+
+from datetime import datetime, timezone
+from pathlib import Path
+import hashlib
+import json
+import os
+import shutil
+import time
+
+import pandas as pd
+
+from src.config import MODEL_REGISTRY_DIR
+
+
+def data_fingerprint(df: pd.DataFrame) -> str:
+    df = df.sort_values(["symbol", "date"])
+
+    digest = hashlib.sha256(pd.util.hash_pandas_object(df, index=False).to_numpy().tobytes())
+    digest.update(",".join(df.columns).encode())
+
+    return digest.hexdigest()
+
+
+class ModelRegistry:
+    INDEX = "_index.json"
+
+    def __init__(
+        self,
+        root: str | Path = MODEL_REGISTRY_DIR,
+        keep: int = 5,
+        max_age_days: float | None = 90,
+    ):
+        self.root = Path(root)
+        self.keep = keep
+        self.max_age_days = max_age_days
+        self.index = self._load_index()
+
+    # --------------------------------------------------
+    # INDEX
+    # --------------------------------------------------
+
+    def _load_index(self) -> dict:
+        path = self.root / self.INDEX
+
+        if path.exists():
+            try:
+                return json.loads(path.read_text())
+            except (OSError, ValueError):
+                pass
+
+        return {}
+
+    def _save_index(self) -> None:
+        self.root.mkdir(parents=True, exist_ok=True)
+
+        path = self.root / self.INDEX
+        tmp = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+        tmp.write_text(json.dumps(self.index, indent=2, sort_keys=True))
+        os.replace(tmp, path)
+
+    def keys(self) -> list[str]:
+        return list(self.index)
+
+    # --------------------------------------------------
+    # KEYS
+    # --------------------------------------------------
+
+    def key(self, df: pd.DataFrame, model) -> str:
+        spec = {
+            "features": model.candidate_features(df),
+            "params": model.params,
+            "horizon": model.horizon,
+        }
+
+        digest = hashlib.sha256(data_fingerprint(df).encode())
+        digest.update(json.dumps(spec, sort_keys=True, default=str).encode())
+
+        return digest.hexdigest()[:20]
+
+    # --------------------------------------------------
+    # LOAD / SAVE
+    # --------------------------------------------------
+
+    def load(self, key: str, model) -> bool:
+        """
+        Restores model in place from the registry; False on a miss.
+        """
+        path = self.root / key / "model.pkl"
+
+        if key not in self.index or not path.exists():
+            return False
+
+        model.load(path)
+        model.metrics = self.index[key].get("metrics", {})
+
+        self.index[key]["last_used"] = time.time()
+        self._save_index()
+
+        return True
+
+    def save(self, key: str, model) -> Path | None:
+        if not model.trained:
+            return None
+
+        folder = self.root / key
+        folder.mkdir(parents=True, exist_ok=True)
+
+        tmp = folder / f"model.pkl.{os.getpid()}.tmp"
+        model.save(tmp)
+        os.replace(tmp, folder / "model.pkl")
+
+        now = time.time()
+        meta = {
+            "metrics": model.metrics,
+            "features": model.feature_cols,
+            "params": model.params,
+            "horizon": model.horizon,
+            "trained_at": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+            "created": now,
+            "last_used": now,
+        }
+
+        (folder / "meta.json").write_text(json.dumps(meta, indent=2, default=str))
+
+        self.index[key] = meta
+        self._save_index()
+
+        return folder / "model.pkl"
+
+    # --------------------------------------------------
+    # RETENTION
+    # --------------------------------------------------
+
+    def prune(self, protect: str | None = None) -> list[str]:
+        by_recency = sorted(self.index, key=lambda k: self.index[k]["last_used"], reverse=True)
+        cutoff = time.time() - self.max_age_days * 86400 if self.max_age_days is not None else None
+
+        dropped = []
+
+        for rank, key in enumerate(by_recency):
+            if key == protect:
+                continue
+
+            too_many = rank >= self.keep
+            too_old = cutoff is not None and self.index[key]["last_used"] < cutoff
+
+            if too_many or too_old:
+                shutil.rmtree(self.root / key, ignore_errors=True)
+                del self.index[key]
+                dropped.append(key)
+
+        if dropped:
+            self._save_index()
+            print(f"🧹 Model registry pruned {len(dropped)} model(s)")
+
+        return dropped
@@ -1,6 +1,9 @@
+import time
+
 import pandas as pd
 import numpy as np
 import cvxpy as cp
+from cvxpy.settings import EIGVAL_TOL
 
 
 class PortfolioOptimizer:
@@ -13,10 +16,22 @@ class PortfolioOptimizer:
     - solver failures
 
     Always returns valid weights.
+
+    The cvxpy problem is built once per universe size with Parameters
+    (mu, covariance factor F with F F' = Sigma, lower / upper bounds) and
+    re-solved with a warm start from the previous weights, so weekly
+    rebalances skip canonicalization. timings holds compile and solve
+    seconds for every solve.
     """
 
-    def __init__(self, max_weight: float = 0.1):
+    def __init__(self, max_weight: float = 0.1, min_weight: float = 0.0, solver: str | None = None):
         self.max_weight = max_weight
+        self.min_weight = min_weight
+        self.solver = solver
+
+        self._problems: dict[int, dict] = {}
+        self._previous: pd.Series | None = None
+        self.timings: list[dict] = []
 
     def _equal_weight_fallback(self, symbols):
         n = len(symbols)
@@ -34,6 +49,86 @@ class PortfolioOptimizer:
             "weight": weights
         })
 
+    # --------------------------------------------------
+    # PARAMETERIZED PROBLEM (one per universe size)
+    # --------------------------------------------------
+
+    def _problem(self, n: int) -> dict:
+        if n not in self._problems:
+            w = cp.Variable(n)
+            mu = cp.Parameter(n)
+            factor = cp.Parameter((n, n))
+            lower = cp.Parameter(n)
+            upper = cp.Parameter(n)
+
+            # w' Sigma w = ||F' w||² → DPP, so cvxpy caches the canonical form
+            objective = cp.Maximize(mu @ w - 0.5 * cp.sum_squares(factor.T @ w))
+
+            constraints = [
+                cp.sum(w) == 1,
+                w >= lower,
+                w <= upper,
+            ]
+
+            self._problems[n] = {
+                "problem": cp.Problem(objective, constraints),
+                "w": w, "mu": mu, "factor": factor, "lower": lower, "upper": upper,
+            }
+
+        return self._problems[n]
+
+    @staticmethod
+    def _factor(Sigma: np.ndarray) -> np.ndarray:
+        """
+        F with F F' = Sigma; raises where cp.quad_form would reject Sigma.
+        """
+        if not np.allclose(Sigma, Sigma.T):
+            raise ValueError("Covariance matrix must be symmetric.")
+
+        eigval, eigvec = np.linalg.eigh(Sigma)
+
+        if eigval.min() < -EIGVAL_TOL:
+            raise ValueError("Covariance matrix is not positive semidefinite.")
+
+        return eigvec * np.sqrt(np.clip(eigval, 0, None))
+
+    def _solve(self, assets, mu: np.ndarray, Sigma: np.ndarray):
+        n = len(mu)
+        compiled = n not in self._problems
+        p = self._problem(n)
+
+        p["mu"].value = mu
+        p["factor"].value = self._factor(Sigma)
+        p["lower"].value = np.full(n, self.min_weight)
+        p["upper"].value = np.full(n, self.max_weight)
+
+        # warm start from the last weights (new names start at 0)
+        if self._previous is not None:
+            p["w"].value = self._previous.reindex(assets).fillna(0).to_numpy()
+
+        start = time.perf_counter()
+        p["problem"].solve(solver=self.solver, warm_start=True)
+        total = time.perf_counter() - start
+
+        stats = p["problem"].solver_stats
+        self.timings.append(
+            {
+                "n": n,
+                "compiled": compiled,
+                "compile_s": p["problem"].compilation_time,
+                "solve_s": stats.solve_time if stats.solve_time is not None else np.nan,
+                "total_s": total,
+                "status": p["problem"].status,
+            }
+        )
+
+        w = p["w"].value
+        return None if w is None else w.copy()
+
+    # --------------------------------------------------
+    # OPTIMIZE
+    # --------------------------------------------------
+
     def optimize(self, alpha_df: pd.DataFrame, cov_matrix: pd.DataFrame):
         # ⭐ SAFETY 1 — empty alpha
         if alpha_df is None or len(alpha_df) == 0:
@@ -60,27 +155,18 @@ class PortfolioOptimizer:
             return self._equal_weight_fallback(assets)
 
         try:
-            w = cp.Variable(n)
-
-            objective = cp.Maximize(mu @ w - 0.5 * cp.quad_form(w, Sigma))
-
-            constraints = [
-                cp.sum(w) == 1,
-                w >= 0,
-                w <= self.max_weight,
-            ]
-
-            prob = cp.Problem(objective, constraints)
-            prob.solve()
+            w = self._solve(assets, mu, Sigma)
 
             # ⭐ SAFETY 4 — solver failure
-            if w.value is None:
+            if w is None:
                 print("⚠️ Optimizer failed → equal-weight fallback.")
                 return self._equal_weight_fallback(assets)
 
+            self._previous = pd.Series(w, index=assets)
+
             return pd.DataFrame({
                 "symbol": assets,
-                "weight": w.value
+                "weight": w
             })
 
         except Exception as e:
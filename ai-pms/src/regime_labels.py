@@ -0,0 +1,114 @@
+"""
+Vectorized regime labelling.
+
+    quantile_regimes   vol-quantile one-hot regimes (the HMM fallback)
+    week_start         Monday 00:00 of each date's W-SUN week
+                       (= to_period("W").start_time, without the per-row apply)
+    weekly_confirmed   weekly mean probabilities + confirmed_regime label
+
+Optional smoothing of a label sequence (both whole-array ops):
+
+    hysteresis   keep the current regime until another one's probability
+                 reaches `threshold`
+    min_dwell    runs shorter than `min_dwell` steps take the label of the
+                 preceding run (run-length encode → forward fill)
+"""
+
+from __future__ import annotations
+
+import numpy as np
+import pandas as pd
+
+from src.compact import as_datetime
+
+
+def _cuts(n_states: int) -> list[float]:
+    # 3 states keep the original 33 / 66 split
+    return [0.33, 0.66] if n_states == 3 else list(np.arange(1, n_states) / n_states)
+
+
+def quantile_regimes(vol: pd.Series, n_states: int = 3) -> np.ndarray:
+    """
+    One-hot (rows × n_states): regime i ⇔ vol between quantile i-1 and i.
+    NaN vol lands in the top regime, as in the original row loop.
+    """
+    q = vol.quantile(_cuts(n_states)).to_numpy()
+    v = vol.to_numpy(dtype=np.float64)[:, None]
+
+    # number of cut points strictly below v (NaN compares False → all)
+    label = len(q) - (v <= q).sum(axis=1)
+
+    return np.eye(n_states)[label]
+
+
+def week_start(dates) -> pd.Series:
+    d = as_datetime(pd.Series(dates)).dt.normalize()
+    return d - pd.to_timedelta(d.dt.weekday, unit="D")
+
+
+def hysteresis(probs: np.ndarray, threshold: float = 0.6) -> np.ndarray:
+    """
+    Argmax labels that only switch on a confident (≥ threshold) reading.
+    """
+    probs = np.asarray(probs, dtype=np.float64)
+    argmax = np.nan_to_num(probs, nan=-np.inf).argmax(axis=1)
+
+    steps = np.arange(len(probs))
+    confident = np.nanmax(np.where(np.isnan(probs), -np.inf, probs), axis=1) >= threshold
+
+    # last confident step at or before t (-1 → none yet → own argmax)
+    last = np.maximum.accumulate(np.where(confident, steps, -1))
+
+    return np.where(last >= 0, argmax[np.maximum(last, 0)], argmax)
+
+
+def min_dwell(labels, k: int) -> np.ndarray:
+    """
+    Runs shorter than k take the label of the last run that is long enough.
+    """
+    labels = np.asarray(labels)
+    if k <= 1 or len(labels) == 0:
+        return labels
+
+    starts = np.flatnonzero(np.r_[True, labels[1:] != labels[:-1]])
+    lengths = np.diff(np.r_[starts, len(labels)])
+
+    # the first run has nothing before it → always kept
+    keep = lengths >= k
+    keep[0] = True
+
+    run = np.maximum.accumulate(np.where(keep, np.arange(len(starts)), 0))
+
+    return np.repeat(labels[starts[run]], lengths)
+
+
+def weekly_confirmed(
+    daily_probs: pd.DataFrame,
+    threshold: float | None = None,
+    dwell: int = 1,
+) -> pd.DataFrame:
+    """
+    Weekly mean regime probabilities + confirmed_regime. threshold → label
+    hysteresis; dwell → minimum run length in weeks.
+    """
+    regime_cols = [c for c in daily_probs.columns if c.startswith("regime_")]
+
+    weekly = (
+        daily_probs[regime_cols]
+        .groupby(week_start(daily_probs["date"]).to_numpy())
+        .mean()
+        .rename_axis("date")
+        .reset_index()
+    )
+
+    weekly["confirmed_regime"] = weekly[regime_cols].idxmax(axis=1)
+
+    if threshold is not None or dwell > 1:
+        codes = (
+            hysteresis(weekly[regime_cols].to_numpy(), threshold)
+            if threshold is not None
+            else weekly[regime_cols].to_numpy().argmax(axis=1)
+        )
+        weekly["confirmed_regime"] = np.asarray(regime_cols)[min_dwell(codes, dwell)]
+
+    return weekly
@@ -3,27 +3,151 @@ FINAL Regime Detection Model — Production Safe
 • Stable HMM with fail-safe fallback
 • Weekly confirmed regime label
 • Guaranteed test compatibility
+• Online forward filtering between refits
+
+Online mode: after a fit the detector keeps the filtered state
+P(regime | rows so far) at the last row. update(new_rows) advances it
+one forward step per row, O(new rows × n_states²), without touching the
+history. Each step also yields the predictive log-likelihood
+log p(x_t | x_<t), which feeds the drift test in needs_refit():
+
+    scheduled   last fit older than refit_every_days
+    drift       mean log-likelihood of the last drift_window rows sits
+                more than drift_z standard errors below the training mean
+
+The training mean is in-sample (the HMM was fitted on those rows), so
+it sits above what unseen rows score even without drift → the z-score
+is biased upward and drift_z is deliberately conservative.
+
+Daily history that online updates extend must come from the same
+forward filter: predict_daily_probabilities(df, filtered=True). The
+default (smoothed, forward-backward) uses later rows and would switch
+meaning at the last fit date.
 """
 
 from __future__ import annotations
 
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+import os
+import time
+
+import joblib
 import numpy as np
 import pandas as pd
 from hmmlearn.hmm import GaussianHMM
 
+from src import regime_labels
+from src.compact import as_datetime
+
+
+# --------------------------------------------------
+# Restart worker
+# --------------------------------------------------
+
+_DATA: dict = {}
+
+
+def _init_worker(X: np.ndarray):
+    _DATA["X"] = X
+
+
+def _fit_restart(candidate: tuple[int, int]) -> dict:
+    n_states, seed = candidate
+    X = _DATA["X"]
+
+    out = {"n_states": n_states, "seed": seed, "valid": False, "model": None}
+    start = time.perf_counter()
+
+    try:
+        model = GaussianHMM(
+            n_components=n_states,
+            covariance_type="full",
+            n_iter=200,
+            random_state=seed,
+        )
+
+        model.fit(X)
+
+        # validate learned params
+        valid = (
+            np.isfinite(model.startprob_).all()
+            and not np.isnan(model.transmat_).any()
+            and not np.isnan(model.covars_).any()
+        )
+
+        out.update(
+            converged=bool(model.monitor_.converged),
+            n_iter=int(model.monitor_.iter),
+            loglik=float(model.score(X)),
+            bic=float(model.bic(X)),
+            valid=bool(valid),
+            model=model if valid else None,
+        )
+
+    except Exception as e:
+        out["error"] = str(e)
+
+    out["seconds"] = time.perf_counter() - start
+    return out
+
 
 class RegimeDetector:
-    def __init__(self, n_states: int = 3):
+    # registry features the HMM reads → callers can build only these
+    FEATURES = ["ret_1d", "vol_20d", "mom_20_60"]
+
+    def __init__(
+        self,
+        n_states: int = 3,
+        refit_every_days: int = 30,
+        drift_window: int = 250,
+        drift_z: float = 4.0,
+        restarts: int = 1,
+        state_counts: list[int] | None = None,
+        criterion: str | None = None,
+        workers: int | None = None,
+        features: list[str] | None = None,
+    ):
+        # loglik never penalises extra states → across k it always picks the largest
+        several_k = len(set(state_counts or [n_states])) > 1
+        criterion = criterion or ("bic" if several_k else "loglik")
+
+        if criterion not in {"loglik", "bic"}:
+            raise ValueError(f"Unknown criterion: {criterion}")
+        if criterion == "loglik" and several_k:
+            raise ValueError("criterion='loglik' cannot compare state counts (always picks the largest) → use 'bic'")
+
         self.n_states = n_states
         self.model: GaussianHMM | None = None
         self.fallback_mode = False
 
+        # HMM input columns → market_state.MARKET_FEATURES for the per-date series
+        self.features = features or self.FEATURES
+
+        # restarts × state_counts EM runs; best by loglik (fixed k) or bic (default across k)
+        self.restarts = restarts
+        self.state_counts = state_counts
+        self.criterion = criterion
+        self.workers = workers or os.cpu_count() or 1
+        self.restart_diagnostics = pd.DataFrame()
+
+        # online state
+        self.refit_every_days = refit_every_days
+        self.drift_window = drift_window
+        self.drift_z = drift_z
+
+        self.state: np.ndarray | None = None   # filtered P(regime) at the last row
+        self.fitted_at = None                  # last date in the training data
+        self.last_date = None                  # last date filtered
+        self.loglik_baseline: tuple[float, float] | None = None
+        self.recent_loglik = np.empty(0)
+
     # --------------------------------------------------
     # FEATURE MATRIX
     # --------------------------------------------------
 
     def _prepare_X(self, df: pd.DataFrame) -> np.ndarray:
-        X = df[["ret_1d", "vol_20d", "mom_20_60"]].copy()
+        X = df[self.features].copy()
         X = X.replace([np.inf, -np.inf], np.nan).dropna()
 
         if len(X) < 50:
@@ -35,53 +159,225 @@ class RegimeDetector:
         return X.values
 
     # --------------------------------------------------
-    # FIT (fail-safe)
+    # FIT (fail-safe, optional multi-restart)
     # --------------------------------------------------
 
+    def _candidates(self) -> list[tuple[int, int]]:
+        # seed 42 first → restarts=1 is the original single fit
+        counts = self.state_counts or [self.n_states]
+        return [(k, 42 + r) for k in counts for r in range(self.restarts)]
+
     def fit(self, df: pd.DataFrame) -> None:
         try:
             X = self._prepare_X(df)
+            candidates = self._candidates()
 
-            model = GaussianHMM(
-                n_components=self.n_states,
-                covariance_type="full",
-                n_iter=200,
-                random_state=42,
-            )
+            if self.workers > 1 and len(candidates) > 1:
+                with ProcessPoolExecutor(
+                    max_workers=self.workers, initializer=_init_worker, initargs=(X,)
+                ) as pool:
+                    results = list(pool.map(_fit_restart, candidates))
+            else:
+                _init_worker(X)
+                results = [_fit_restart(c) for c in candidates]
 
-            model.fit(X)
+            self.restart_diagnostics = pd.DataFrame(
+                [{k: v for k, v in r.items() if k != "model"} for r in results]
+            )
 
-            # validate learned params
-            if (
-                not np.isfinite(model.startprob_).all()
-                or np.isnan(model.transmat_).any()
-                or np.isnan(model.covars_).any()
-            ):
+            valid = [r for r in results if r["valid"]]
+            if not valid:
                 raise ValueError("Invalid trained HMM")
 
-            self.model = model
+            if self.criterion == "bic":
+                best = min(valid, key=lambda r: r["bic"])
+            else:
+                best = max(valid, key=lambda r: r["loglik"])
+
+            self.restart_diagnostics["selected"] = (
+                (self.restart_diagnostics["n_states"] == best["n_states"])
+                & (self.restart_diagnostics["seed"] == best["seed"])
+            )
+
+            self.model = best["model"]
+            self.n_states = best["n_states"]
             self.fallback_mode = False
 
+            self._reset_online_state(df)
+
         except Exception:
             # institutional fail-safe
             self.model = None
             self.fallback_mode = True
 
+    # --------------------------------------------------
+    # FORWARD FILTER
+    # --------------------------------------------------
+
+    def _log_emissions(self, X: np.ndarray) -> np.ndarray:
+        """
+        log N(x_t | mean_k, cov_k) for every row × state.
+        """
+        n, d = X.shape
+        out = np.empty((n, self.n_states))
+
+        for k in range(self.n_states):
+            cov = self.model.covars_[k]
+            try:
+                chol = np.linalg.cholesky(cov)
+            except np.linalg.LinAlgError:
+                # same regularisation hmmlearn falls back to
+                chol = np.linalg.cholesky(cov + self.model.min_covar * np.eye(d))
+            z = np.linalg.solve(chol, (X - self.model.means_[k]).T)
+
+            log_det = 2 * np.log(np.diag(chol)).sum()
+            out[:, k] = -0.5 * (d * np.log(2 * np.pi) + log_det + (z * z).sum(axis=0))
+
+        return out
+
+    def filter(self, X: np.ndarray, prior: np.ndarray | None = None):
+        """
+        Forward pass from `prior` (filtered state before X; None → start).
+        Returns (filtered probs per row, predictive log-likelihood per row).
+        """
+        log_b = self._log_emissions(X)
+        shift = log_b.max(axis=1, keepdims=True)
+        b = np.exp(log_b - shift)
+
+        A = self.model.transmat_
+        probs = np.empty_like(b)
+        loglik = np.empty(len(X))
+
+        alpha = prior
+
+        for t in range(len(X)):
+            pred = self.model.startprob_ if alpha is None else alpha @ A
+            a = pred * b[t]
+
+            c = a.sum()
+            alpha = a / c
+
+            probs[t] = alpha
+            loglik[t] = np.log(c) + shift[t, 0]
+
+        return probs, loglik
+
+    def _clean(self, df: pd.DataFrame) -> pd.DataFrame:
+        return df[self.features].replace([np.inf, -np.inf], np.nan).dropna()
+
+    def _reset_online_state(self, df: pd.DataFrame) -> None:
+        X = self._clean(df)
+        probs, loglik = self.filter(X.values)
+
+        self.state = probs[-1]
+        # in-sample → biased high vs new rows (see module docstring)
+        self.loglik_baseline = (float(loglik.mean()), float(loglik.std()))
+        self.recent_loglik = np.empty(0)
+
+        self.fitted_at = as_datetime(df.loc[X.index, "date"]).max()
+        self.last_date = self.fitted_at
+
+    # --------------------------------------------------
+    # ONLINE UPDATE
+    # --------------------------------------------------
+
+    def update(self, new_rows: pd.DataFrame) -> pd.DataFrame:
+        """
+        Advances the filtered regime probabilities over new_rows only.
+        """
+        if self.fallback_mode or self.model is None or self.state is None:
+            return self._fallback_probabilities(new_rows)
+
+        X = self._clean(new_rows)
+
+        out = new_rows.loc[X.index, ["date"]].copy()
+
+        if not len(X):
+            return out.reset_index(drop=True)
+
+        probs, loglik = self.filter(X.values, prior=self.state)
+
+        self.state = probs[-1]
+        self.last_date = as_datetime(out["date"]).max()
+        self.recent_loglik = np.r_[self.recent_loglik, loglik][-self.drift_window:]
+
+        for i in range(self.n_states):
+            out[f"regime_{i}"] = probs[:, i]
+
+        return out.reset_index(drop=True)
+
+    def needs_refit(self, today=None) -> str | None:
+        """
+        Reason for a full refit, or None while the online state is trusted.
+        """
+        if self.model is None or self.state is None:
+            return "no model"
+
+        today = pd.Timestamp(today) if today is not None else self.last_date
+        if (today - self.fitted_at).days >= self.refit_every_days:
+            return "scheduled"
+
+        mean, std = self.loglik_baseline
+        n = len(self.recent_loglik)
+
+        if n >= min(self.drift_window, 20) and std > 0:
+            z = (mean - self.recent_loglik.mean()) / (std / np.sqrt(n))
+            if z > self.drift_z:
+                return f"log-likelihood drift (z={z:.1f})"
+
+        return None
+
+    # --------------------------------------------------
+    # PERSISTENCE
+    # --------------------------------------------------
+
+    STATE_FIELDS = [
+        "n_states", "features", "model", "fallback_mode",
+        "refit_every_days", "drift_window", "drift_z",
+        "state", "fitted_at", "last_date", "loglik_baseline", "recent_loglik",
+        "restart_diagnostics",
+    ]
+
+    def save(self, path: str | Path) -> None:
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        joblib.dump({k: getattr(self, k) for k in self.STATE_FIELDS}, path)
+
+    @classmethod
+    def load(cls, path: str | Path) -> "RegimeDetector":
+        saved = joblib.load(path)
+
+        detector = cls(n_states=saved["n_states"])
+        for k, v in saved.items():
+            setattr(detector, k, v)
+
+        return detector
+
     # --------------------------------------------------
     # DAILY PROBABILITIES
     # --------------------------------------------------
 
-    def predict_daily_probabilities(self, df: pd.DataFrame) -> pd.DataFrame:
+    def predict_daily_probabilities(self, df: pd.DataFrame, filtered: bool = False) -> pd.DataFrame:
+        """
+        filtered=False → smoothed P(regime | all rows), uses later rows
+        filtered=True  → forward-only P(regime | rows so far), the series
+                         update() continues
+        """
         if self.fallback_mode or self.model is None:
             return self._fallback_probabilities(df)
 
         try:
-            X = self._prepare_X(df)
-            probs = self.model.predict_proba(X)
+            if filtered:
+                X = self._clean(df)
+                probs, _ = self.filter(X.values)
+                rows = X.index
+            else:
+                probs = self.model.predict_proba(self._prepare_X(df))
+                rows = df.index[-len(probs):]
         except Exception:
             return self._fallback_probabilities(df)
 
-        out = df.loc[df.index[-len(probs):], ["date"]].copy()
+        out = df.loc[rows, ["date"]].copy()
 
         for i in range(self.n_states):
             out[f"regime_{i}"] = probs[:, i]
@@ -92,41 +388,21 @@ class RegimeDetector:
     # WEEKLY CONFIRMED REGIME  ⭐ FINAL FIX
     # --------------------------------------------------
 
-    def weekly_confirmed_regime(self, daily_probs: pd.DataFrame) -> pd.DataFrame:
-        df = daily_probs.copy()
-        df["week"] = pd.to_datetime(df["date"]).dt.to_period("W").apply(lambda r: r.start_time)
-
-        regime_cols = [c for c in df.columns if c.startswith("regime_")]
-
-        weekly = (
-            df.groupby("week")[regime_cols]
-            .mean()
-            .reset_index()
-            .rename(columns={"week": "date"})
-        )
-
-        # ⭐ institutional confirmed regime label
-        weekly["confirmed_regime"] = weekly[regime_cols].idxmax(axis=1)
-
-        return weekly
+    def weekly_confirmed_regime(
+        self,
+        daily_probs: pd.DataFrame,
+        threshold: float | None = None,
+        min_dwell: int = 1,
+    ) -> pd.DataFrame:
+        # ⭐ institutional confirmed regime label (optional hysteresis / min dwell in weeks)
+        return regime_labels.weekly_confirmed(daily_probs, threshold=threshold, dwell=min_dwell)
 
     # --------------------------------------------------
     # FALLBACK REGIME
     # --------------------------------------------------
 
     def _fallback_probabilities(self, df: pd.DataFrame) -> pd.DataFrame:
-        vol = df["vol_20d"].ffill()
-
-        q = vol.quantile([0.33, 0.66]).values
-        regimes = np.zeros((len(vol), self.n_states))
-
-        for i, v in enumerate(vol):
-            if v <= q[0]:
-                regimes[i, 0] = 1
-            elif v <= q[1]:
-                regimes[i, 1] = 1
-            else:
-                regimes[i, 2] = 1
+        regimes = regime_labels.quantile_regimes(df["vol_20d"].ffill(), self.n_states)
 
         out = df[["date"]].copy()
 
@@ -0,0 +1,168 @@
+"""
+Daily retraining policy for AlphaModel.
+
+    incremental → warm start from the saved booster (init_model) and add
+                  a bounded number of trees on a recent window
+    full        → refit from scratch on the whole history
+
+A full refit is forced when
+
+    • there is no usable previous model (or its feature list changed)
+    • the previous booster was trained with other params / horizon
+    • the last full refit is older than full_every_days
+    • the booster would grow past max_trees
+    • the previous model's RMSE on the newly labelled days (true OOS)
+      is worse than its baseline by more than degrade_tolerance
+
+Every run returns a report with mode, reason, wall time, the OOS RMSE of
+the previous model on the new days, and the refreshed model's size.
+compare_modes() runs both paths on the same split for a side-by-side.
+"""
+
+from __future__ import annotations
+
+import time
+
+import numpy as np
+import pandas as pd
+
+from src.alpha_model import AlphaModel
+from src.compact import as_datetime
+
+
+class RetrainPolicy:
+    def __init__(
+        self,
+        full_every_days: int = 30,
+        max_trees: int = 400,
+        window_days: int = 60,
+        extra_trees: int = 20,
+        degrade_tolerance: float = 0.10,
+    ):
+        self.full_every_days = full_every_days
+        self.max_trees = max_trees
+        self.window_days = window_days
+        self.extra_trees = extra_trees
+        self.degrade_tolerance = degrade_tolerance
+
+
+def _rmse(model: AlphaModel, df: pd.DataFrame) -> float | None:
+    if df.empty:
+        return None
+
+    pred = model.model.predict(df[model.feature_cols])
+    return float(np.sqrt(np.mean((df[model.target].to_numpy() - pred) ** 2)))
+
+
+def _full_refit_reason(model: AlphaModel, df: pd.DataFrame, policy: RetrainPolicy, oos: float | None):
+    if not model.trained:
+        return "no previous model"
+
+    if model.feature_cols != model.candidate_features(df):
+        return "feature set changed"
+
+    # warm-starting a booster tuned for other params / horizon → mixed model
+    if model.trained_spec != model.spec():
+        return "params / horizon changed"
+
+    last_full = model.metrics.get("last_full_refit")
+    today = as_datetime(df["date"]).max()
+
+    if last_full is None or (today - pd.Timestamp(last_full)).days >= policy.full_every_days:
+        return "scheduled"
+
+    if model.n_trees() + policy.extra_trees > policy.max_trees:
+        return "tree budget"
+
+    baseline = model.metrics.get("baseline_rmse")
+    if oos is not None and baseline and oos > baseline * (1 + policy.degrade_tolerance):
+        return f"degraded ({oos:.6f} vs {baseline:.6f})"
+
+    return None
+
+
+def retrain(model: AlphaModel, df: pd.DataFrame, policy: RetrainPolicy | None = None, force: str | None = None) -> dict:
+    """
+    Refreshes model in place. force → "full" / "incremental" skips the policy.
+    """
+    policy = policy or RetrainPolicy()
+
+    labelled = model._prepare_target(df).dropna()
+    dates = as_datetime(labelled["date"])
+
+    # days labelled since the previous model was trained → honest OOS check
+    oos = None
+    if model.trained and "trained_through" in model.metrics:
+        fresh = labelled[dates > pd.Timestamp(model.metrics["trained_through"])]
+        oos = _rmse(model, fresh) if set(model.feature_cols) <= set(df.columns) else None
+
+    if force is not None:
+        mode, reason = force, "forced"
+    else:
+        reason = _full_refit_reason(model, df, policy, oos)
+        mode = "full" if reason else "incremental"
+
+    start = time.perf_counter()
+
+    if mode == "full":
+        model.fit(df)
+        model.metrics["last_full_refit"] = model.metrics.get("trained_through")
+        model.metrics["baseline_rmse"] = model.metrics.get("val_rmse")
+    else:
+        model.fit_incremental(df, policy.window_days, policy.extra_trees)
+
+    report = {
+        "mode": mode,
+        "reason": reason or "within policy",
+        "seconds": time.perf_counter() - start,
+        "oos_rmse_prev": oos,
+        "trees": model.n_trees(),
+        "trained_through": model.metrics.get("trained_through"),
+    }
+
+    print(
+        f"🔄 Retrain → {mode} ({report['reason']}) | {report['seconds']:.2f}s | "
+        f"{report['trees']} trees | prev-model OOS RMSE "
+        + (f"{oos:.6f}" if oos is not None else "n/a")
+    )
+
+    return report
+
+
+def compare_modes(
+    features: pd.DataFrame,
+    new_days: int = 5,
+    holdout_days: int = 20,
+    policy: RetrainPolicy | None = None,
+    params: dict | None = None,
+) -> pd.DataFrame:
+    """
+    Base model on history → `new_days` of data arrive → refresh with
+    each mode → RMSE on the following `holdout_days` (never trained on).
+    """
+    policy = policy or RetrainPolicy()
+
+    dates = np.sort(as_datetime(features["date"]).unique())
+    holdout_start = dates[-holdout_days]
+    base_end = dates[-holdout_days - new_days]
+
+    when = as_datetime(features["date"])
+    history = features[when < base_end]
+    current = features[when < holdout_start]
+
+    # holdout labels come from the full frame, so they're real forward returns
+    scorer = AlphaModel(params=params)
+    holdout = scorer._prepare_target(features).dropna()
+    holdout = holdout[as_datetime(holdout["date"]) >= holdout_start]
+
+    rows = []
+
+    for mode in ("full", "incremental"):
+        model = AlphaModel(params=params)
+        model.fit(history)
+
+        report = retrain(model, current, policy, force=mode)
+        report["holdout_rmse"] = _rmse(model, holdout)
+        rows.append(report)
+
+    return pd.DataFrame(rows).set_index("mode")
@@ -0,0 +1,285 @@
+"""
+Walk-forward training engine for AlphaModel.
+
+Fold layout over the trading-date axis:
+
+    |------ train ------|-- purge --|-- embargo --|---- test ----|
+                                                  ^ retrain date
+
+    window        "expanding" (all history) or "rolling" (last train_days)
+    purge         label horizon → no training label overlaps the test period
+    embargo       extra trading days dropped after the purge
+    retrain_every pandas period alias ("W-WED", "M", "Q", ...) → one fold per period
+
+Folds are independent, so they train in parallel over a process pool.
+Each worker gets the feature matrix once (initializer) and is pinned to
+`threads_per_worker` LightGBM / BLAS threads, so workers × threads never
+oversubscribes the machine.
+
+Out-of-sample predictions plus fold metadata are written to
+
+    data/processed/walkforward_predictions.parquet
+"""
+
+from __future__ import annotations
+
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import contextmanager
+import os
+import time
+
+import lightgbm as lgb
+import numpy as np
+import pandas as pd
+
+from src.alpha_model import AlphaModel
+from src.compact import as_datetime
+from src.config import BASE_DIR
+from src.labels import forward_returns, is_label, label_name
+
+
+OUTPUT_PATH = BASE_DIR / "data/processed/walkforward_predictions.parquet"
+
+TRAIN_WINDOW_DAYS = 756  # ~3 trading years for rolling windows
+
+THREAD_ENV = ["OMP_NUM_THREADS", "OPENBLAS_NUM_THREADS", "MKL_NUM_THREADS"]
+
+
+# --------------------------------------------------
+# Worker side
+# --------------------------------------------------
+
+_DATA: dict = {}
+
+
+def _pin_threads(threads: int):
+    """
+    Sets the thread env vars and threadpoolctl limits. Returns the
+    limiter (None without threadpoolctl) so callers can undo it.
+    """
+    for var in THREAD_ENV:
+        os.environ[var] = str(threads)
+
+    try:
+        from threadpoolctl import threadpool_limits
+        return threadpool_limits(threads)
+    except ImportError:
+        return None
+
+
+@contextmanager
+def scoped_threads(threads: int):
+    """
+    _pin_threads for the calling process: env vars and pool sizes are
+    restored on exit, so an in-process run leaves no global limits behind.
+    """
+    saved = {var: os.environ.get(var) for var in THREAD_ENV}
+    limiter = _pin_threads(threads)
+
+    try:
+        yield
+    finally:
+        if limiter is not None:
+            limiter.restore_original_limits()
+
+        for var, value in saved.items():
+            if value is None:
+                os.environ.pop(var, None)
+            else:
+                os.environ[var] = value
+
+
+def _load(X: np.ndarray, y: np.ndarray, day: np.ndarray, params: dict, threads: int):
+    _DATA.update(X=X, y=y, day=day, params={**params, "n_jobs": threads})
+
+
+def _init_worker(X: np.ndarray, y: np.ndarray, day: np.ndarray, params: dict, threads: int):
+    # pool processes only live for this run → pinned for good
+    _pin_threads(threads)
+    _load(X, y, day, params, threads)
+
+
+def _train_fold(fold: dict):
+    X, y, day = _DATA["X"], _DATA["y"], _DATA["day"]
+
+    # rows are sorted by trading-day index → every window is a slice
+    lo, hi = np.searchsorted(day, [fold["train_lo"], fold["train_hi"] + 1])
+    t_lo, t_hi = np.searchsorted(day, [fold["test_lo"], fold["test_hi"] + 1])
+
+    X_train, y_train = X[lo:hi], y[lo:hi]
+    keep = np.isfinite(y_train) & np.isfinite(X_train).all(axis=1)
+
+    test_rows = np.arange(t_lo, t_hi)
+    test_rows = test_rows[np.isfinite(X[t_lo:t_hi]).all(axis=1)]
+
+    if keep.sum() < fold["min_train_rows"] or len(test_rows) == 0:
+        return fold["fold"], test_rows[:0], np.empty(0), int(keep.sum())
+
+    model = lgb.LGBMRegressor(**_DATA["params"])
+    model.fit(X_train[keep], y_train[keep])
+
+    return fold["fold"], test_rows, model.predict(X[test_rows]), int(keep.sum())
+
+
+# --------------------------------------------------
+# Engine
+# --------------------------------------------------
+
+class WalkForwardEngine:
+    def __init__(
+        self,
+        window: str = "expanding",
+        train_days: int = TRAIN_WINDOW_DAYS,
+        retrain_every: str = "M",
+        horizon: int = 5,
+        embargo_days: int = 0,
+        min_train_rows: int = 200,
+        workers: int | None = None,
+        threads_per_worker: int | None = None,
+        model_params: dict | None = None,
+        label_cache=None,
+    ):
+        if window not in {"expanding", "rolling"}:
+            raise ValueError(f"Unknown window: {window}")
+
+        self.window = window
+        self.train_days = train_days
+        self.retrain_every = retrain_every
+        self.horizon = horizon
+        self.embargo_days = embargo_days
+        self.min_train_rows = min_train_rows
+        self.label_cache = label_cache
+
+        cores = os.cpu_count() or 1
+        self.workers = workers or cores
+        self.threads = threads_per_worker or max(1, cores // self.workers)
+
+        self.params = {**AlphaModel.PARAMS, "verbose": -1, **(model_params or {})}
+
+    # --------------------------------------------------
+    # FOLDS
+    # --------------------------------------------------
+
+    def folds(self, dates: pd.DatetimeIndex) -> list[dict]:
+        """
+        Fold boundaries as trading-day indices into the sorted dates.
+        """
+        periods = dates.to_period(self.retrain_every)
+        starts = np.flatnonzero(np.r_[True, periods[1:] != periods[:-1]])
+        ends = np.r_[starts[1:] - 1, len(dates) - 1]
+
+        gap = self.horizon + self.embargo_days
+        out = []
+
+        for test_lo, test_hi in zip(starts, ends):
+            # labels at t look h days ahead → last train day is test_lo - h - 1
+            train_hi = test_lo - gap - 1
+            train_lo = 0 if self.window == "expanding" else max(0, train_hi - self.train_days + 1)
+
+            if train_hi < train_lo:
+                continue
+
+            out.append(
+                {
+                    "fold": len(out),
+                    "train_lo": int(train_lo),
+                    "train_hi": int(train_hi),
+                    "test_lo": int(test_lo),
+                    "test_hi": int(test_hi),
+                    "min_train_rows": self.min_train_rows,
+                }
+            )
+
+        return out
+
+    # --------------------------------------------------
+    # RUN
+    # --------------------------------------------------
+
+    def _prepare(self, features: pd.DataFrame):
+        df = features.copy()
+        df["date"] = as_datetime(df["date"])
+
+        target = label_name(self.horizon)
+        if self.label_cache is not None:
+            df[target] = self.label_cache.labels(df, [self.horizon])[target]
+        else:
+            df[target] = forward_returns(df, [self.horizon])[target]
+
+        feature_cols = [c for c in df.columns if c not in {"date", "symbol"} and not is_label(c)]
+
+        df = df.sort_values(["date", "symbol"], kind="stable").reset_index(drop=True)
+
+        dates = pd.DatetimeIndex(np.sort(df["date"].unique()))
+        day = dates.searchsorted(df["date"])
+
+        X = df[feature_cols].to_numpy(dtype=np.float64)
+        y = df[target].to_numpy(dtype=np.float64)
+
+        return df, dates, day, X, y, feature_cols
+
+    def run(self, features: pd.DataFrame, save: bool = True) -> pd.DataFrame:
+        start = time.perf_counter()
+
+        df, dates, day, X, y, feature_cols = self._prepare(features)
+        folds = self.folds(dates)
+
+        print(
+            f"🔁 Walk-forward → {len(folds)} folds | {self.window} window | "
+            f"retrain {self.retrain_every} | purge {self.horizon}d + embargo {self.embargo_days}d | "
+            f"{self.workers} workers × {self.threads} threads"
+        )
+
+        initargs = (X, y, day, self.params, self.threads)
+
+        if self.workers > 1 and len(folds) > 1:
+            with ProcessPoolExecutor(
+                max_workers=self.workers, initializer=_init_worker, initargs=initargs
+            ) as pool:
+                results = list(pool.map(_train_fold, folds))
+        else:
+            with scoped_threads(self.threads):
+                _load(*initargs)
+                results = [_train_fold(f) for f in folds]
+
+        frames = []
+
+        for (fold_id, rows, preds, n_train), fold in zip(results, folds):
+            if len(rows) == 0:
+                continue
+
+            out = df.loc[rows, ["date", "symbol"]].copy()
+            out["alpha_score"] = preds
+            out["fold"] = fold_id
+            out["train_start"] = dates[fold["train_lo"]]
+            out["train_end"] = dates[fold["train_hi"]]
+            out["test_start"] = dates[fold["test_lo"]]
+            out["test_end"] = dates[fold["test_hi"]]
+            out["n_train"] = n_train
+            frames.append(out)
+
+        if not frames:
+            raise ValueError("Walk-forward produced no predictions.")
+
+        preds = pd.concat(frames, ignore_index=True)
+        preds["window"] = self.window
+        preds["horizon"] = self.horizon
+
+        print(
+            f"✅ {len(preds):,} OOS predictions | {preds['fold'].nunique()} trained folds | "
+            f"{len(feature_cols)} features | {time.perf_counter() - start:.1f}s"
+        )
+
+        if save:
+            self._save(preds)
+
+        return preds
+
+    # --------------------------------------------------
+    # SAVE
+    # --------------------------------------------------
+
+    def _save(self, df: pd.DataFrame) -> None:
+        OUTPUT_PATH.parent.mkdir(parents=True, exist_ok=True)
+        df.to_parquet(OUTPUT_PATH, index=False)
+        print(f"✓ walkforward_predictions.parquet created → {OUTPUT_PATH}")
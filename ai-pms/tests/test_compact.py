@@ -0,0 +1,36 @@
+import numpy as np
+import pandas as pd
+
+from src.compact import as_datetime, compact_frame
+from src.feature_factory import FeatureFactory
+
+
+def _prices():
+    dates = pd.date_range("2024-01-01", periods=80)
+    return pd.DataFrame(
+        {
+            "date": dates.tolist() * 2,
+            "symbol": ["A"] * 80 + ["B"] * 80,
+            "close": np.r_[np.linspace(100, 120, 80), np.linspace(50, 40, 80)],
+            "volume": np.arange(160) * 1000,
+        }
+    )
+
+
+def test_compact_features_match_default_and_survive_parquet(tmp_path):
+    default = FeatureFactory(_prices()).build_features()
+    compact = FeatureFactory(_prices(), compact=True).build_features()
+
+    assert compact["date"].dtype == np.int32
+    assert isinstance(compact["symbol"].dtype, pd.CategoricalDtype)
+    assert compact["vol_20d"].dtype == np.float32
+    assert compact["volume"].dtype == np.int32
+
+    np.testing.assert_allclose(compact["vol_20d"], default["vol_20d"], rtol=1e-4, atol=1e-7)
+    assert (as_datetime(compact["date"]) == default["date"].values).all()
+
+    compact.to_parquet(tmp_path / "f.parquet", index=False)
+    back = pd.read_parquet(tmp_path / "f.parquet")
+
+    pd.testing.assert_series_equal(back.dtypes, compact.dtypes)
+    assert back.equals(compact_frame(back))
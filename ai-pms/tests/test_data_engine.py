@@ -0,0 +1,38 @@
+import pandas as pd
+import numpy as np
+
+from backtest.engines.data_engine import HistoricalDataEngine
+
+
+def _write_raw(folder):
+    dates = pd.date_range("2024-01-01", periods=30, freq="B")
+
+    for sym in ["AAA", "BBB", "CCC"]:
+        pd.DataFrame(
+            {
+                "Date": dates.strftime("%Y-%m-%d"),
+                "Close": np.linspace(100, 130, 30),
+                "High": np.linspace(101, 131, 30),
+                "Low": np.linspace(99, 129, 30),
+                "Open": np.linspace(100, 130, 30),
+                "Volume": np.arange(30) + 1000,
+                "Ticker": sym,
+            }
+        ).to_csv(folder / f"{sym}.csv", index=False)
+
+    (folder / "BROKEN.csv").write_text("foo,bar\n1,2\n")
+
+
+def test_parallel_load_matches_sequential(tmp_path):
+    _write_raw(tmp_path)
+
+    sequential = HistoricalDataEngine(tmp_path, workers=1, use_cache=False, cache_dir=tmp_path / "nocache")
+    parallel = HistoricalDataEngine(tmp_path, workers=2, cache_dir=tmp_path / "cache")
+
+    pd.testing.assert_frame_equal(sequential.run(), parallel.run())
+
+    report = parallel.load_report
+    assert len(report) == 4
+    assert report.loc[report["file"] == "BROKEN.csv", "status"].item() == "skipped"
+    assert (tmp_path / "cache" / "schema_manifest.json").exists()
+    assert not (tmp_path / "nocache").exists()
@@ -0,0 +1,42 @@
+import numpy as np
+import pandas as pd
+
+from src.alpha_model import AlphaModel
+from src.dataset_cache import DatasetCache
+
+
+def _features(n_days=120, seed=0):
+    rng = np.random.default_rng(seed)
+    dates = pd.date_range("2024-01-01", periods=n_days)
+    return pd.DataFrame(
+        {
+            "date": dates.tolist() * 2,
+            "symbol": ["A"] * n_days + ["B"] * n_days,
+            "ret_1d": rng.normal(0, 0.01, 2 * n_days),
+            "ret_20d": rng.normal(0, 0.05, 2 * n_days),
+        }
+    )
+
+
+def test_cached_dataset_matches_sklearn_fit_and_is_reused(tmp_path):
+    df = _features()
+
+    plain = AlphaModel(params={"n_estimators": 10})
+    plain.fit(df)
+
+    cache = DatasetCache(tmp_path)
+    cached = AlphaModel(params={"n_estimators": 10}, dataset_cache=cache)
+    cached.fit(df)
+
+    assert cache.stats == {"hits": 0, "built": 1}
+    assert len(list(tmp_path.glob("*.bin"))) == 1
+    assert np.allclose(plain.predict(df)["alpha_score"], cached.predict(df)["alpha_score"])
+
+    # tree params don't touch the bins → a fresh process reuses the file
+    reloaded = DatasetCache(tmp_path)
+    AlphaModel(params={"n_estimators": 5, "num_leaves": 7}, dataset_cache=reloaded).fit(df)
+    assert reloaded.stats == {"hits": 1, "built": 0}
+
+    # binning params do
+    AlphaModel(params={"n_estimators": 5, "max_bin": 63}, dataset_cache=reloaded).fit(df)
+    assert reloaded.stats["built"] == 1
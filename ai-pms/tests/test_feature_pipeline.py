@@ -0,0 +1,26 @@
+import numpy as np
+
+from backtest.engines.nse_downloader import generate_synthetic_universe
+from backtest.engines.parquet_spine import ParquetSpine
+from src.feature_factory import FeatureFactory
+from src.feature_pipeline import ChunkedFeaturePipeline, read_features
+
+
+def test_chunked_features_match_full_build(tmp_path):
+    generate_synthetic_universe(
+        n_symbols=12, years=3, out_dir=tmp_path / "spine", layout="parquet", chunk_symbols=5
+    )
+
+    pipeline = ChunkedFeaturePipeline(tmp_path / "spine", tmp_path / "features", max_memory_mb=0.5)
+    summary = pipeline.run()
+
+    assert summary["chunks"] > 1
+
+    chunked = read_features(tmp_path / "features")
+    full = FeatureFactory(ParquetSpine(tmp_path / "spine").read()).build_features()
+    full = full.sort_values(["symbol", "date"]).reset_index(drop=True)
+
+    assert len(chunked) == len(full) == summary["rows"]
+
+    for col in ["ret_1d", "ret_60d", "vol_60d", "drawdown", "mom_20_60"]:
+        assert np.allclose(chunked[col], full[col], atol=1e-10), col
@@ -0,0 +1,37 @@
+import numpy as np
+import pandas as pd
+
+from src.feature_factory import FeatureFactory
+from src.feature_registry import default_registry
+
+
+def _prices():
+    dates = pd.date_range("2024-01-01", periods=80)
+    return pd.DataFrame(
+        {
+            "date": dates.tolist() * 2,
+            "symbol": ["A"] * 80 + ["B"] * 80,
+            "close": np.r_[np.linspace(100, 120, 80), np.linspace(50, 40, 80)],
+        }
+    )
+
+
+def test_registry_computes_only_the_requested_closure():
+    reg = default_registry()
+
+    @reg.register("never_used", ["close"])
+    def _boom(close):
+        raise AssertionError("unrequested feature was computed")
+
+    assert reg.closure(["mom_20_60"]) == ["ret_20d", "ret_60d", "mom_20_60"]
+    assert reg.lookback(["vol_60d"]) == 60
+
+    values = reg.evaluate(_prices(), ["mom_20_60", "vol_20d"])
+    full = FeatureFactory(_prices()).build_features()
+
+    assert set(values) == {"mom_20_60", "vol_20d"}
+    assert np.allclose(np.nan_to_num(values["vol_20d"]), full["vol_20d"])
+
+    partial = FeatureFactory(_prices()).build_features(["mom_20_60"])
+    assert "vol_60d" not in partial.columns
+    assert np.allclose(partial["mom_20_60"], full["mom_20_60"])
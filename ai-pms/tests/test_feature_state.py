@@ -0,0 +1,76 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from src.feature_factory import FeatureFactory
+from src.feature_state import FEATURE_COLUMNS, IncrementalFeatureState
+
+
+def _prices(n_days=150, symbols=("A", "B", "C")):
+    rng = np.random.default_rng(0)
+    dates = pd.bdate_range("2023-01-02", periods=n_days)
+
+    frames = []
+    for k, s in enumerate(symbols):
+        # C lists late → state has to pick up a new symbol mid-stream
+        d = dates[40:] if s == "C" else dates
+        close = 100 * np.exp(np.cumsum(rng.normal(0, 0.02, len(d))))
+        frames.append(pd.DataFrame({"date": d, "symbol": s, "close": close}))
+
+    return pd.concat(frames, ignore_index=True)
+
+
+def test_incremental_matches_batch(tmp_path):
+    prices = _prices()
+    cutoff = prices["date"].sort_values().unique()[-5]
+
+    state = IncrementalFeatureState.from_history(prices[prices["date"] < cutoff])
+    state.save(tmp_path / "state.npz")
+    state = IncrementalFeatureState.load(tmp_path / "state.npz")
+
+    new = []
+    for d, day in prices[prices["date"] >= cutoff].groupby("date"):
+        new.append(state.update(day))
+
+    # replaying an old day is a no-op
+    assert state.update(prices[prices["date"] == cutoff]).empty
+
+    inc = pd.concat(new).sort_values(["symbol", "date"]).reset_index(drop=True)
+
+    batch = FeatureFactory(prices).build_features()
+    batch = batch[batch["date"] >= cutoff].sort_values(["symbol", "date"]).reset_index(drop=True)
+
+    assert len(inc) == len(batch) == 15
+    for col in FEATURE_COLUMNS:
+        assert np.allclose(inc[col], batch[col], atol=1e-10), col
+
+
+def test_incremental_recovers_after_nan_close(tmp_path):
+    prices = _prices()
+    dates = prices["date"].sort_values().unique()
+
+    # one missing close per symbol, before and inside the incremental stretch
+    prices.loc[(prices["symbol"] == "A") & (prices["date"] == dates[70]), "close"] = np.nan
+    prices.loc[(prices["symbol"] == "B") & (prices["date"] == dates[-30]), "close"] = np.nan
+
+    cutoff = dates[-40]
+    state = IncrementalFeatureState.from_history(prices[prices["date"] < cutoff])
+    state.save(tmp_path / "state.npz")
+    state = IncrementalFeatureState.load(tmp_path / "state.npz")
+
+    inc = pd.concat([state.update(day) for _, day in prices[prices["date"] >= cutoff].groupby("date")])
+    inc = inc.sort_values(["symbol", "date"]).reset_index(drop=True)
+
+    batch = FeatureFactory(prices).build_features()
+    batch = batch[batch["date"] >= cutoff].sort_values(["symbol", "date"]).reset_index(drop=True)
+
+    # vol / drawdown come back once the NaN leaves the window
+    assert (batch.loc[batch["symbol"] == "A", "vol_20d"] > 0).all()
+    for col in FEATURE_COLUMNS:
+        assert np.allclose(inc[col], batch[col], atol=1e-10), col
+
+    # a state file without missing-return tracking is rejected → rebuilt by the caller
+    with np.load(tmp_path / "state.npz") as z:
+        np.savez(tmp_path / "old.npz", **{k: z[k] for k in z.files if "bad" not in k})
+    with pytest.raises(ValueError, match="missing-return tracking"):
+        IncrementalFeatureState.load(tmp_path / "old.npz")
@@ -0,0 +1,76 @@
+import time
+
+import numpy as np
+import pandas as pd
+
+from backtest.engines.nse_downloader import generate_synthetic_universe
+from src.feature_pipeline import ChunkedFeaturePipeline
+from src.feature_store import FeatureStore, feature_key, spine_key
+
+
+def _prices(shift=0.0):
+    dates = pd.date_range("2024-01-01", periods=80)
+    return pd.DataFrame(
+        {
+            "date": dates.tolist() * 2,
+            "symbol": ["A"] * 80 + ["B"] * 80,
+            "close": np.r_[np.linspace(100, 120, 80), np.linspace(50, 40, 80)] + shift,
+        }
+    )
+
+
+def test_store_hits_on_same_inputs_and_evicts_lru(tmp_path):
+    store = FeatureStore(tmp_path, max_mb=1)
+
+    built, key, hit = store.get_or_build(_prices())
+    assert not hit
+
+    # row order does not change the key
+    again, key2, hit = FeatureStore(tmp_path).get_or_build(_prices().iloc[::-1], columns=["date", "ret_1d"])
+    assert hit and key2 == key
+    assert list(again.columns) == ["date", "ret_1d"]
+    assert feature_key(_prices(shift=1.0)) != key
+
+    # budget below one entry → only the latest version survives
+    store = FeatureStore(tmp_path, max_mb=1e-6)
+    _, new_key, _ = store.get_or_build(_prices(shift=1.0))
+
+    assert store.keys() == [new_key]
+    assert store.latest(["ret_1d"]).shape == (160, 1)
+
+
+def test_incremental_and_chunked_builds_get_their_own_keys(tmp_path):
+    assert feature_key(_prices(), mode="incremental") != feature_key(_prices())
+
+    generate_synthetic_universe(n_symbols=4, years=1, out_dir=tmp_path / "spine", layout="parquet")
+    summary = ChunkedFeaturePipeline(tmp_path / "spine", tmp_path / "out").run()
+
+    store = FeatureStore(tmp_path / "store", max_mb=1e-6)
+    store.get_or_build(_prices())
+
+    # chunked output becomes latest without being copied into the store
+    store.link(spine_key(tmp_path / "spine"), tmp_path / "out", summary["rows"])
+    store.get_or_build(_prices(shift=1.0))  # evicts the link → files stay
+    assert (tmp_path / "out").exists()
+
+    store.link(spine_key(tmp_path / "spine"), tmp_path / "out", summary["rows"])
+
+    latest = FeatureStore(tmp_path / "store").latest(["symbol", "ret_1d"])
+    assert len(latest) == summary["rows"]
+    assert latest["symbol"].is_monotonic_increasing
+
+
+def test_reads_leave_the_index_alone_and_still_drive_lru(tmp_path):
+    store = FeatureStore(tmp_path)
+    _, old, _ = store.get_or_build(_prices())
+    _, new, _ = store.get_or_build(_prices(shift=1.0))
+
+    index = (tmp_path / "_index.json").read_text()
+
+    # consumer read of the older version → no index write, but it is now most recent
+    time.sleep(0.01)
+    assert FeatureStore(tmp_path).get(old, ["ret_1d"]) is not None
+    assert (tmp_path / "_index.json").read_text() == index
+
+    store = FeatureStore(tmp_path)
+    assert store.last_used(old) > store.last_used(new)
@@ -0,0 +1,82 @@
+import json
+import os
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from src import hyperparam_search
+from src.alpha_model import AlphaModel
+from src.dataset_cache import DatasetCache
+from src.hyperparam_search import HyperparamSearch, best_params, promoted
+
+
+def _features(n_days=200, seed=0):
+    rng = np.random.default_rng(seed)
+    dates = pd.bdate_range("2023-01-02", periods=n_days)
+    return pd.DataFrame(
+        {
+            "date": np.tile(dates, 3),
+            "symbol": np.repeat(["A", "B", "C"], n_days),
+            "ret_1d": rng.normal(0, 0.01, 3 * n_days),
+            "ret_20d": rng.normal(0, 0.05, 3 * n_days),
+        }
+    )
+
+
+def test_halving_search_promotes_best_params(tmp_path, monkeypatch):
+    monkeypatch.setattr(hyperparam_search, "TRIALS_PATH", tmp_path / "trials.parquet")
+    monkeypatch.setattr(hyperparam_search, "BEST_PARAMS_PATH", tmp_path / "alpha_params.json")
+
+    cache = DatasetCache(tmp_path / "datasets")
+    search = HyperparamSearch(
+        method="halving",
+        trials=6,
+        min_rounds=10,
+        max_rounds=40,
+        early_stopping=5,
+        horizon=3,
+        workers=1,
+        dataset_cache=cache,
+    )
+    table = search.run(_features())
+
+    # 6 → 2 → 1 configs, rounds 10 → 30 → 40, one binned dataset for all
+    assert list(table.groupby("rung").size()) == [6, 2, 1]
+    assert sorted(table["rounds"].unique()) == [10, 30, 40]
+    assert cache.stats["built"] == 1
+    assert (tmp_path / "trials.parquet").exists()
+
+    params = best_params(tmp_path / "alpha_params.json")
+    assert params["n_estimators"] == table["best_iteration"].iloc[0]
+    assert json.loads((tmp_path / "alpha_params.json").read_text())["val_rmse"] == table["val_rmse"].iloc[0]
+
+    # promoted params are valid AlphaModel params, for the horizon they were tuned on
+    best = promoted(tmp_path / "alpha_params.json")
+    assert best["horizon"] == 3
+
+    model = AlphaModel(params=best["params"], horizon=best["horizon"])
+    model.fit(_features())
+    assert model.trained and model.target == AlphaModel(horizon=3).target
+
+
+def test_budget_stops_new_trials(tmp_path):
+    search = HyperparamSearch(trials=10, budget_seconds=0, workers=1, dataset_cache=DatasetCache(tmp_path))
+
+    with pytest.raises(ValueError, match="no trials"):
+        search.run(_features(), save=False)
+
+
+def test_worker_pool_matches_in_process_search(tmp_path, monkeypatch):
+    monkeypatch.setenv("OMP_NUM_THREADS", "3")
+
+    kwargs = dict(trials=4, max_rounds=20, early_stopping=5, threads_per_worker=1, seed=1)
+
+    pooled = HyperparamSearch(workers=2, dataset_cache=DatasetCache(tmp_path), **kwargs).run(_features(), save=False)
+    local = HyperparamSearch(workers=1, dataset_cache=DatasetCache(tmp_path), **kwargs).run(_features(), save=False)
+
+    cols = ["trial", "val_rmse", "best_iteration", *hyperparam_search.SPACE]
+    pd.testing.assert_frame_equal(pooled[cols], local[cols])
+
+    # the in-process search leaves the caller's thread settings alone
+    assert os.environ["OMP_NUM_THREADS"] == "3"
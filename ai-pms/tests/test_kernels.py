@@ -0,0 +1,71 @@
+import numpy as np
+import pandas as pd
+
+from src import kernels
+
+
+def test_kernels_match_groupby_with_gaps_and_nans():
+    rng = np.random.default_rng(1)
+    n = 300
+
+    df = pd.DataFrame(
+        {
+            "symbol": rng.choice(["A", "B", "C", "D"], n),
+            "close": 100 * np.exp(rng.normal(0, 0.02, n).cumsum()),
+        }
+    )
+    df.loc[[7, 50, 51, 120], "close"] = np.nan
+
+    grid = kernels.GroupedMatrix(df["symbol"])
+    close = grid.wide(df["close"])
+    g = df.groupby("symbol")["close"]
+    ret = g.pct_change()
+
+    expected = {
+        "ret_5": g.pct_change(5),
+        "std_20": ret.groupby(df["symbol"]).rolling(20).std().reset_index(0, drop=True),
+        "mean_10": g.rolling(10).mean().reset_index(0, drop=True),
+        "max_10": g.rolling(10).max().reset_index(0, drop=True),
+        "drawdown": df["close"] / g.cummax() - 1,
+    }
+    actual = {
+        "ret_5": kernels.pct_change(close, 5),
+        "std_20": kernels.rolling_std(kernels.pct_change(close), 20),
+        "mean_10": kernels.rolling_mean(close, 10),
+        "max_10": kernels.rolling_max(close, 10),
+        "drawdown": kernels.drawdown(close),
+    }
+
+    for name, exp in expected.items():
+        got = grid.long(actual[name])
+        exp = exp.sort_index().to_numpy()
+
+        assert (np.isnan(got) == np.isnan(exp)).all(), name
+        assert np.allclose(got, exp, equal_nan=True, atol=1e-12), name
+
+
+def test_rolling_std_is_exact_on_flat_stretches():
+    rng = np.random.default_rng(2)
+    n = 600
+
+    df = pd.DataFrame(
+        {
+            "symbol": np.repeat(["A", "B", "C"], n // 3),
+            "close": 100 * np.exp(rng.normal(0, 0.02, n).cumsum()),
+        }
+    )
+    # suspended / illiquid stretches → runs of exactly-zero returns
+    df.loc[30:90, "close"] = 57.25
+    df.loc[250:300, "close"] = 101.5
+    df.loc[[120, 450], "close"] = np.nan
+
+    grid = kernels.GroupedMatrix(df["symbol"])
+    ret = df.groupby("symbol")["close"].pct_change()
+    vols = kernels.rolling_stds(kernels.pct_change(grid.wide(df["close"])), (20, 60))
+
+    for w, vol in vols.items():
+        exp = ret.groupby(df["symbol"]).rolling(w).std().reset_index(0, drop=True).sort_index().to_numpy()
+        got = grid.long(vol)
+
+        assert (exp == 0).any()
+        np.testing.assert_array_equal(got, exp)
@@ -0,0 +1,41 @@
+import numpy as np
+import pandas as pd
+
+from src.labels import LabelCache, forward_returns
+
+
+def _features():
+    rng = np.random.default_rng(5)
+    dates = pd.date_range("2024-01-01", periods=30)
+    return pd.DataFrame(
+        {
+            "date": dates.tolist() * 2,
+            "symbol": ["A"] * 30 + ["B"] * 30,
+            "ret_1d": rng.normal(0, 0.01, 60),
+        }
+    )
+
+
+def test_forward_returns_are_grouped_and_cached(tmp_path):
+    df = _features()
+    labels = forward_returns(df, [1, 5])
+
+    expected = (
+        df.groupby("symbol")["ret_1d"]
+        .transform(lambda r: r.shift(-5).rolling(5).sum())
+    )
+    # old shift/rolling form also blanks each symbol's first 4 rows
+    known = expected.notna()
+    assert np.allclose(labels["fwd_ret_5d"][known], expected[known])
+    assert labels["fwd_ret_5d"].iloc[:4].notna().all()
+
+    # last rows of A never borrow B's returns
+    assert labels["fwd_ret_5d"].iloc[25:30].isna().all()
+
+    cache = LabelCache(tmp_path)
+    first = cache.labels(df, [5])
+    again = LabelCache(tmp_path)
+    both = again.labels(df.iloc[::-1], [1, 5])
+
+    assert again.stats == {"hits": 1, "built": 1}
+    assert np.allclose(both.loc[df.index, "fwd_ret_5d"], first["fwd_ret_5d"], equal_nan=True)
@@ -0,0 +1,73 @@
+import numpy as np
+import pandas as pd
+
+from src.market_state import MARKET_FEATURES, MarketStateCache, market_state
+from src.regime_model import RegimeDetector
+
+
+def _features(n_days=120, n_symbols=5, seed=0):
+    rng = np.random.default_rng(seed)
+    dates = pd.bdate_range("2024-01-01", periods=n_days)
+
+    df = pd.DataFrame(
+        {
+            "date": np.tile(dates, n_symbols),
+            "symbol": np.repeat([f"S{i}" for i in range(n_symbols)], n_days),
+            "ret_1d": rng.normal(0, 0.01, n_days * n_symbols),
+            "mom_20_60": rng.normal(0, 0.05, n_days * n_symbols),
+        }
+    )
+    df.loc[::17, "ret_1d"] = np.nan
+    return df
+
+
+def test_market_state_matches_groupby():
+    df = _features()
+    out = market_state(df).set_index("date")
+
+    g = df.groupby("date")
+    assert np.allclose(out["ret_1d"], g["ret_1d"].mean())
+    assert np.allclose(out["dispersion"], g["ret_1d"].std())
+    assert np.allclose(out["mom_20_60"], g["mom_20_60"].median())
+    assert np.allclose(out["breadth"], g["ret_1d"].apply(lambda s: (s.dropna() > 0).mean()))
+    assert np.allclose(out["vol_20d"], g["ret_1d"].mean().rolling(20).std(), equal_nan=True)
+
+
+def test_cache_appends_new_dates_and_rebuilds_on_revision(tmp_path):
+    df = _features()
+    cutoff = df["date"].unique()[-10]
+    cache = MarketStateCache(tmp_path / "market_state.parquet")
+
+    cache.update(df[df["date"] < cutoff])
+    out = cache.update(df)
+
+    assert cache.stats == {"new_dates": 10, "rebuilt": False}
+    pd.testing.assert_frame_equal(out, market_state(df))
+
+    revised = df.copy()
+    revised.loc[revised["date"] == revised["date"].max(), "ret_1d"] += 0.01
+    cache.update(revised)
+    assert cache.stats["rebuilt"]
+
+    # a correction deep in the cached history (not just the last date)
+    early = revised.copy()
+    early.loc[early["date"] == early["date"].unique()[30], "ret_1d"] += 0.01
+    out = cache.update(early)
+    assert cache.stats["rebuilt"]
+    pd.testing.assert_frame_equal(out, market_state(early))
+
+    cache.update(early)
+    assert not cache.stats["rebuilt"]
+
+
+def test_detector_runs_on_market_series():
+    market = market_state(_features(n_days=300))
+
+    detector = RegimeDetector(features=MARKET_FEATURES)
+    detector.fit(market)
+
+    probs = detector.predict_daily_probabilities(market)
+    weekly = detector.weekly_confirmed_regime(probs)
+
+    assert probs["date"].is_unique
+    assert "confirmed_regime" in weekly.columns
@@ -0,0 +1,46 @@
+import numpy as np
+import pandas as pd
+
+from src.alpha_model import AlphaModel
+from src.model_registry import ModelRegistry
+
+
+def _features(seed=0):
+    rng = np.random.default_rng(seed)
+    dates = pd.date_range("2024-01-01", periods=120)
+    return pd.DataFrame(
+        {
+            "date": dates.tolist() * 2,
+            "symbol": ["A"] * 120 + ["B"] * 120,
+            "ret_1d": rng.normal(0, 0.01, 240),
+            "ret_20d": rng.normal(0, 0.05, 240),
+        }
+    )
+
+
+def test_registry_reuses_matching_model_and_prunes(tmp_path):
+    registry = ModelRegistry(tmp_path, keep=1)
+    df = _features()
+
+    model = AlphaModel(params={"n_estimators": 5})
+    key = registry.key(df, model)
+    assert not registry.load(key, model)
+
+    model.fit(df)
+    registry.save(key, model)
+
+    reloaded = AlphaModel(params={"n_estimators": 5})
+    assert ModelRegistry(tmp_path).load(key, reloaded)
+    assert reloaded.metrics["val_rmse"] == model.metrics["val_rmse"]
+    assert np.allclose(reloaded.predict(df)["alpha_score"], model.predict(df)["alpha_score"])
+
+    # new params or new data → new key
+    assert registry.key(df, AlphaModel(params={"n_estimators": 6})) != key
+    other = registry.key(_features(seed=1), model)
+    assert other != key
+
+    model.fit(_features(seed=1))
+    registry.save(other, model)
+    registry.prune(protect=other)
+
+    assert registry.keys() == [other]
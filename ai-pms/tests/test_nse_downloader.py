@@ -0,0 +1,50 @@
+import pandas as pd
+import pytest
+
+from backtest.engines import nse_downloader
+from backtest.engines.data_engine import HistoricalDataEngine
+from backtest.engines.nse_downloader import generate_synthetic_universe
+from backtest.engines.parquet_spine import ParquetSpine
+
+
+def test_synthetic_universe_is_seeded_and_loadable(tmp_path):
+    a = generate_synthetic_universe(n_symbols=12, years=1, seed=7, out_dir=tmp_path / "a", chunk_symbols=5)
+    b = generate_synthetic_universe(n_symbols=12, years=1, seed=7, out_dir=tmp_path / "b", chunk_symbols=5)
+
+    assert a["rows"] == b["rows"]
+    assert (tmp_path / "a" / "STK01.csv").read_text() == (tmp_path / "b" / "STK01.csv").read_text()
+
+    df = HistoricalDataEngine(tmp_path / "a", use_cache=False).run()
+    assert df["symbol"].nunique() == 12
+    assert len(df) == a["rows"]
+    assert (df["high"] >= df[["open", "close"]].max(axis=1)).all()
+
+    generate_synthetic_universe(n_symbols=12, years=1, seed=7, out_dir=tmp_path / "spine", layout="parquet", chunk_symbols=5)
+    spine = ParquetSpine(tmp_path / "spine").read()
+    pd.testing.assert_series_equal(
+        spine["close"], df["close"], check_dtype=False, check_exact=False
+    )
+
+
+def test_parquet_rerun_replaces_spine(tmp_path):
+    kwargs = dict(n_symbols=6, years=1, seed=3, out_dir=tmp_path / "spine", layout="parquet", chunk_symbols=4)
+
+    first = generate_synthetic_universe(**kwargs)
+    generate_synthetic_universe(**kwargs)
+
+    spine = ParquetSpine(tmp_path / "spine").read()
+    assert len(spine) == first["rows"]
+    assert not spine.duplicated(["date", "symbol"]).any()
+
+
+def test_raw_universe_is_never_overwritten(tmp_path, monkeypatch):
+    raw = tmp_path / "data" / "raw"
+    raw.mkdir(parents=True)
+    (raw / "REAL.csv").write_text("Date,Close\n")
+    monkeypatch.setattr(nse_downloader, "RAW_DIR", raw)
+
+    for out, layout in [(raw, "parquet"), (tmp_path / "data", "parquet"), (raw, "csv")]:
+        with pytest.raises(ValueError, match="Refusing"):
+            generate_synthetic_universe(n_symbols=2, years=1, out_dir=out, layout=layout)
+
+    assert [f.name for f in raw.iterdir()] == ["REAL.csv"]
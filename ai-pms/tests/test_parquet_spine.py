@@ -0,0 +1,43 @@
+import pandas as pd
+
+from backtest.engines.parquet_spine import ParquetSpine
+
+
+def _prices(dates, symbols):
+    rows = [
+        {"date": d, "symbol": s, "open": 1.0, "high": 1.0, "low": 1.0, "close": 1.0, "volume": 10}
+        for s in symbols
+        for d in pd.to_datetime(dates)
+    ]
+    return pd.DataFrame(rows)
+
+
+def test_spine_append_only_writes_new_rows(tmp_path):
+    spine = ParquetSpine(tmp_path / "spine")
+    spine.rebuild(_prices(["2023-12-29", "2024-01-02"], ["A", "B"]))
+
+    parts_before = {p["path"] for p in spine.manifest["parts"]}
+
+    update = _prices(["2024-01-02", "2024-01-03"], ["A", "B", "C"])
+    assert ParquetSpine(tmp_path / "spine").append(update) == 4
+
+    spine = ParquetSpine(tmp_path / "spine")
+    df = spine.read()
+
+    assert len(df) == 8
+    assert not df.duplicated(["symbol", "date"]).any()
+    assert spine.last_dates()["C"] == pd.Timestamp("2024-01-03")
+    assert parts_before <= {p["path"] for p in spine.manifest["parts"]}
+
+
+def test_spine_load_pushes_down_filters(tmp_path):
+    spine = ParquetSpine(tmp_path / "spine")
+    spine.rebuild(_prices(pd.bdate_range("2018-12-20", "2019-01-10"), ["A", "B", "C"]))
+
+    df = spine.load(start="2019-01-01", end="2019-01-04", symbols=["B"], columns=["close"])
+
+    assert list(df.columns) == ["date", "symbol", "close"]
+    assert set(df["symbol"]) == {"B"}
+    assert df["date"].min() >= pd.Timestamp("2019-01-01")
+    assert df["date"].max() <= pd.Timestamp("2019-01-04")
+    assert len(df) == 4
@@ -1,5 +1,6 @@
 import pandas as pd
 import numpy as np
+import cvxpy as cp
 
 from src.optimizer import PortfolioOptimizer
 
@@ -20,3 +21,32 @@ def test_optimizer_runs():
     w = opt.optimize(alpha, cov)
 
     assert abs(w["weight"].sum() - 1) < 1e-6
+
+
+def test_optimizer_reuses_compiled_problem_and_keeps_fallbacks():
+    rng = np.random.default_rng(0)
+    symbols = [f"S{i}" for i in range(20)]
+    returns = pd.DataFrame(rng.normal(0, 0.01, (250, 20)), columns=symbols)
+
+    opt = PortfolioOptimizer(max_weight=0.2)
+
+    for day in range(3):
+        alpha = pd.DataFrame({"symbol": symbols, "alpha_score": rng.normal(0, 0.01, 20)})
+        cov = returns.iloc[day * 50:day * 50 + 200].cov()
+        w = opt.optimize(alpha, cov)
+
+        # same optimum as a freshly built quad_form problem
+        x = cp.Variable(20)
+        cp.Problem(
+            cp.Maximize(alpha["alpha_score"].values @ x - 0.5 * cp.quad_form(x, cov.values)),
+            [cp.sum(x) == 1, x >= 0, x <= 0.2],
+        ).solve()
+        assert np.allclose(w["weight"], x.value, atol=1e-4)
+
+    assert [t["compiled"] for t in opt.timings] == [True, False, False]
+    assert all(t["solve_s"] >= 0 and t["compile_s"] >= 0 for t in opt.timings)
+
+    # non-PSD covariance → same equal-weight fallback as before
+    bad = pd.DataFrame([[1, 2, 0], [2, 1, 0], [0, 0, 1.0]], index=list("ABC"), columns=list("ABC"))
+    alpha = pd.DataFrame({"symbol": list("ABC"), "alpha_score": [0.1, 0.2, 0.3]})
+    assert np.allclose(opt.optimize(alpha, bad)["weight"], 1 / 3)
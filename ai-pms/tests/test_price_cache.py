@@ -0,0 +1,56 @@
+import os
+
+import pandas as pd
+
+from backtest.engines.price_cache import PriceCache
+
+
+def test_price_cache_hit_and_invalidation(tmp_path):
+    src = tmp_path / "AAA.csv"
+    src.write_text("date,close\n2024-01-01,100\n2024-01-02,101\n")
+
+    calls = []
+
+    def parser(path):
+        calls.append(path)
+        df = pd.read_csv(path)
+        df["date"] = pd.to_datetime(df["date"])
+        return df
+
+    cache = PriceCache("test", tmp_path / "cache")
+
+    cold, hit = cache.lookup(src, parser)
+    warm, hit_again = cache.lookup(src, parser)
+
+    assert not hit and hit_again
+    assert len(calls) == 1
+    pd.testing.assert_frame_equal(cold, warm)
+
+    # touch only → content hash unchanged → still a hit
+    os.utime(src, None)
+    cache.load(src, parser)
+    assert len(calls) == 1
+
+    src.write_text("date,close\n2024-01-01,100\n2024-01-02,101\n2024-01-03,102\n")
+    assert len(cache.load(src, parser)) == 3
+    assert len(calls) == 2
+
+
+def test_same_named_files_from_different_folders_do_not_collide(tmp_path):
+    a, b = tmp_path / "a" / "AAA.csv", tmp_path / "b" / "AAA.csv"
+    for f, close in [(a, 100), (b, 200)]:
+        f.parent.mkdir()
+        f.write_text(f"date,close\n2024-01-01,{close}\n")
+
+    calls = []
+    cache = PriceCache("test", tmp_path / "cache")
+
+    def parser(path):
+        calls.append(path)
+        return pd.read_csv(path)
+
+    for _ in range(2):
+        assert cache.load(a, parser)["close"].iloc[0] == 100
+        assert cache.load(b, parser)["close"].iloc[0] == 200
+
+    assert calls == [a, b]
@@ -0,0 +1,31 @@
+import numpy as np
+import pandas as pd
+
+from backtest.engines.price_panel import PricePanel
+
+
+def test_price_panel_roundtrip(tmp_path):
+    df = pd.DataFrame(
+        {
+            "date": pd.to_datetime(
+                ["2024-01-01", "2024-01-02", "2024-01-03", "2024-01-02", "2024-01-03"]
+            ),
+            "symbol": ["A", "A", "A", "B", "B"],
+            "open": [1.0, 2.0, 3.0, 10.0, 11.0],
+            "high": [1.5, 2.5, 3.5, 10.5, 11.5],
+            "low": [0.5, 1.5, 2.5, 9.5, 10.5],
+            "close": [1.2, 2.2, 3.2, 10.2, 11.2],
+            "volume": [100.0, 200.0, 300.0, 400.0, 500.0],
+        }
+    )
+
+    panel = PricePanel.from_long(df)
+
+    assert panel.shape == (3, 2)
+    assert not panel.mask[0, 1]
+    assert np.isnan(panel["close"][0, 1])
+
+    opened = PricePanel.open(panel.save(tmp_path / "panel"))
+
+    assert isinstance(opened["close"], np.memmap)
+    pd.testing.assert_frame_equal(opened.to_long(), df)
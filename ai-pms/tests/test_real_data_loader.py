@@ -0,0 +1,39 @@
+import pandas as pd
+
+from backtest.engines import real_data_loader
+from backtest.engines.parquet_spine import ParquetSpine
+from backtest.engines.price_cache import PriceCache
+
+
+def _csv(path, dates):
+    pd.DataFrame(
+        {"Date": dates, "Open": 1.0, "High": 1.0, "Low": 1.0, "Close": 1.0, "Volume": 10}
+    ).to_csv(path, index=False)
+
+
+def test_append_keeps_flat_file_in_sync_and_retries_broken_files(tmp_path, monkeypatch):
+    raw, processed = tmp_path / "raw", tmp_path / "processed"
+    raw.mkdir()
+
+    monkeypatch.setattr(real_data_loader, "RAW_DIR", raw)
+    monkeypatch.setattr(real_data_loader, "PROCESSED_DIR", processed)
+    monkeypatch.setattr(real_data_loader, "OUTPUT_FILE", processed / "flat.parquet")
+    monkeypatch.setattr(real_data_loader, "SPINE_DIR", processed / "spine")
+    monkeypatch.setattr(real_data_loader, "PriceCache", lambda ns: PriceCache(ns, cache_dir=tmp_path / "cache"))
+
+    _csv(raw / "aaa.csv", ["2024-01-01", "2024-01-02"])
+    spine = ParquetSpine(processed / "spine")
+    spine.rebuild(real_data_loader.load_all_data())
+    spine.mark_sources(sorted(raw.glob("*.csv")))
+
+    _csv(raw / "aaa.csv", ["2024-01-01", "2024-01-02", "2024-01-03"])
+    (raw / "bbb.csv").write_text("not,a,price,file\n")
+
+    assert real_data_loader.append_new_data() == 1
+
+    flat = pd.read_parquet(processed / "flat.parquet")
+    pd.testing.assert_frame_equal(flat, ParquetSpine(processed / "spine").read()[list(flat.columns)])
+    assert flat["date"].max() == pd.Timestamp("2024-01-03")
+
+    # the broken file was not marked as ingested → next append retries it
+    assert [f.name for f in ParquetSpine(processed / "spine").changed_sources(sorted(raw.glob("*.csv")))] == ["bbb.csv"]
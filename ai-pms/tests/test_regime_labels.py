@@ -0,0 +1,33 @@
+import numpy as np
+import pandas as pd
+
+from src.regime_labels import hysteresis, min_dwell, quantile_regimes, week_start, weekly_confirmed
+
+
+def test_quantile_regimes_match_row_loop():
+    rng = np.random.default_rng(0)
+    vol = pd.Series(rng.uniform(0, 1, 500))
+    vol[:3] = np.nan
+
+    q = vol.quantile([0.33, 0.66]).values
+    expected = [0 if v <= q[0] else 1 if v <= q[1] else 2 for v in vol]
+
+    assert (quantile_regimes(vol).argmax(axis=1) == expected).all()
+
+
+def test_weekly_confirmed_matches_period_start_time():
+    dates = pd.Series(pd.to_datetime(["2024-03-10 15:00", "2024-03-11 00:00", "2024-03-17 00:00", "2024-03-18 09:15"]))
+    assert (week_start(dates) == dates.dt.to_period("W").apply(lambda r: r.start_time)).all()
+
+    probs = pd.DataFrame({"date": dates, "regime_0": [0.9, 0.2, 0.3, 0.6], "regime_1": [0.1, 0.8, 0.7, 0.4]})
+    weekly = weekly_confirmed(probs)
+
+    assert list(weekly["date"]) == list(pd.to_datetime(["2024-03-04", "2024-03-11", "2024-03-18"]))
+    assert list(weekly["confirmed_regime"]) == ["regime_0", "regime_1", "regime_0"]
+
+
+def test_smoothing_options():
+    assert list(min_dwell([0, 0, 0, 1, 0, 0, 2, 2, 1, 1, 1], 2)) == [0, 0, 0, 0, 0, 0, 2, 2, 1, 1, 1]
+
+    probs = np.array([[0.9, 0.1], [0.55, 0.45], [0.45, 0.55], [0.3, 0.7], [0.5, 0.5]])
+    assert list(hysteresis(probs, 0.6)) == [0, 0, 0, 1, 1]
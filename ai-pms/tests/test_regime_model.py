@@ -1,5 +1,6 @@
 import pandas as pd
 import numpy as np
+import pytest
 
 from src.regime_model import RegimeDetector
 
@@ -24,3 +25,99 @@ def test_regime_detection_runs():
 
     assert not weekly.empty
     assert "confirmed_regime" in weekly.columns
+
+
+def test_online_update_matches_full_filter_and_flags_drift(tmp_path):
+    rng = np.random.default_rng(0)
+    n = 600
+
+    df = pd.DataFrame(
+        {
+            "date": pd.date_range("2024-01-01", periods=n),
+            "ret_1d": rng.normal(0, 1, n),
+            "vol_20d": np.r_[rng.uniform(0.5, 1, 300), rng.uniform(2, 3, 300)],
+            "mom_20_60": rng.normal(0, 5, n),
+        }
+    )
+
+    detector = RegimeDetector(n_states=3, refit_every_days=1000)
+    detector.fit(df.iloc[:500])
+    assert not detector.fallback_mode
+
+    # the forward filter reproduces hmmlearn's likelihood
+    X = df.iloc[:500][RegimeDetector.FEATURES].values
+    assert np.isclose(detector.filter(X)[1].sum(), detector.model.score(X))
+
+    detector.save(tmp_path / "regime.pkl")
+    detector = RegimeDetector.load(tmp_path / "regime.pkl")
+
+    # two online steps == one filter pass over the full history
+    online = pd.concat([detector.update(df.iloc[500:550]), detector.update(df.iloc[550:])])
+    full, _ = detector.filter(df[RegimeDetector.FEATURES].values)
+
+    assert np.allclose(online.filter(like="regime_").values, full[500:])
+    assert detector.needs_refit() is None
+    assert detector.needs_refit("2030-01-01") == "scheduled"
+
+    shocked = df.iloc[500:].assign(ret_1d=lambda d: d["ret_1d"] * 8)
+    detector.update(shocked)
+    assert detector.needs_refit().startswith("log-likelihood drift")
+
+
+def test_multi_restart_fit_selects_best_and_records_diagnostics():
+    rng = np.random.default_rng(0)
+    n = 400
+
+    df = pd.DataFrame(
+        {
+            "date": pd.date_range("2024-01-01", periods=n),
+            "ret_1d": rng.normal(0, 1, n),
+            "vol_20d": np.r_[rng.uniform(0.5, 1, 200), rng.uniform(2, 3, 200)],
+            "mom_20_60": rng.normal(0, 5, n),
+        }
+    )
+
+    detector = RegimeDetector(restarts=3, state_counts=[2, 3], criterion="bic", workers=2)
+    detector.fit(df)
+
+    diag = detector.restart_diagnostics
+    assert len(diag) == 6 and diag["selected"].sum() == 1
+
+    best = diag[diag["selected"]].iloc[0]
+    assert best["bic"] == diag.loc[diag["valid"], "bic"].min()
+    assert detector.n_states == best["n_states"]
+
+    probs = detector.predict_daily_probabilities(df)
+    assert probs.filter(like="regime_").shape[1] == detector.n_states
+
+
+def test_state_counts_are_never_compared_by_loglik():
+    # loglik grows with k → across state counts bic is the default, loglik is refused
+    assert RegimeDetector(state_counts=[2, 3]).criterion == "bic"
+    assert RegimeDetector(state_counts=[3]).criterion == "loglik"
+
+    with pytest.raises(ValueError, match="bic"):
+        RegimeDetector(state_counts=[2, 3], criterion="loglik")
+
+
+def test_persisted_history_and_online_rows_are_one_filtered_series():
+    rng = np.random.default_rng(1)
+    n = 400
+
+    df = pd.DataFrame(
+        {
+            "date": pd.date_range("2024-01-01", periods=n),
+            "ret_1d": rng.normal(0, 1, n),
+            "vol_20d": np.r_[rng.uniform(0.5, 1, 200), rng.uniform(2, 3, 200)],
+            "mom_20_60": rng.normal(0, 5, n),
+        }
+    )
+
+    detector = RegimeDetector(n_states=2)
+    detector.fit(df.iloc[:300])
+
+    history = detector.predict_daily_probabilities(df.iloc[:300], filtered=True)
+    online = pd.concat([history, detector.update(df.iloc[300:])], ignore_index=True)
+
+    # same labels an online run and a refit-then-filter would give
+    pd.testing.assert_frame_equal(online, detector.predict_daily_probabilities(df, filtered=True))
@@ -0,0 +1,60 @@
+import numpy as np
+import pandas as pd
+
+from src.alpha_model import AlphaModel
+from src.retrain import RetrainPolicy, compare_modes, retrain
+
+
+def _features(n_days=120, seed=0):
+    rng = np.random.default_rng(seed)
+    dates = pd.date_range("2024-01-01", periods=n_days)
+    return pd.DataFrame(
+        {
+            "date": dates.tolist() * 2,
+            "symbol": ["A"] * n_days + ["B"] * n_days,
+            "ret_1d": rng.normal(0, 0.01, 2 * n_days),
+            "ret_20d": rng.normal(0, 0.05, 2 * n_days),
+        }
+    )
+
+
+def test_policy_chooses_incremental_then_full():
+    df = _features()
+    model = AlphaModel(params={"n_estimators": 10})
+
+    assert retrain(model, df[df["date"] < "2024-04-01"])["reason"] == "no previous model"
+
+    # noise data → loose degrade check so only the schedule/budget rules apply
+    report = retrain(model, df, RetrainPolicy(full_every_days=60, extra_trees=5, degrade_tolerance=10))
+    assert report["mode"] == "incremental"
+    assert report["trees"] == 15
+    assert report["oos_rmse_prev"] is not None
+
+    # booster would grow past the budget → full refit
+    report = retrain(model, df, RetrainPolicy(full_every_days=60, max_trees=18, extra_trees=5, degrade_tolerance=10))
+    assert (report["mode"], report["reason"]) == ("full", "tree budget")
+    assert model.n_trees() == 10
+
+
+def test_compare_modes_scores_both_paths():
+    out = compare_modes(_features(), new_days=5, holdout_days=20, params={"n_estimators": 10})
+
+    assert list(out.index) == ["full", "incremental"]
+    assert out.loc["incremental", "trees"] > out.loc["full", "trees"]
+    assert out["holdout_rmse"].notna().all()
+
+
+def test_saved_model_with_other_params_gets_full_refit(tmp_path):
+    df = _features()
+
+    old = AlphaModel(params={"n_estimators": 10}, horizon=5)
+    old.fit(df[df["date"] < "2024-04-01"])
+    old.save(tmp_path / "alpha_model.pkl")
+
+    # promoted params / horizon changed since yesterday's booster
+    model = AlphaModel(params={"n_estimators": 12}, horizon=3)
+    model.load(tmp_path / "alpha_model.pkl")
+
+    report = retrain(model, df, RetrainPolicy(full_every_days=60, degrade_tolerance=10))
+    assert (report["mode"], report["reason"]) == ("full", "params / horizon changed")
+    assert model.n_trees() == 12 and model.trained_spec == model.spec()
@@ -0,0 +1,44 @@
+import pandas as pd
+
+from backtest.engines.schema_profile import SchemaRegistry, read_profiled
+
+
+FLAT = (
+    "Date,Close,High,Low,Open,Volume,Ticker\n"
+    "2024-01-01,10.5,11,10,10.2,1000,AAA\n"
+    "2024-01-02,10.7,11.2,10.1,10.5,1200,AAA\n"
+)
+
+MULTI = (
+    "Price,Close,High,Low,Open,Volume\n"
+    "Ticker,BBB.NS,BBB.NS,BBB.NS,BBB.NS,BBB.NS\n"
+    "Date,,,,,\n"
+    "2024-01-01,20.5,21,20,20.2,2000\n"
+    "2024-01-02,20.7,21.2,20.1,20.5,2200\n"
+)
+
+
+def test_schema_profiles_cached_and_read(tmp_path):
+    (tmp_path / "AAA.csv").write_text(FLAT)
+    (tmp_path / "BBB.csv").write_text(MULTI)
+    files = sorted(tmp_path.glob("*.csv"))
+    manifest = tmp_path / "schema_manifest.json"
+
+    profiles = SchemaRegistry(manifest).resolve(files)
+
+    assert profiles["AAA.csv"]["source_format"] == "yahoo_flat"
+    assert profiles["BBB.csv"]["source_format"] == "yahoo_multiindex"
+    assert profiles["BBB.csv"]["date_format"] == "%Y-%m-%d"
+
+    df = read_profiled(tmp_path / "BBB.csv", profiles["BBB.csv"])
+    assert list(df.columns) == ["date", "open", "high", "low", "close", "volume"]
+    assert df["date"].tolist() == list(pd.to_datetime(["2024-01-01", "2024-01-02"]))
+    assert df["close"].tolist() == [20.5, 20.7]
+
+    registry = SchemaRegistry(manifest)
+    registry.resolve(files)
+    assert registry.last_probed == []
+
+    (tmp_path / "AAA.csv").write_text(FLAT.replace("Volume", "Vol"))
+    registry.resolve(files)
+    assert registry.last_probed == ["AAA.csv"]
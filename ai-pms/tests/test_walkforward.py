@@ -0,0 +1,64 @@
+import os
+
+import numpy as np
+import pandas as pd
+from threadpoolctl import threadpool_info
+
+from src.walkforward import THREAD_ENV, WalkForwardEngine
+
+
+def _features():
+    rng = np.random.default_rng(7)
+    dates = pd.bdate_range("2023-01-02", periods=160)
+    n = len(dates)
+
+    return pd.DataFrame(
+        {
+            "date": np.tile(dates, 3),
+            "symbol": np.repeat(["A", "B", "C"], n),
+            "ret_1d": rng.normal(0, 0.01, 3 * n),
+            "ret_20d": rng.normal(0, 0.05, 3 * n),
+            "vol_20d": rng.uniform(0.01, 0.03, 3 * n),
+        }
+    )
+
+
+def test_walkforward_purges_and_matches_sequential():
+    kwargs = dict(
+        window="rolling",
+        train_days=60,
+        retrain_every="M",
+        horizon=5,
+        embargo_days=2,
+        min_train_rows=50,
+        model_params={"n_estimators": 10},
+    )
+
+    parallel = WalkForwardEngine(workers=2, threads_per_worker=1, **kwargs).run(_features(), save=False)
+    sequential = WalkForwardEngine(workers=1, **kwargs).run(_features(), save=False)
+
+    pd.testing.assert_frame_equal(parallel, sequential)
+
+    dates = pd.DatetimeIndex(sorted(_features()["date"].unique()))
+    gap = dates.searchsorted(parallel["test_start"]) - dates.searchsorted(parallel["train_end"])
+    assert (gap >= 5 + 2 + 1).all()
+
+    assert (parallel["date"] >= parallel["test_start"]).all()
+    assert (parallel["train_start"] >= dates[0]).all()
+    assert not parallel.duplicated(["date", "symbol"]).any()
+
+
+def test_sequential_run_restores_thread_limits(monkeypatch):
+    monkeypatch.setenv("OMP_NUM_THREADS", "3")
+    monkeypatch.delenv("MKL_NUM_THREADS", raising=False)
+
+    env = {var: os.environ.get(var) for var in THREAD_ENV}
+    pools = [p["num_threads"] for p in threadpool_info()]
+
+    WalkForwardEngine(
+        train_days=60, retrain_every="M", min_train_rows=50, workers=1, threads_per_worker=1,
+        model_params={"n_estimators": 5},
+    ).run(_features(), save=False)
+
+    assert {var: os.environ.get(var) for var in THREAD_ENV} == env
+    assert [p["num_threads"] for p in threadpool_info()] == pools